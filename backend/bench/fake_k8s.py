@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# Kubernetes API 대역 객체 (스케일 반응 기록기 재현, 상태 동기화/멤버십 테스트용)
+# - FakeDeploymentClient: read_namespaced_deployment()만 흉내 내는 AppsV1Api 대역
+# - FakeClock: 재현 스크립트가 직접 진행시키는 가상 시계
+# - HPAModel: 전환 시각과 HPA/파드 기동 파라미터로 레플리카 수 변화를 만들어 내는 단순 모델
+# - FakeConfigMapClient / FakeWatch: ConfigMap 읽기/쓰기(resourceVersion 선행 조건)와 watch 스트림 대역
+# - FakeLeaseClient: 멤버십 Lease 대역 (CoordinationV1Api)
+#
+# 사용 예 (scale_replay.py 참고):
+#   clock = FakeClock(); api = FakeDeploymentClient(replicas=2)
+#   recorder = app.ScaleTimelineRecorder(app.transition_demand, api=api, clock=clock)
+import copy
+import math
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+
+class FakeApiException(Exception):
+    """kubernetes ApiException 대역 (status만 사용)"""
+    def __init__(self, status, reason=''):
+        super().__init__(f"({status}) {reason}".strip())
+        self.status = status
+        self.reason = reason
+
+
+class WatchExhausted(BaseException):
+    """FakeWatch에 준비한 이벤트를 모두 돌려준 뒤 watch 루프를 끝내기 위한 신호
+
+    watch 루프는 Exception을 잡아 재연결하므로 BaseException으로 빠져나온다.
+    """
+
+
+# kubernetes.client 모듈 대역 - ConfigMap 생성에 쓰는 모델 클래스만 제공
+fake_client_module = SimpleNamespace(
+    V1ConfigMap=lambda metadata=None, data=None: SimpleNamespace(metadata=metadata, data=data),
+    V1ObjectMeta=lambda name=None, resource_version=None: SimpleNamespace(name=name, resource_version=resource_version)
+)
+
+
+class FakeClock:
+    """호출 가능한 가상 시계 (epoch 초)"""
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+        return self.now
+
+
+class FakeDeploymentClient:
+    """AppsV1Api.read_namespaced_deployment 대역 - spec.replicas / status.replicas / status.ready_replicas만 제공"""
+    def __init__(self, replicas=1, name='backend-deployment', namespace='default'):
+        self.name = name
+        self.namespace = namespace
+        self.desired = replicas
+        self.current = replicas
+        self.ready = replicas
+        self.reads = 0
+
+    def set(self, desired=None, current=None, ready=None):
+        if desired is not None:
+            self.desired = desired
+        if current is not None:
+            self.current = current
+        if ready is not None:
+            self.ready = ready
+
+    def read_namespaced_deployment(self, name, namespace):
+        self.reads += 1
+        return SimpleNamespace(
+            metadata=SimpleNamespace(name=name, namespace=namespace),
+            spec=SimpleNamespace(replicas=self.desired),
+            status=SimpleNamespace(replicas=self.current, ready_replicas=self.ready)
+        )
+
+
+class HPAModel:
+    """전환 이후 HPA와 ReplicaSet의 반응을 시간 함수로 근사
+
+    - 부하 변화는 metrics_delay 후에 메트릭으로 보이고, HPA는 sync_period 경계에서만 판단한다.
+    - 확장: 판단 즉시 desired/current가 목표로 바뀌고, 새 파드는 pod_startup + 순번*pod_stagger 후 Ready.
+    - 축소: 메트릭 반영 후 stabilization_down 창이 지난 다음 sync에서 판단, Ready는 즉시 줄고
+      current는 termination_grace 후에 줄어든다.
+    """
+    def __init__(self, sync_period=15.0, metrics_delay=30.0, pod_startup=20.0, pod_stagger=2.0,
+                 stabilization_down=300.0, termination_grace=30.0):
+        self.sync_period = sync_period
+        self.metrics_delay = metrics_delay
+        self.pod_startup = pod_startup
+        self.pod_stagger = pod_stagger
+        self.stabilization_down = stabilization_down
+        self.termination_grace = termination_grace
+
+    def _next_sync(self, elapsed):
+        return math.ceil(elapsed / self.sync_period) * self.sync_period
+
+    def decision_time(self, direction):
+        """전환 후 HPA가 레플리카 수를 바꾸는 시각(초)"""
+        delay = self.metrics_delay + (self.stabilization_down if direction == 'down' else 0.0)
+        return self._next_sync(delay)
+
+    def counts(self, direction, before, after, elapsed):
+        """전환 후 elapsed초 시점의 (desired, current, ready)"""
+        decided = self.decision_time(direction)
+        if elapsed < decided:
+            return before, before, before
+        since = elapsed - decided
+        if direction == 'up':
+            ready = before + sum(
+                1 for index in range(after - before)
+                if since >= self.pod_startup + index * self.pod_stagger
+            )
+            return after, after, ready
+        current = after if since >= self.termination_grace else before
+        return after, current, after
+
+
+class FakeConfigMapClient:
+    """CoreV1Api의 ConfigMap 메서드 대역
+
+    replace는 body의 resourceVersion이 저장된 값과 다르면 409를 낸다.
+    interleave에 넣은 함수는 replace 직전에 하나씩 실행되어 다른 레플리카의 끼어든 기록을 흉내 낸다.
+    """
+    def __init__(self, error=FakeApiException):
+        self.error = error
+        self.maps = {}          # name -> SimpleNamespace(metadata, data)
+        self.interleave = []
+        self.reads = 0
+        self.writes = 0
+        self._version = 0
+
+    def _store(self, name, data):
+        self._version += 1
+        self.maps[name] = SimpleNamespace(
+            metadata=SimpleNamespace(name=name, resource_version=str(self._version)),
+            data=dict(data)
+        )
+        return copy.deepcopy(self.maps[name])
+
+    def put(self, name, data):
+        """다른 레플리카가 기록한 것처럼 저장 (resourceVersion 증가)"""
+        return self._store(name, data)
+
+    def read_namespaced_config_map(self, name, namespace):
+        self.reads += 1
+        if name not in self.maps:
+            raise self.error(404, 'Not Found')
+        return copy.deepcopy(self.maps[name])
+
+    def create_namespaced_config_map(self, namespace, body):
+        name = body.metadata.name
+        if name in self.maps:
+            raise self.error(409, 'AlreadyExists')
+        self.writes += 1
+        return self._store(name, body.data or {})
+
+    def replace_namespaced_config_map(self, name, namespace, body):
+        if self.interleave:
+            self.interleave.pop(0)()
+        current = self.maps.get(name)
+        if current is None:
+            raise self.error(404, 'Not Found')
+        if body.metadata.resource_version != current.metadata.resource_version:
+            raise self.error(409, 'Conflict')
+        self.writes += 1
+        return self._store(name, body.data or {})
+
+    def list_namespaced_config_map(self, namespace, **kwargs):
+        return SimpleNamespace(items=list(self.maps.values()))
+
+
+class FakeWatch:
+    """kubernetes.watch 모듈 대역 - Watch().stream() 호출마다 준비한 이벤트 묶음을 하나씩 돌려줌
+
+    묶음을 다 쓰면 WatchExhausted를 던진다. 각 stream 호출의 인자는 calls에 남는다.
+    """
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = []
+
+    def Watch(self):
+        return self
+
+    def stream(self, func, *args, **kwargs):
+        self.calls.append(kwargs)
+        if not self.batches:
+            raise WatchExhausted()
+        return iter(self.batches.pop(0))
+
+
+def _parse_micro_time(value):
+    """Lease의 MicroTime 문자열 → datetime (kubernetes 클라이언트가 역직렬화한 값과 같은 형태)"""
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
+
+
+class FakeLeaseClient:
+    """CoordinationV1Api의 Lease 메서드 대역 (spec 필드는 kubernetes 모델처럼 snake_case 속성으로 노출)"""
+    def __init__(self, error=FakeApiException):
+        self.error = error
+        self.leases = {}     # name -> SimpleNamespace(metadata, spec)
+        self.deleted = []
+
+    def add(self, name, holder, renew_time, acquire_time=None, duration=15):
+        """다른 레플리카의 Lease 등록"""
+        self.leases[name] = SimpleNamespace(
+            metadata=SimpleNamespace(name=name),
+            spec=SimpleNamespace(holder_identity=holder, renew_time=renew_time,
+                                 acquire_time=acquire_time or renew_time, lease_duration_seconds=duration)
+        )
+
+    def patch_namespaced_lease(self, name, namespace, body):
+        lease = self.leases.get(name)
+        if lease is None:
+            raise self.error(404, 'Not Found')
+        lease.spec.renew_time = _parse_micro_time(body['spec']['renewTime'])
+        return lease
+
+    def create_namespaced_lease(self, namespace, body):
+        spec = body['spec']
+        self.add(body['metadata']['name'], spec['holderIdentity'], _parse_micro_time(spec['renewTime']),
+                 acquire_time=_parse_micro_time(spec['acquireTime']), duration=spec['leaseDurationSeconds'])
+        self.leases[body['metadata']['name']].metadata.labels = body['metadata']['labels']
+        return self.leases[body['metadata']['name']]
+
+    def list_namespaced_lease(self, namespace, label_selector=None):
+        return SimpleNamespace(items=list(self.leases.values()))
+
+    def delete_namespaced_lease(self, name, namespace):
+        if self.leases.pop(name, None) is None:
+            raise self.error(404, 'Not Found')
+        self.deleted.append(name)
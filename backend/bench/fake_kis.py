@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# KIS Open API 대역 서버 (벤치마크/로컬 개발용)
+# - POST /oauth2/tokenP: 접근 토큰 발급
+# - GET  /uapi/domestic-stock/v1/quotations/inquire-price: 현재가 조회
+# 응답 지연, 오류율, 초당 호출 한도(EGW00201)를 설정할 수 있다.
+#
+# 단독 실행: python backend/bench/fake_kis.py --port 9443 --latency-ms 20 --error-rate 0.01 --rate-limit 20
+# 백엔드 연결: KIS_BASE_URL=http://localhost:9443
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+TOKEN_PATH = '/oauth2/tokenP'
+PRICE_PATH = '/uapi/domestic-stock/v1/quotations/inquire-price'
+TOKEN_LIFETIME = 86400
+
+BASE_PRICES = {
+    '005380': 250000.0, '000270': 100000.0, '005930': 75000.0, '000660': 130000.0,
+    '373220': 400000.0, '035420': 180000.0, '012450': 300000.0, '034020': 20000.0,
+    '105560': 80000.0, '042660': 30000.0, '032830': 90000.0, '035720': 45000.0
+}
+
+
+class FakeKISConfig:
+    """대역 서버 동작 설정 (실행 중 변경 가능)"""
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, rate_limit=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit      # 초당 허용 호출 수 (0이면 제한 없음)
+        self.random = random.Random(seed)
+
+    def to_dict(self):
+        return {
+            'latency_ms': self.latency_ms,
+            'jitter_ms': self.jitter_ms,
+            'error_rate': self.error_rate,
+            'rate_limit': self.rate_limit
+        }
+
+
+class FakeKISServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128   # 동시 연결이 몰려도 SYN 재전송(1초) 지연이 생기지 않도록
+
+    def __init__(self, address, config):
+        super().__init__(address, FakeKISHandler)
+        self.config = config
+        self.stats = {'token': 0, 'price': 0, 'errors': 0, 'rate_limited': 0}
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    def count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def over_rate_limit(self):
+        """1초 고정 윈도우 기준 호출 한도 초과 여부"""
+        if self.config.rate_limit <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count > self.config.rate_limit
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class FakeKISHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True   # 헤더/본문 분할 전송 시 delayed ACK 대기 방지
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _delay(self):
+        config = self.server.config
+        delay_ms = config.latency_ms + config.random.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def _injected_failure(self):
+        """설정된 한도/오류율에 따라 실패 응답을 보냈으면 True"""
+        if self.server.over_rate_limit():
+            self.server.count('rate_limited')
+            self._send_json(500, {'rt_cd': '1', 'msg_cd': 'EGW00201', 'msg1': '초당 거래건수를 초과하였습니다.'})
+            return True
+        if self.server.config.random.random() < self.server.config.error_rate:
+            self.server.count('errors')
+            self._send_json(500, {'rt_cd': '1', 'msg_cd': 'EGW00500', 'msg1': '일시적인 오류가 발생했습니다.'})
+            return True
+        return False
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', '0'))
+        if length:
+            self.rfile.read(length)
+        if urlsplit(self.path).path != TOKEN_PATH:
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        self._delay()
+        self.server.count('token')
+        expires_at = datetime.now() + timedelta(seconds=TOKEN_LIFETIME)
+        self._send_json(200, {
+            'access_token': f"fake-token-{int(time.time() * 1000)}",
+            'token_type': 'Bearer',
+            'expires_in': TOKEN_LIFETIME,
+            'access_token_token_expired': expires_at.strftime('%Y-%m-%d %H:%M:%S')
+        })
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path != PRICE_PATH:
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        self._delay()
+        if self._injected_failure():
+            return
+
+        self.server.count('price')
+        symbol = parse_qs(parts.query).get('fid_input_iscd', [''])[0]
+        base_price = BASE_PRICES.get(symbol, 50000.0)
+        price = int(base_price * self.server.config.random.uniform(0.98, 1.02))
+        self._send_json(200, {
+            'rt_cd': '0',
+            'msg_cd': 'MCA00000',
+            'msg1': '정상처리 되었습니다.',
+            'output': {'stck_prpr': str(price), 'stck_shrn_iscd': symbol}
+        })
+
+
+def start_fake_kis(config=None, host='127.0.0.1', port=0):
+    """백그라운드 스레드에서 대역 서버 시작 (port=0이면 임의 포트)"""
+    server = FakeKISServer((host, port), config or FakeKISConfig())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='local stand-in for the KIS Open API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9443)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='초당 허용 호출 수 (0이면 제한 없음)')
+    args = parser.parse_args()
+
+    fake = FakeKISServer((args.host, args.port), FakeKISConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate_limit=args.rate_limit
+    ))
+    print(f"KIS 대역 서버 시작: {fake.base_url}")
+    try:
+        fake.serve_forever()
+    except KeyboardInterrupt:
+        pass
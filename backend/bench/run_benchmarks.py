@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# 백엔드 핫패스 마이크로벤치마크
+# - KIS API 대신 로컬 대역 서버(fake_kis.py)를 띄워 네트워크 없이 실행
+# - 결과를 커밋별 JSON으로 저장하고, --compare로 이전 결과와 비교해 회귀를 표시
+#
+# 사용 예:
+#   python backend/bench/run_benchmarks.py                          # results/<commit>.json 저장
+#   python backend/bench/run_benchmarks.py --compare backend/bench/results/abc1234.json
+#   python backend/bench/run_benchmarks.py --kis-latency-ms 20 --kis-error-rate 0.05
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), 'src')
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+sys.path.insert(0, BENCH_DIR)
+from fake_kis import FakeKISConfig, start_fake_kis  # noqa: E402
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _configure_environment(kis_base_url):
+    """app import 전에 벤치마크용 환경 구성 (백그라운드 스레드 비활성화, 캐시/호출 한도 해제)"""
+    os.environ.update({
+        'KIS_BASE_URL': kis_base_url,
+        'KIS_APP_KEY': 'bench-app-key',
+        'KIS_APP_SECRET': 'bench-app-secret',
+        'KIS_TOKEN_STORE': 'off',
+        'KIS_HTTP_RETRIES': '0',
+        'KIS_RATE_LIMIT': '1000000',
+        'KIS_RATE_LIMIT_BURST': '1000000',
+        'QUOTE_CACHE_TTL': '0',
+        'QUOTE_CACHE_STALE_TTL': '0',
+        'QUOTE_POLL_ENABLED': 'false',
+        'BACKEND_DEFER_BACKGROUND_START': 'true'
+    })
+    os.environ.pop('PROMETHEUS_MULTIPROC_DIR', None)
+    sys.path.insert(0, SRC_DIR)
+
+
+def measure(func, duration, min_iterations):
+    """duration(초) 동안 반복 실행하며 1회 소요 시간을 수집"""
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < min_iterations or time.perf_counter() - started < duration:
+        op_started = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - op_started)
+    total = sum(samples) / 1e9
+    percentiles = statistics.quantiles(samples, n=100, method='inclusive')
+    return {
+        'iterations': len(samples),
+        'ops_per_sec': round(len(samples) / total, 1) if total > 0 else 0.0,
+        'mean_us': round(statistics.fmean(samples) / 1000, 2),
+        'p50_us': round(percentiles[49] / 1000, 2),
+        'p99_us': round(percentiles[98] / 1000, 2),
+        'max_us': round(max(samples) / 1000, 2)
+    }
+
+
+def build_benchmarks(app_module):
+    """벤치마크 이름 → 실행 함수"""
+    flask_app = app_module.app
+    client = flask_app.test_client()
+    symbols = list(app_module.stock_symbols)
+
+    def stock_data_direct():
+        # 스냅샷 없음 + 캐시 TTL 0 → 매 요청마다 대역 서버로 전 종목 조회
+        app_module.quote_snapshot = None
+        client.get('/api/stock-data')
+
+    def stock_data_snapshot():
+        client.get('/api/stock-data')
+
+    counter = {'i': 0}
+
+    def price_change():
+        counter['i'] += 1
+        symbol = symbols[counter['i'] % len(symbols)]
+        app_module.calculate_price_change(symbol, 50000.0 + counter['i'] % 100)
+
+    def request_hooks():
+        with flask_app.test_request_context('/api/health'):
+            flask_app.preprocess_request()
+            flask_app.process_response(flask_app.response_class('{}'))
+
+    def request_hooks_unmatched():
+        # 존재하지 않는 경로 스캔 (매번 다른 URL)
+        counter['i'] += 1
+        with flask_app.test_request_context(f"/scan/{counter['i']}"):
+            flask_app.preprocess_request()
+            flask_app.process_response(flask_app.response_class('{}', status=404))
+
+    hook_context = flask_app.test_request_context('/api/health')
+    hook_response = flask_app.response_class('{}')
+
+    def prepare_hook_context():
+        hook_context.push()
+
+    def request_hooks_only():
+        # 요청 컨텍스트 생성 비용을 제외한 before/after/teardown 훅 자체 비용
+        for before in flask_app.before_request_funcs[None]:
+            before()
+        for after in flask_app.after_request_funcs[None]:
+            after(hook_response)
+        for teardown in flask_app.teardown_request_funcs.get(None, ()):
+            teardown(None)
+
+    def metrics_render():
+        app_module.generate_latest()
+
+    def prepare_snapshot():
+        app_module.refresh_quote_snapshot()
+
+    return [
+        ('get_stock_data.direct', stock_data_direct, None),
+        ('get_stock_data.snapshot', stock_data_snapshot, prepare_snapshot),
+        ('calculate_price_change', price_change, None),
+        ('request_hooks', request_hooks, None),
+        ('request_hooks.unmatched', request_hooks_unmatched, None),
+        ('request_hooks.only', request_hooks_only, prepare_hook_context),
+        ('metrics.generate_latest', metrics_render, None)
+    ]
+
+
+def run(args):
+    fake = start_fake_kis(FakeKISConfig(
+        latency_ms=args.kis_latency_ms,
+        jitter_ms=args.kis_jitter_ms,
+        error_rate=args.kis_error_rate,
+        rate_limit=args.kis_rate_limit,
+        seed=args.seed
+    ))
+    _configure_environment(fake.base_url)
+
+    # 앱의 디버깅 출력이 측정에 섞이지 않도록 표준 출력 차단
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        import app as app_module
+        results = {}
+        for name, func, prepare in build_benchmarks(app_module):
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            if prepare:
+                prepare()
+            for _ in range(args.warmup):
+                func()
+            results[name] = measure(func, args.duration, args.min_iterations)
+            print(f"{name}: {results[name]['ops_per_sec']} ops/s", file=sys.stderr)
+
+    fake.shutdown()
+    return {
+        'commit': _git_commit(),
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {'duration': args.duration, 'min_iterations': args.min_iterations, 'warmup': args.warmup},
+        'fake_kis': dict(fake.config.to_dict(), **{'calls': fake.stats}),
+        'benchmarks': results
+    }
+
+
+def compare(current, baseline, threshold):
+    """이전 결과 대비 처리량 감소/p50 증가가 threshold(%)를 넘는 항목을 회귀로 표시
+
+    p99는 참고용으로만 출력 (짧은 연산은 스케줄링 잡음이 커서 회귀 판단에 쓰지 않음)
+    """
+    regressions = []
+    print(f"{'benchmark':<28}{'base ops/s':>14}{'ops/s':>14}{'Δ%':>9}{'base p50':>12}{'p50':>12}{'Δ%':>9}{'p99':>12}")
+    for name, result in current['benchmarks'].items():
+        base = baseline.get('benchmarks', {}).get(name)
+        if not base:
+            print(f"{name:<28}{'-':>14}{result['ops_per_sec']:>14}{'new':>9}")
+            continue
+        ops_delta = (result['ops_per_sec'] - base['ops_per_sec']) / base['ops_per_sec'] * 100 if base['ops_per_sec'] else 0.0
+        p50_delta = (result['p50_us'] - base['p50_us']) / base['p50_us'] * 100 if base['p50_us'] else 0.0
+        flag = ''
+        if ops_delta < -threshold or p50_delta > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:<28}{base['ops_per_sec']:>14}{result['ops_per_sec']:>14}{ops_delta:>8.1f}%"
+              f"{base['p50_us']:>12}{result['p50_us']:>12}{p50_delta:>8.1f}%{result['p99_us']:>12}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='backend hot-path microbenchmarks')
+    parser.add_argument('--duration', type=float, default=2.0, help='벤치마크별 측정 시간(초)')
+    parser.add_argument('--min-iterations', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--only', nargs='*', help='이름이 이 접두어로 시작하는 벤치마크만 실행')
+    parser.add_argument('--kis-latency-ms', type=float, default=0.0)
+    parser.add_argument('--kis-jitter-ms', type=float, default=0.0)
+    parser.add_argument('--kis-error-rate', type=float, default=0.0)
+    parser.add_argument('--kis-rate-limit', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: results/<commit>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=15.0, help='회귀로 판단할 변화율(%%)')
+    args = parser.parse_args(argv)
+
+    result = run(args)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{result['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    print(f"결과 저장: {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"비교 기준: {baseline.get('commit')} ({baseline.get('created_at')})")
+        if compare(result, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
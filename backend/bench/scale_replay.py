@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# 스케일 반응 기록기(ScaleTimelineRecorder) 재현 스크립트
+# - 클러스터 없이 가짜 Deployment 클라이언트와 가상 시계로 HPA 반응을 재현하여
+#   첫 새 파드 / 축소 지연 / 안정 상태 측정값을 계산
+# - HPA behavior 튜닝 전후 값을 같은 조건에서 비교하거나, 저장한 /api/scale-timeline 응답을 다시 분석
+#
+# 사용 예:
+#   python backend/bench/scale_replay.py --check                       # 기본 모델로 측정값 검증
+#   python backend/bench/scale_replay.py --stabilization-down 120      # 축소 안정화 창 단축 효과
+#   curl -s http://<backend>/api/scale-timeline > timeline.json
+#   python backend/bench/scale_replay.py --timeline timeline.json --steady-window 90
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), 'src')
+
+sys.path.insert(0, BENCH_DIR)
+from fake_k8s import FakeClock, FakeDeploymentClient, HPAModel  # noqa: E402
+
+
+def _load_app(args):
+    """app import 전에 재현용 환경 구성 (백그라운드 스레드/외부 호출 비활성화)"""
+    os.environ.update({
+        'KIS_TOKEN_STORE': 'off',
+        'QUOTE_POLL_ENABLED': 'false',
+        'BACKEND_DEFER_BACKGROUND_START': 'true'
+    })
+    os.environ.pop('PROMETHEUS_MULTIPROC_DIR', None)
+    sys.path.insert(0, SRC_DIR)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        import app as app_module
+    return app_module
+
+
+def _new_recorder(app_module, api, clock, results, args):
+    return app_module.ScaleTimelineRecorder(
+        app_module.transition_demand, api=api, clock=clock,
+        steady_window=args.steady_window, max_seconds=args.max_seconds,
+        on_result=lambda direction, phase, seconds: results.append((direction, phase, seconds))
+    )
+
+
+def replay_model(app_module, args):
+    """off → high → off 전환을 HPA 모델로 재현하고 기록기 측정값을 반환"""
+    model = HPAModel(
+        sync_period=args.sync_period, metrics_delay=args.metrics_delay, pod_startup=args.pod_startup,
+        pod_stagger=args.pod_stagger, stabilization_down=args.stabilization_down,
+        termination_grace=args.termination_grace
+    )
+    clock = FakeClock()
+    api = FakeDeploymentClient(replicas=args.from_replicas)
+    results = []
+    recorder = _new_recorder(app_module, api, clock, results, args)
+    recorder.poll_once()
+
+    phases = [
+        ('up', ('off', 'off'), ('high', 'off'), args.from_replicas, args.to_replicas, args.hold),
+        ('down', ('high', 'off'), ('off', 'off'), args.to_replicas, args.from_replicas, args.max_seconds)
+    ]
+    for direction, previous, target, before, after, duration in phases:
+        recorder.record_transition(previous, target)
+        elapsed = 0.0
+        while elapsed < duration:
+            clock.advance(args.poll_interval)
+            elapsed += args.poll_interval
+            api.set(*model.counts(direction, before, after, elapsed))
+            recorder.poll_once()
+            if direction == 'down' and not recorder.tracking():
+                break
+
+    expected = {}
+    up_decision = model.decision_time('up')
+    last_ready = up_decision + args.pod_startup + (args.to_replicas - args.from_replicas - 1) * args.pod_stagger
+    expected[('up', 'first_new_pod')] = up_decision + args.pod_startup
+    expected[('up', 'steady_state')] = last_ready
+    down_decision = model.decision_time('down')
+    expected[('down', 'scale_down_lag')] = down_decision
+    expected[('down', 'steady_state')] = down_decision + args.termination_grace
+    return recorder, results, expected
+
+
+def replay_timeline(app_module, args):
+    """저장된 /api/scale-timeline 응답의 샘플을 다시 넣어 (다른 안정 창 등으로) 재계산"""
+    with open(args.timeline, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+
+    clock = FakeClock()
+    results = []
+    recorders = []
+    for saved_transition in reversed(saved.get('transitions', [])):
+        samples = saved_transition.get('samples') or []
+        baseline = saved_transition.get('baseline') or (samples[0] if samples else None)
+        if baseline is None:
+            continue
+        api = FakeDeploymentClient()
+        api.set(baseline['desired'], baseline['current'], baseline['ready'])
+        recorder = _new_recorder(app_module, api, clock, results, args)
+        recorder.poll_once()
+        started = clock()
+        recorder.record_transition(
+            (saved_transition['from']['traffic_level'], saved_transition['from']['memory_level']),
+            (saved_transition['to']['traffic_level'], saved_transition['to']['memory_level'])
+        )
+        for sample in samples:
+            clock.now = started + sample['elapsed_seconds']
+            api.set(sample['desired'], sample['current'], sample['ready'])
+            recorder.poll_once()
+        # 마지막 변화 이후 안정 창이 지나도록 관측을 이어 감
+        while recorder.tracking():
+            clock.advance(args.poll_interval)
+            recorder.poll_once()
+        recorders.append(recorder)
+        clock.advance(args.max_seconds)
+    return recorders, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='replay HPA reactions through the scale timeline recorder')
+    parser.add_argument('--timeline', help='저장한 /api/scale-timeline JSON (없으면 HPA 모델로 재현)')
+    parser.add_argument('--poll-interval', type=float, default=3.0, help='기록기 조회 주기(초)')
+    parser.add_argument('--steady-window', type=float, default=60.0)
+    parser.add_argument('--max-seconds', type=float, default=900.0)
+    parser.add_argument('--from-replicas', type=int, default=2)
+    parser.add_argument('--to-replicas', type=int, default=6)
+    parser.add_argument('--hold', type=float, default=600.0, help='확장 전환 후 축소 전환까지(초)')
+    parser.add_argument('--sync-period', type=float, default=15.0, help='HPA --horizontal-pod-autoscaler-sync-period')
+    parser.add_argument('--metrics-delay', type=float, default=30.0, help='부하가 메트릭에 반영되기까지(초)')
+    parser.add_argument('--pod-startup', type=float, default=20.0, help='새 파드가 Ready가 되기까지(초)')
+    parser.add_argument('--pod-stagger', type=float, default=2.0, help='새 파드 간 Ready 간격(초)')
+    parser.add_argument('--stabilization-down', type=float, default=300.0, help='behavior.scaleDown.stabilizationWindowSeconds')
+    parser.add_argument('--termination-grace', type=float, default=30.0)
+    parser.add_argument('--check', action='store_true', help='모델 기대값과 측정값을 비교 (조회 주기 이내 오차 허용)')
+    parser.add_argument('--output', help='재현 타임라인 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    app_module = _load_app(args)
+    if args.timeline:
+        recorders, results = replay_timeline(app_module, args)
+        timelines = [recorder.timeline() for recorder in recorders]
+        expected = {}
+    else:
+        recorder, results, expected = replay_model(app_module, args)
+        timelines = [recorder.timeline()]
+
+    failures = []
+    print(f"{'direction':<10}{'phase':<16}{'seconds':>10}{'expected':>10}")
+    for direction, phase, seconds in results:
+        want = expected.get((direction, phase))
+        flag = ''
+        if want is not None and not want <= seconds < want + args.poll_interval:
+            flag = '  MISMATCH'
+            failures.append((direction, phase))
+        print(f"{direction:<10}{phase:<16}{seconds:>10.1f}{want if want is not None else '-':>10}{flag}")
+    if args.check:
+        missing = sorted(set(expected) - {(direction, phase) for direction, phase, _ in results})
+        for direction, phase in missing:
+            print(f"{direction:<10}{phase:<16}{'-':>10}{expected[(direction, phase)]:>10}  MISSING")
+        failures.extend(missing)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(timelines, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"타임라인 저장: {args.output}", file=sys.stderr)
+
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,85 +1,177 @@
 # 주식 모니터링 백엔드 API
 # 한국투자증권 KIS API를 사용한  Flask 서버
-from flask import Flask, request, jsonify, g, Response
+from flask import Flask, request, jsonify, g, Response, stream_with_context
 import socket
 import time
 import threading
 import random
 import requests
 import os
+import json
+import fcntl
+import itertools
+import base64
+import contextlib
+import gzip
+import hashlib
+import math
+import statistics
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from types import MappingProxyType
 from datetime import datetime, timedelta
-from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import kube
+import sim_state
+from kis_resilience import (
+    PRIORITY_BULK, PRIORITY_INTERACTIVE, CircuitBreaker, QuoteCache, TokenBucketRateLimiter
+)
+from load_engine import MAX_ENGINE_MILLICORES, LoadEngine, MemoryBallast
+from membership import ReplicaMembership
+from scale_timeline import ScaleTimelineRecorder
+from scenarios import SCENARIO_PRESETS, ScenarioLimits, ScenarioRunner, TrafficScenario, scenario_start_time
+from prometheus_client import (
+    REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess, CONTENT_TYPE_LATEST
+)
+from prometheus_client.metrics_core import Metric
+
 
+# kubernetes 클라이언트는 import 비용이 커서 백그라운드 기동 단계에서 처음 필요할 때 불러옴 (kube.py)
+k8s_client = None
+k8s_config = None
+k8s_watch = None
+ApiException = kube.ApiException
+ConfigException = kube.ConfigException
 
-try:
-    from kubernetes import client as k8s_client, config as k8s_config
-    from kubernetes.client.rest import ApiException
-    from kubernetes.config.config_exception import ConfigException
-except Exception:  # kubernetes 패키지가 없거나 외부 환경에서 실행되는 경우
-    k8s_client = None
-    k8s_config = None
-    ApiException = None
-    ConfigException = Exception
+
+def _load_kubernetes():
+    """kubernetes 클라이언트 import (패키지가 없으면 False)"""
+    global k8s_client, k8s_config, k8s_watch, ApiException, ConfigException
+    if not kube.load():
+        return False
+    k8s_client, k8s_config, k8s_watch = kube.client, kube.config, kube.watch
+    ApiException, ConfigException = kube.ApiException, kube.ConfigException
+    return True
 
 app = Flask(__name__)
 
+def _parse_request_start(header):
+    """X-Request-Start 헤더(t=초/밀리초/마이크로초)를 epoch 초로 변환"""
+    value = header.strip()
+    if value.startswith('t='):
+        value = value[2:]
+    try:
+        started = float(value)
+    except ValueError:
+        return None
+    # 단위 추정: 마이크로초 → 밀리초 → 초
+    if started > 1e14:
+        return started / 1_000_000
+    if started > 1e11:
+        return started / 1000
+    return started
+
+
+def begin_request_metrics(endpoint, request_start=None):
+    """요청 처리 시작 기록 - 대기 시간 관측, 처리 중 요청/스레드 수 증가 (Flask 훅과 ASGI 비동기 라우트 공용)"""
+    # 인그레스가 요청을 받은 시각부터 처리를 시작하기까지의 대기 시간
+    if request_start:
+        queued_at = _parse_request_start(request_start)
+        if queued_at is not None:
+            REQUEST_QUEUE_TIME.observe(max(time.time() - queued_at, 0.0))
+    request_metrics.in_flight(endpoint).inc()
+    WORKER_THREADS_BUSY.inc()
+
+
+def end_request_metrics(endpoint):
+    """요청 처리 종료 기록 (예외 포함)"""
+    request_metrics.in_flight(endpoint).dec()
+    WORKER_THREADS_BUSY.dec()
+
+
 @app.before_request
 def start_timer():
-    """요청 시작 시각을 기록하여 응답 지연을 산출"""
+    """요청 시작 시각을 기록하여 응답 지연을 산출하고 처리 중 요청 수를 올림"""
     if request.path == '/metrics':
         return
-    g.request_start_time = time.time()
+    g.request_start_time = time.perf_counter()
+
+    # 라우트에 매칭되지 않은 요청(404 스캔 등)은 모두 'unmatched' 하나로 집계
+    endpoint = request.endpoint or UNMATCHED_ENDPOINT
+    g.metrics_endpoint = endpoint
+    begin_request_metrics(endpoint, request.headers.get('X-Request-Start'))
+
+
+@app.teardown_request
+def release_in_flight(exc=None):
+    """응답 완료(예외 포함) 시 처리 중 요청 수를 내림"""
+    endpoint = g.pop('metrics_endpoint', None)
+    if endpoint is not None:
+        end_request_metrics(endpoint)
 
 
 @app.after_request
 def record_request_metrics(response):
     """요청 건수 및 응답 시간을 Prometheus 메트릭으로 저장"""
-    if request.path != '/metrics':
-        elapsed = time.time() - getattr(g, 'request_start_time', time.time())
-        endpoint = request.endpoint or request.path or 'unknown'
-        REQUEST_LATENCY.labels(endpoint=endpoint).observe(elapsed)
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=endpoint,
-            status=response.status_code
-        ).inc()
+    endpoint = g.get('metrics_endpoint')
+    if endpoint is not None:
+        elapsed = time.perf_counter() - g.request_start_time
+        request_metrics.observe(request.method, endpoint, response.status_code, elapsed)
     return response
 
 
 @app.route('/metrics')
 def metrics():
-    """Prometheus가 스크랩할 메트릭 엔드포인트"""
-    refresh_simulation_state_from_store()
-
-    with simulation_state_lock:
-        active = traffic_simulation_active
-        emergency = emergency_mode
-        level = current_traffic_level
-
-    SIMULATION_ACTIVE_GAUGE.set(1 if active else 0)
-    EMERGENCY_MODE_GAUGE.set(1 if emergency else 0)
-    CURRENT_TRAFFIC_LEVEL_GAUGE.set(TRAFFIC_LEVEL_MAPPING.get(level, 0))
-
+    """Prometheus가 스크랩할 메트릭 엔드포인트 (상태 게이지는 상태가 바뀔 때 갱신됨)"""
+    if PROMETHEUS_MULTIPROC_DIR:
+        # 멀티 워커 모드: 모든 워커 프로세스의 메트릭 파일을 합산
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
     return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
 
 
 # 전역 변수 - 트래픽 시뮬레이션 상태 관리
 traffic_simulation_active = False      # 긴급/수동 시뮬레이션 활성화 여부
 current_traffic_level = 'off'          # 현재 트래픽 레벨 (off/low/medium/high)
+current_memory_level = 'off'           # 현재 메모리 부하 레벨 (off/low/medium/high)
 simulation_thread = None               # 시뮬레이션 스레드
 simulation_stop_event = None           # 시뮬레이션 종료 이벤트
 SIMULATION_ENABLED = os.getenv('SIMULATION_ENABLED', 'true').lower() == 'true'
 emergency_mode = False                 # 긴급 상황 모드 여부
 auto_mode_enabled = False              # 자동 모드 (비활성화 기본값)
+scenario_runner = None                 # 실행 중(또는 완료된) 부하 시나리오
+scenario_target_percent = None         # 시나리오가 지정한 CPU 목표 (파드 CPU 요청량 대비 %)
+load_program_lock = threading.RLock()  # 시나리오/클러스터 부하의 목표 반영과 취소를 직렬화
+cluster_load_target = None             # 클러스터 전체 부하 목표 {'total_millicores', 'virtual_rps'}
+cluster_load_share_millicores = None   # 그중 이 파드가 맡은 몫 (millicore)
 
 # 시뮬레이션 상태 공유를 위한 ConfigMap 설정
 SIM_STATE_CONFIGMAP_NAME = os.getenv('SIM_STATE_CONFIGMAP', 'backend-simulation-state')
 SIM_STATE_SYNC_INTERVAL = int(os.getenv('SIM_STATE_SYNC_INTERVAL', '5'))
+SIM_STATE_WATCH_TIMEOUT = int(os.getenv('SIM_STATE_WATCH_TIMEOUT', '300'))        # watch 재연결 주기(초)
+SIM_STATE_WATCH_BACKOFF_MAX = float(os.getenv('SIM_STATE_WATCH_BACKOFF_MAX', '30'))
 
 k8s_enabled = False
 k8s_core_v1 = None
+k8s_coordination_v1 = None
+k8s_apps_v1 = None
 simulation_state_lock = threading.Lock()
 simulation_state_sync_thread = None
+simulation_state_resource_version = None   # 마지막으로 반영한 ConfigMap resourceVersion
+simulation_generation = 0                  # 상태 변경 순번 (ConfigMap의 generation과 비교)
+simulation_pending_generation = 0          # 아직 ConfigMap에 기록되지 않은 로컬 변경의 generation (0이면 없음)
+simulation_requested_at = 0.0              # 현재 상태를 만든 변경이 요청된 시각 (레플리카 간 요청 순서 비교)
+simulation_requested_by = ''               # 그 변경을 받은 파드 (요청 시각이 같을 때 순서 결정)
+SIM_STATE_REQUESTER = socket.gethostname()
+simulation_control_lock = threading.RLock()  # 사용자 변경과 원격 상태 반영을 직렬화
+SIM_STATE_WRITE_DEBOUNCE = float(os.getenv('SIM_STATE_WRITE_DEBOUNCE', '0.2'))  # 연속 변경 병합 대기(초)
+SIM_STATE_WRITE_RETRIES = int(os.getenv('SIM_STATE_WRITE_RETRIES', '5'))          # 충돌(409) 시 재시도 횟수
+simulation_state_write_event = threading.Event()
+simulation_state_writer_thread = None
+simulation_state_synced_at = None          # 마지막 반영 시각 (ISO 문자열)
 
 # 기본 트래픽(OFF 상태) 유지를 위한 스레드 관리
 baseline_thread = None
@@ -102,29 +194,335 @@ stock_symbols = {
     '035720': '카카오'
 }
 previous_prices = {}  # 이전 가격 저장
+last_known_good = {}  # 종목별 마지막 정상 조회 가격 (price, unix timestamp)
+
+# KIS API 실패 시 사용할 모의 기준 가격
+fallback_prices = {
+    '005380': 252000,   # 현대차
+    '000270': 98000,    # 기아
+    '005930': 57900,    # 삼성전자
+    '000660': 135000,   # SK하이닉스
+    '373220': 420000,   # LG에너지솔루션
+    '035420': 210000,   # NAVER
+    '012450': 180000,   # 한화에어로스페이스
+    '034020': 18500,    # 두산에너빌리티
+    '105560': 68000,    # KB금융
+    '042660': 35000,    # 한화오션
+    '032830': 98000,    # 삼성생명
+    '035720': 45000     # 카카오
+}
 
-# Prometheus 메트릭
+# 종목별 시세 조회 병렬화 설정 (/api/stock-data 전체 마감 시간 포함)
+STOCK_FETCH_MAX_WORKERS = int(os.getenv('STOCK_FETCH_MAX_WORKERS', str(len(stock_symbols))))
+STOCK_DATA_DEADLINE = float(os.getenv('STOCK_DATA_DEADLINE', '3.0'))
+quote_fetch_executor = ThreadPoolExecutor(
+    max_workers=STOCK_FETCH_MAX_WORKERS,
+    thread_name_prefix='quote-fetch'
+)
+
+# Prometheus 메트릭 (PROMETHEUS_MULTIPROC_DIR 설정 시 워커 프로세스 간 합산)
+PROMETHEUS_MULTIPROC_DIR = os.getenv('PROMETHEUS_MULTIPROC_DIR')
 REQUEST_COUNT = Counter(
     'backend_http_requests_total',
     'Total number of HTTP requests processed by the backend service',
     ['method', 'endpoint', 'status']
 )
-REQUEST_LATENCY = Histogram(
-    'backend_http_request_latency_seconds',
-    'Latency of HTTP requests processed by the backend service',
-    ['endpoint']
+
+# 요청 지연 히스토그램 버킷 - 기본값과 endpoint별 재정의 ("endpoint=경계,경계;endpoint=...")
+UNMATCHED_ENDPOINT = 'unmatched'
+REQUEST_LATENCY_BUCKETS = os.getenv(
+    'REQUEST_LATENCY_BUCKETS', '0.005,0.01,0.025,0.05,0.075,0.1,0.25,0.5,0.75,1,2.5,5,7.5,10'
+)
+REQUEST_LATENCY_ENDPOINT_BUCKETS = os.getenv(
+    'REQUEST_LATENCY_ENDPOINT_BUCKETS', 'stock_stream=1,5,15,30,60,120,300,600,1800'
+)
+# 고빈도 endpoint의 지연 관측 샘플링 비율 ("health=0.1") - 요청 건수(Counter)는 항상 전수 집계
+REQUEST_METRICS_SAMPLE_RATES = os.getenv('REQUEST_METRICS_SAMPLE_RATES', '')
+HTTP_METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS')
+
+
+def _parse_buckets(spec):
+    return tuple(sorted(float(bound) for bound in spec.split(',') if bound.strip()))
+
+
+def _parse_endpoint_settings(spec, separator=';'):
+    """"endpoint=값;endpoint=값" 형식을 dict로 변환"""
+    settings = {}
+    for item in spec.split(separator):
+        if '=' in item:
+            endpoint, value = item.split('=', 1)
+            settings[endpoint.strip()] = value.strip()
+    return settings
+
+
+class _MergedMetricCollector:
+    """같은 이름의 메트릭 여러 개(버킷만 다른 히스토그램)를 하나의 metric family로 노출"""
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def collect(self):
+        family = None
+        for metric in self.metrics:
+            for collected in metric.collect():
+                if family is None:
+                    family = Metric(collected.name, collected.documentation, collected.type)
+                family.samples.extend(collected.samples)
+        if family is not None:
+            yield family
+
+
+class RequestMetrics:
+    """요청 메트릭 기록기
+
+    - endpoint 라벨은 Flask 라우트 이름과 'unmatched'로 제한되고, method도 표준 메서드 외에는 'OTHER'
+    - 라벨이 결합된 child를 캐시하여 요청마다 .labels() 조회를 반복하지 않음
+    - endpoint별 히스토그램 버킷 및 지연 관측 샘플링 지원
+    """
+    def __init__(self, default_buckets, endpoint_buckets, sample_rates):
+        self.sample_rates = sample_rates
+        histograms = {}
+        self._histogram_by_endpoint = {}
+        for buckets in {default_buckets, *endpoint_buckets.values()}:
+            # 기본 레지스트리에는 _MergedMetricCollector로 한 번만 등록 (멀티프로세스 모드는 파일로 합산)
+            histograms[buckets] = Histogram(
+                'backend_http_request_latency_seconds',
+                'Latency of HTTP requests processed by the backend service',
+                ['endpoint'],
+                buckets=buckets,
+                registry=None
+            )
+        self._default_histogram = histograms[default_buckets]
+        for endpoint, buckets in endpoint_buckets.items():
+            self._histogram_by_endpoint[endpoint] = histograms[buckets]
+        REGISTRY.register(_MergedMetricCollector(list(histograms.values())))
+
+        self._latency_children = {}
+        self._count_children = {}
+        self._in_flight_children = {}
+
+    def latency(self, endpoint):
+        child = self._latency_children.get(endpoint)
+        if child is None:
+            histogram = self._histogram_by_endpoint.get(endpoint, self._default_histogram)
+            child = self._latency_children[endpoint] = histogram.labels(endpoint=endpoint)
+        return child
+
+    def count(self, method, endpoint, status):
+        if method not in HTTP_METHODS:
+            method = 'OTHER'
+        key = (method, endpoint, status)
+        child = self._count_children.get(key)
+        if child is None:
+            child = self._count_children[key] = REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status)
+        return child
+
+    def in_flight(self, endpoint):
+        child = self._in_flight_children.get(endpoint)
+        if child is None:
+            child = self._in_flight_children[endpoint] = REQUESTS_IN_FLIGHT.labels(endpoint=endpoint)
+        return child
+
+    def observe(self, method, endpoint, status, elapsed):
+        self.count(method, endpoint, status).inc()
+        rate = self.sample_rates.get(endpoint)
+        if rate is None or random.random() < rate:
+            self.latency(endpoint).observe(elapsed)
+
+# 포화도 지표 - prometheus-adapter로 pods 메트릭 변환 (monitoring/prometheus-adapter 참고)
+REQUESTS_IN_FLIGHT = Gauge(
+    'backend_requests_in_flight',
+    'HTTP requests currently being processed',
+    ['endpoint'],
+    multiprocess_mode='livesum'
+)
+REQUEST_QUEUE_TIME = Histogram(
+    'backend_request_queue_seconds',
+    'Time between ingress receipt (X-Request-Start) and a worker thread picking the request up',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+WORKER_THREADS_BUSY = Gauge(
+    'backend_worker_threads_busy',
+    'Request handling threads currently busy',
+    multiprocess_mode='livesum'
+)
+WORKER_THREADS_CAPACITY = Gauge(
+    'backend_worker_threads',
+    'Request handling threads available in the pod',
+    multiprocess_mode='livesum'
+)
+QUOTE_FETCH_THREADS_BUSY = Gauge(
+    'backend_quote_fetch_threads_busy',
+    'Quote fetch pool threads currently running a lookup',
+    multiprocess_mode='livesum'
+)
+QUOTE_FETCH_THREADS_CAPACITY = Gauge(
+    'backend_quote_fetch_threads',
+    'Quote fetch pool size',
+    multiprocess_mode='livesum'
+)
+KIS_REQUESTS_IN_FLIGHT = Gauge(
+    'backend_kis_requests_in_flight',
+    'Concurrent upstream KIS API calls',
+    multiprocess_mode='livesum'
+)
+request_metrics = RequestMetrics(
+    _parse_buckets(REQUEST_LATENCY_BUCKETS),
+    {endpoint: _parse_buckets(spec)
+     for endpoint, spec in _parse_endpoint_settings(REQUEST_LATENCY_ENDPOINT_BUCKETS).items()},
+    {endpoint: float(rate)
+     for endpoint, rate in _parse_endpoint_settings(REQUEST_METRICS_SAMPLE_RATES, separator=',').items()}
 )
 SIMULATION_ACTIVE_GAUGE = Gauge(
     'backend_traffic_simulation_active',
-    'Whether traffic simulation is active (1=active, 0=inactive)'
+    'Whether traffic simulation is active (1=active, 0=inactive)',
+    multiprocess_mode='livemax'
 )
 EMERGENCY_MODE_GAUGE = Gauge(
     'backend_traffic_emergency_mode',
-    'Whether emergency mode is active (1=active, 0=inactive)'
+    'Whether emergency mode is active (1=active, 0=inactive)',
+    multiprocess_mode='livemax'
 )
 CURRENT_TRAFFIC_LEVEL_GAUGE = Gauge(
     'backend_current_traffic_level',
-    'Current traffic level encoded as 0=off, 1=low, 2=medium, 3=high'
+    'Current traffic level encoded as 0=off, 1=low, 2=medium, 3=high',
+    multiprocess_mode='livemax'
+)
+
+SSE_SUBSCRIBERS_GAUGE = Gauge(
+    'backend_sse_subscribers',
+    'Number of clients currently subscribed to /api/stock-stream',
+    multiprocess_mode='livesum'
+)
+KIS_RATE_LIMIT_WAIT = Histogram(
+    'backend_kis_rate_limit_wait_seconds',
+    'Time KIS API calls spent queued in the outbound rate limiter',
+    ['priority']
+)
+KIS_RATE_LIMIT_REJECTED = Counter(
+    'backend_kis_rate_limit_rejected_total',
+    'KIS API calls rejected by the outbound rate limiter',
+    ['priority', 'reason']
+)
+KIS_RATE_LIMIT_PER_POD_GAUGE = Gauge(
+    'backend_kis_rate_limit_per_pod',
+    'KIS API request budget per second allotted to this pod',
+    multiprocess_mode='livemax'
+)
+KIS_CIRCUIT_STATE_GAUGE = Gauge(
+    'backend_kis_circuit_state',
+    'KIS API circuit breaker state encoded as 0=closed, 1=half_open, 2=open',
+    multiprocess_mode='livemax'
+)
+KIS_CIRCUIT_TRIPS = Counter(
+    'backend_kis_circuit_trips_total',
+    'Number of times the KIS API circuit breaker opened'
+)
+SIM_STATE_WRITE_CONFLICTS = Counter(
+    'backend_simulation_state_write_conflicts_total',
+    'Simulation state ConfigMap writes retried after a resourceVersion conflict'
+)
+LOAD_ENGINE_TARGET_GAUGE = Gauge(
+    'backend_load_engine_target_millicores',
+    'CPU load the load engine is asked to hold, in millicores',
+    multiprocess_mode='livemax'
+)
+LOAD_ENGINE_ACHIEVED_GAUGE = Gauge(
+    'backend_load_engine_achieved_millicores',
+    'CPU usage measured by the load engine feedback loop, in millicores',
+    multiprocess_mode='livemax'
+)
+LOAD_ENGINE_DUTY_GAUGE = Gauge(
+    'backend_load_engine_duty_ratio',
+    'Busy fraction of the load engine duty cycle (0-1)',
+    multiprocess_mode='livemax'
+)
+MEMORY_BALLAST_BYTES_GAUGE = Gauge(
+    'backend_memory_ballast_bytes',
+    'Bytes currently held by the memory-pressure simulation',
+    multiprocess_mode='livesum'
+)
+MEMORY_BALLAST_TARGET_GAUGE = Gauge(
+    'backend_memory_ballast_target_bytes',
+    'Target size of the memory-pressure simulation in bytes',
+    multiprocess_mode='livemax'
+)
+PREDICTED_LOAD_FACTOR_GAUGE = Gauge(
+    'backend_predicted_load_factor',
+    'Forecast demand multiplier derived from market volatility (1 = normal load)',
+    multiprocess_mode='livemax'
+)
+MARKET_VOLATILITY_GAUGE = Gauge(
+    'backend_market_volatility_percent',
+    'Market-wide volatility signal used by the demand forecaster',
+    multiprocess_mode='livemax'
+)
+RESPONSE_CACHE_REQUESTS = Counter(
+    'backend_response_cache_requests_total',
+    'Pre-serialized response cache lookups by result (hit, miss, not_modified)',
+    ['endpoint', 'result']
+)
+RESPONSE_CACHE_BYTES_SAVED = Counter(
+    'backend_response_cache_bytes_saved_total',
+    'Response bytes not sent thanks to 304 responses or gzip',
+    ['endpoint', 'reason']
+)
+STARTUP_PHASE_SECONDS = Gauge(
+    'backend_startup_phase_seconds',
+    'Duration of each startup warm-up phase',
+    ['phase'],
+    multiprocess_mode='livemax'
+)
+STARTUP_READY_GAUGE = Gauge(
+    'backend_ready',
+    'Whether warm-up finished (or its deadline passed) and the process accepts traffic',
+    multiprocess_mode='livemin'
+)
+SCENARIO_ACTIVE_GAUGE = Gauge(
+    'backend_scenario_active',
+    'Whether a scripted load scenario is running (1=running, 0=none/scheduled/completed)',
+    multiprocess_mode='livemax'
+)
+SCENARIO_STEP_GAUGE = Gauge(
+    'backend_scenario_step',
+    'Index of the scenario step currently executing (0-based, across repeats)',
+    multiprocess_mode='livemax'
+)
+SCENARIO_PROGRESS_GAUGE = Gauge(
+    'backend_scenario_progress_ratio',
+    'Scenario progress (0-1) overall and within the current step',
+    ['scope'],
+    multiprocess_mode='livemax'
+)
+SCENARIO_TARGET_GAUGE = Gauge(
+    'backend_scenario_target_cpu_percent',
+    'CPU target set by the running scenario, as a percentage of the pod CPU request',
+    multiprocess_mode='livemax'
+)
+CLUSTER_MEMBERS_GAUGE = Gauge(
+    'backend_cluster_members',
+    'Live backend replicas seen through membership lease heartbeats',
+    multiprocess_mode='livemax'
+)
+CLUSTER_LOAD_TOTAL_GAUGE = Gauge(
+    'backend_cluster_load_total_millicores',
+    'Aggregate CPU demand the simulation spreads across all live replicas (0 when not in aggregate mode)',
+    multiprocess_mode='livemax'
+)
+CLUSTER_LOAD_SHARE_GAUGE = Gauge(
+    'backend_cluster_load_share_millicores',
+    'Part of the aggregate CPU demand assigned to this pod',
+    multiprocess_mode='livemax'
+)
+SCALE_REACTION_SECONDS = Histogram(
+    'backend_scale_reaction_seconds',
+    'Time from a simulation transition to each scaling milestone of the backend Deployment',
+    ['direction', 'phase'],
+    buckets=(5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 240, 300, 420, 600, 900)
+)
+QUOTE_CACHE_REQUESTS = Counter(
+    'backend_quote_cache_requests_total',
+    'Quote cache lookups by result (hit, stale, miss, coalesced)',
+    ['result']
 )
 
 TRAFFIC_LEVEL_MAPPING = {
@@ -135,30 +533,59 @@ TRAFFIC_LEVEL_MAPPING = {
 }
 
 
-def _default_simulation_state():
-    return {
-        'traffic_level': 'off',
-        'simulation_active': False,
-        'emergency_mode': False
-    }
-
-
 def _state_to_strings():
     with simulation_state_lock:
+        runner = scenario_runner
         return {
             'traffic_level': current_traffic_level,
             'simulation_active': 'true' if traffic_simulation_active else 'false',
-            'emergency_mode': 'true' if emergency_mode else 'false'
+            'emergency_mode': 'true' if emergency_mode else 'false',
+            'memory_level': current_memory_level,
+            'scenario': runner.scenario.to_json() if runner else '',
+            'scenario_started_at': repr(runner.started_at) if runner else '',
+            'cluster_total_millicores': repr(cluster_load_target['total_millicores']) if cluster_load_target else '',
+            'cluster_virtual_rps': repr(cluster_load_target['virtual_rps'])
+            if cluster_load_target and cluster_load_target['virtual_rps'] is not None else '',
+            'generation': str(simulation_generation),
+            'requested_at': repr(simulation_requested_at),
+            'requested_by': simulation_requested_by
         }
 
 
 def _strings_to_state(data):
-    state = _default_simulation_state()
+    state = sim_state.default_state()
     if not data:
         return state
     state['traffic_level'] = data.get('traffic_level', state['traffic_level'])
     state['simulation_active'] = data.get('simulation_active', 'false').lower() == 'true'
     state['emergency_mode'] = data.get('emergency_mode', 'false').lower() == 'true'
+    state['memory_level'] = data.get('memory_level', state['memory_level'])
+    try:
+        state['generation'] = int(data.get('generation', 0))
+    except ValueError:
+        state['generation'] = 0
+    try:
+        requested_at = float(data.get('requested_at') or 0.0)
+        state['requested_at'] = requested_at if math.isfinite(requested_at) else 0.0
+    except ValueError:
+        state['requested_at'] = 0.0
+    state['requested_by'] = data.get('requested_by', '')
+    if data.get('scenario') and data.get('scenario_started_at'):
+        try:
+            state['scenario'] = TrafficScenario.from_spec(json.loads(data['scenario']), SCENARIO_LIMITS)
+            state['scenario_started_at'] = _scenario_start_time(float(data['scenario_started_at']))
+        except ValueError as exc:
+            print(f"ConfigMap 시나리오 무시: {exc}")
+            state['scenario'] = None
+            state['scenario_started_at'] = None
+    if data.get('cluster_total_millicores'):
+        try:
+            # 저장된 총량을 그대로 쓰되 API와 같은 범위 검증 (NaN/범위 밖 값은 무시)
+            target = cluster_load_target_from(data['cluster_total_millicores'])
+            target['virtual_rps'] = float(data['cluster_virtual_rps']) if data.get('cluster_virtual_rps') else None
+            state['cluster_load'] = target
+        except ValueError as exc:
+            print(f"ConfigMap 클러스터 부하 목표 무시: {exc}")
     return state
 
 
@@ -176,31 +603,118 @@ def _detect_namespace():
 K8S_NAMESPACE = _detect_namespace()
 
 
+def _next_generation_locked():
+    """새 generation 부여 - 상태 변경과 같은 simulation_state_lock 임계 구역 안에서 호출"""
+    global simulation_generation, simulation_pending_generation, simulation_requested_at, simulation_requested_by
+    simulation_generation += 1
+    simulation_requested_at = time.time()
+    simulation_requested_by = SIM_STATE_REQUESTER
+    if k8s_enabled and k8s_core_v1 is not None:
+        simulation_pending_generation = simulation_generation
+    return simulation_generation
+
+
+def request_simulation_state_write():
+    """비동기 저장 요청 (generation은 _next_generation_locked로 미리 부여)"""
+    if k8s_enabled and k8s_core_v1 is not None:
+        simulation_state_write_event.set()
+
+
 def persist_simulation_state():
-    """현재 시뮬레이션 상태를 ConfigMap에 저장"""
-    if not k8s_enabled or k8s_core_v1 is None:
-        return
+    """현재 상태에 새 generation을 부여하고 비동기 저장을 요청 (부여된 generation 반환)"""
+    with simulation_state_lock:
+        generation = _next_generation_locked()
+    request_simulation_state_write()
+    return generation
+
+
+def _finish_state_write(written_generation):
+    """기록 완료(또는 포기) 후, 그 사이 새 로컬 변경이 없으면 대기 중 표시 해제"""
+    global simulation_pending_generation
+    with simulation_state_lock:
+        if simulation_pending_generation <= written_generation:
+            simulation_pending_generation = 0
+
+
+def _write_simulation_state():
+    """로컬 최신 상태를 ConfigMap에 기록 (resourceVersion 선행 조건, 충돌 시 재시도)
+
+    ConfigMap에 로컬 변경보다 나중에 요청된 다른 레플리카의 변경이 있으면 기록하지 않고 그 상태를 반영한다.
+    로컬 변경이 나중이면 원격 generation 뒤 순번으로 기록한다.
+    """
+    global simulation_generation, simulation_pending_generation
 
     data = _state_to_strings()
+    for _ in range(SIM_STATE_WRITE_RETRIES):
+        try:
+            existing = k8s_core_v1.read_namespaced_config_map(SIM_STATE_CONFIGMAP_NAME, K8S_NAMESPACE)
+            if existing.data is None:
+                existing.data = {}
+            remote = _strings_to_state(existing.data)
+            # 사용자 변경과 겹치지 않도록 비교와 반영은 control lock 안에서 (기록 호출은 밖에서)
+            with simulation_control_lock:
+                with simulation_state_lock:
+                    remote_wins, generation = sim_state.resolve_write_conflict(
+                        simulation_generation, (simulation_requested_at, simulation_requested_by), remote
+                    )
+                    if remote_wins:
+                        simulation_generation = generation
+                        simulation_pending_generation = 0
+                    elif generation != simulation_generation:
+                        simulation_generation = generation
+                        if simulation_pending_generation:
+                            simulation_pending_generation = simulation_generation
+                if remote_wins:
+                    # 다른 레플리카의 변경이 더 나중에 요청됨 - 로컬 변경 대신 그 상태를 반영
+                    print(f"시뮬레이션 상태 충돌: {remote['requested_by'] or '다른 레플리카'}의 이후 변경을 반영")
+                    _apply_desired_state_locked(remote)
+                    return
+                data = _state_to_strings()
+            existing.data.update(data)
+            # existing.metadata.resource_version이 선행 조건으로 사용됨 (변경 시 409)
+            k8s_core_v1.replace_namespaced_config_map(SIM_STATE_CONFIGMAP_NAME, K8S_NAMESPACE, existing)
+            _finish_state_write(int(data['generation']))
+            return
+        except ApiException as exc:
+            if exc.status == 409:
+                SIM_STATE_WRITE_CONFLICTS.inc()
+                continue
+            if exc.status == 404:
+                body = k8s_client.V1ConfigMap(
+                    metadata=k8s_client.V1ObjectMeta(name=SIM_STATE_CONFIGMAP_NAME),
+                    data=data
+                )
+                try:
+                    k8s_core_v1.create_namespaced_config_map(K8S_NAMESPACE, body)
+                    _finish_state_write(int(data['generation']))
+                    return
+                except ApiException as create_exc:
+                    if create_exc.status == 409:
+                        continue
+                    print(f"ConfigMap 생성 실패: {create_exc}")
+                    break
+            else:
+                print(f"시뮬레이션 상태 저장 실패: {exc}")
+                break
+    else:
+        print(f"시뮬레이션 상태 저장 실패: 충돌 재시도 {SIM_STATE_WRITE_RETRIES}회 초과")
+    # 저장을 포기했으면 원격 상태 반영을 계속 막지 않도록 대기 표시 해제
+    _finish_state_write(int(data['generation']))
 
-    try:
-        existing = k8s_core_v1.read_namespaced_config_map(SIM_STATE_CONFIGMAP_NAME, K8S_NAMESPACE)
-        if existing.data is None:
-            existing.data = {}
-        existing.data.update(data)
-        k8s_core_v1.replace_namespaced_config_map(SIM_STATE_CONFIGMAP_NAME, K8S_NAMESPACE, existing)
-    except ApiException as exc:
-        if exc.status == 404:
-            body = k8s_client.V1ConfigMap(
-                metadata=k8s_client.V1ObjectMeta(name=SIM_STATE_CONFIGMAP_NAME),
-                data=data
-            )
-            try:
-                k8s_core_v1.create_namespaced_config_map(K8S_NAMESPACE, body)
-            except ApiException as create_exc:
-                print(f"ConfigMap 생성 실패: {create_exc}")
-        else:
-            print(f"시뮬레이션 상태 저장 실패: {exc}")
+
+def _simulation_state_writer_loop():
+    """저장 요청을 SIM_STATE_WRITE_DEBOUNCE 동안 모아 한 번에 기록"""
+    while True:
+        simulation_state_write_event.wait()
+        time.sleep(SIM_STATE_WRITE_DEBOUNCE)
+        simulation_state_write_event.clear()
+        with simulation_state_lock:
+            generation = simulation_generation
+        try:
+            _write_simulation_state()
+        except Exception as e:
+            print(f"시뮬레이션 상태 저장 오류: {e}")
+            _finish_state_write(generation)
 
 
 def fetch_simulation_state():
@@ -235,22 +749,261 @@ def ensure_simulation_configmap():
         else:
             print(f"ConfigMap 확인 실패: {exc}")
 
+# KIS API 연결 설정
+KIS_BASE_URL = os.getenv('KIS_BASE_URL', 'https://openapi.koreainvestment.com:9443')
+KIS_HTTP_POOL_SIZE = int(os.getenv('KIS_HTTP_POOL_SIZE', '16'))
+KIS_CONNECT_TIMEOUT = float(os.getenv('KIS_CONNECT_TIMEOUT', '3'))
+KIS_READ_TIMEOUT = float(os.getenv('KIS_READ_TIMEOUT', '10'))
+KIS_HTTP_RETRIES = int(os.getenv('KIS_HTTP_RETRIES', '2'))
+KIS_HTTP_BACKOFF = float(os.getenv('KIS_HTTP_BACKOFF', '0.3'))
+KIS_LOG_RESPONSES = os.getenv('KIS_LOG_RESPONSES', 'false').lower() == 'true'  # 원시 응답 로그 (디버깅용)
+KIS_TOKEN_EXPIRY_MARGIN = int(os.getenv('KIS_TOKEN_EXPIRY_MARGIN', '300'))  # 만료 전 여유 시간(초)
+KIS_TOKEN_RETRY_INTERVAL = int(os.getenv('KIS_TOKEN_RETRY_INTERVAL', '10'))  # 발급 실패 후 재시도 간격(초)
+
+# 토큰 공유 저장소 (off/file/secret)
+KIS_TOKEN_STORE = os.getenv('KIS_TOKEN_STORE', 'off').lower()
+KIS_TOKEN_STORE_PATH = os.getenv('KIS_TOKEN_STORE_PATH', '/tmp/kis-token.json')
+KIS_TOKEN_SECRET_NAME = os.getenv('KIS_TOKEN_SECRET_NAME', 'kis-access-token')
+
+
+class FileTokenStore:
+    """로컬 디스크에 토큰을 저장 (같은 노드/볼륨의 프로세스 간 공유)"""
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data['access_token'], datetime.fromisoformat(data['expires_at'])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"KIS 토큰 파일 읽기 실패: {e}")
+            return None
+
+    def save(self, token, expires_at):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'access_token': token, 'expires_at': expires_at.isoformat()}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"KIS 토큰 파일 저장 실패: {e}")
+
+
+class SecretTokenStore:
+    """Kubernetes Secret에 토큰을 저장 (스케일 아웃된 레플리카 간 공유)"""
+    def __init__(self, name):
+        self.name = name
+
+    def load(self):
+        if not k8s_enabled or k8s_core_v1 is None:
+            return None
+        try:
+            secret = k8s_core_v1.read_namespaced_secret(self.name, K8S_NAMESPACE)
+        except ApiException as exc:
+            if exc.status != 404:
+                print(f"KIS 토큰 Secret 조회 실패: {exc}")
+            return None
+        data = secret.data or {}
+        try:
+            token = base64.b64decode(data['access_token']).decode('utf-8')
+            expires_at = datetime.fromisoformat(base64.b64decode(data['expires_at']).decode('utf-8'))
+        except (KeyError, ValueError) as e:
+            print(f"KIS 토큰 Secret 형식 오류: {e}")
+            return None
+        return token, expires_at
+
+    def save(self, token, expires_at):
+        if not k8s_enabled or k8s_core_v1 is None:
+            return
+        string_data = {'access_token': token, 'expires_at': expires_at.isoformat()}
+        try:
+            k8s_core_v1.patch_namespaced_secret(self.name, K8S_NAMESPACE, {'stringData': string_data})
+        except ApiException as exc:
+            if exc.status != 404:
+                print(f"KIS 토큰 Secret 저장 실패: {exc}")
+                return
+            body = k8s_client.V1Secret(
+                metadata=k8s_client.V1ObjectMeta(name=self.name),
+                string_data=string_data
+            )
+            try:
+                k8s_core_v1.create_namespaced_secret(K8S_NAMESPACE, body)
+            except ApiException as create_exc:
+                print(f"KIS 토큰 Secret 생성 실패: {create_exc}")
+
+
+# KIS API 호출 속도 제한 (계정 전체 예산을 레플리카 수로 나눠 사용)
+KIS_RATE_LIMIT = float(os.getenv('KIS_RATE_LIMIT', '18'))          # 계정 전체 초당 호출 수
+KIS_RATE_LIMIT_BURST = float(os.getenv('KIS_RATE_LIMIT_BURST', '18'))
+KIS_RATE_LIMIT_QUEUE = int(os.getenv('KIS_RATE_LIMIT_QUEUE', '64'))
+KIS_RATE_LIMIT_TIMEOUT = float(os.getenv('KIS_RATE_LIMIT_TIMEOUT', '2.0'))
+KIS_RATE_LIMIT_SERVICE = os.getenv('KIS_RATE_LIMIT_SERVICE', 'backend-service')
+KIS_RATE_LIMIT_REPLICA_REFRESH = int(os.getenv('KIS_RATE_LIMIT_REPLICA_REFRESH', '30'))
+KIS_RATE_LIMIT_PROCESSES = int(os.getenv('KIS_RATE_LIMIT_PROCESSES', os.getenv('GUNICORN_WORKERS', '1')))  # 파드 내 워커 수
+
+
+
+def _on_rate_limit_budget(per_pod):
+    KIS_RATE_LIMIT_PER_POD_GAUGE.set(per_pod)
+
+
+def _on_rate_limit_wait(priority, seconds):
+    KIS_RATE_LIMIT_WAIT.labels(priority=priority).observe(seconds)
+
+
+def _on_rate_limit_reject(priority, reason):
+    KIS_RATE_LIMIT_REJECTED.labels(priority=priority, reason=reason).inc()
+
+
+def count_live_replicas():
+    """백엔드 Service의 Ready 엔드포인트 수로 살아있는 레플리카 수를 계산"""
+    if not k8s_enabled or k8s_core_v1 is None:
+        return None
+    try:
+        endpoints = k8s_core_v1.read_namespaced_endpoints(KIS_RATE_LIMIT_SERVICE, K8S_NAMESPACE)
+    except ApiException as exc:
+        print(f"엔드포인트 조회 실패: {exc}")
+        return None
+    return sum(len(subset.addresses or []) for subset in (endpoints.subsets or []))
+
+
+def _replica_budget_loop():
+    """레플리카 수를 주기적으로 확인하여 파드별 KIS 호출 예산 조정"""
+    while True:
+        replicas = count_live_replicas()
+        if replicas:
+            kis_rate_limiter.set_replicas(replicas)
+        time.sleep(KIS_RATE_LIMIT_REPLICA_REFRESH)
+
+
+kis_rate_limiter = TokenBucketRateLimiter(
+    KIS_RATE_LIMIT, KIS_RATE_LIMIT_BURST, KIS_RATE_LIMIT_QUEUE, KIS_RATE_LIMIT_TIMEOUT,
+    processes=KIS_RATE_LIMIT_PROCESSES,
+    on_budget=_on_rate_limit_budget,
+    on_wait=_on_rate_limit_wait,
+    on_reject=_on_rate_limit_reject
+)
+replica_budget_thread = None
+
+
+# KIS API 서킷 브레이커 설정
+KIS_BREAKER_FAILURE_THRESHOLD = int(os.getenv('KIS_BREAKER_FAILURE_THRESHOLD', '5'))  # 연속 실패 횟수
+KIS_BREAKER_RESET_TIMEOUT = float(os.getenv('KIS_BREAKER_RESET_TIMEOUT', '30'))       # open 유지 시간(초)
+
+CIRCUIT_STATE_MAPPING = {
+    'closed': 0,
+    'half_open': 1,
+    'open': 2
+}
+
+
+def _on_circuit_state(state):
+    KIS_CIRCUIT_STATE_GAUGE.set(CIRCUIT_STATE_MAPPING[state])
+
+
+kis_circuit_breaker = CircuitBreaker(
+    KIS_BREAKER_FAILURE_THRESHOLD, KIS_BREAKER_RESET_TIMEOUT,
+    on_state_change=_on_circuit_state, on_trip=KIS_CIRCUIT_TRIPS.inc
+)
+
+
+def _build_token_store():
+    if KIS_TOKEN_STORE == 'file':
+        return FileTokenStore(KIS_TOKEN_STORE_PATH)
+    if KIS_TOKEN_STORE == 'secret':
+        return SecretTokenStore(KIS_TOKEN_SECRET_NAME)
+    return None
+
+
+def _build_kis_session():
+    """커넥션 풀/keep-alive 및 재시도 정책이 적용된 HTTP 세션 생성"""
+    session = requests.Session()
+    retry = Retry(
+        total=KIS_HTTP_RETRIES,
+        read=0,   # 읽기 시간 초과는 재시도하지 않음 (시도마다 read timeout 전체를 다시 기다려 마감 시간을 넘김)
+        backoff_factor=KIS_HTTP_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),  # 토큰 발급(POST)은 재시도하지 않음
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=KIS_HTTP_POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 # KIS API 클라이언트
 class KISAPIClient:
-    def __init__(self):
+    def __init__(self, session=None, token_store=None, rate_limiter=None, circuit_breaker=None):
         self.app_key = os.getenv('KIS_APP_KEY')
         self.app_secret = os.getenv('KIS_APP_SECRET')
         self.access_token = None
         self.token_expires_at = None
+        self.session = session or _build_kis_session()
+        self.timeout = (KIS_CONNECT_TIMEOUT, KIS_READ_TIMEOUT)
+        self.token_store = token_store
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self._token_lock = threading.Lock()
+        self._token_retry_at = None
+
+    def _token_valid(self):
+        return bool(self.access_token and self.token_expires_at and self.token_expires_at > datetime.now())
+
+    def _token_expiry(self, token_data):
+        """토큰 응답의 expires_in(초)으로 만료 시각 계산"""
+        expires_in = token_data.get('expires_in')
+        if expires_in:
+            try:
+                seconds = max(int(expires_in) - KIS_TOKEN_EXPIRY_MARGIN, 0)
+                return datetime.now() + timedelta(seconds=seconds)
+            except (TypeError, ValueError):
+                pass
+        expired_at = token_data.get('access_token_token_expired')
+        if expired_at:
+            try:
+                return datetime.strptime(expired_at, '%Y-%m-%d %H:%M:%S') - timedelta(seconds=KIS_TOKEN_EXPIRY_MARGIN)
+            except ValueError:
+                pass
+        return datetime.now() + timedelta(hours=24)
     
     def get_access_token(self):
-        """토큰 발급 및 자동 갱신"""
+        """토큰 발급 및 자동 갱신 (동시 요청 시 한 번만 발급)"""
         # 토큰이 유효한지 확인
-        if self.access_token and self.token_expires_at and self.token_expires_at > datetime.now():
+        if self._token_valid():
             return self.access_token
-        
-        # 새 토큰 발급
-        url = "https://openapi.koreainvestment.com:9443/oauth2/tokenP"
+
+        with self._token_lock:
+            # 대기하는 동안 다른 스레드가 갱신했는지 재확인
+            if self._token_valid():
+                return self.access_token
+
+            if self._token_retry_at and self._token_retry_at > datetime.now():
+                return None
+
+            # 다른 레플리카가 저장해 둔 토큰 재사용
+            if self.token_store:
+                stored = self.token_store.load()
+                if stored and stored[1] > datetime.now():
+                    self.access_token, self.token_expires_at = stored
+                    print("KIS API 토큰 저장소에서 토큰 재사용")
+                    return self.access_token
+
+            token = self._issue_token()
+            if token:
+                self._token_retry_at = None
+                if self.token_store:
+                    self.token_store.save(token, self.token_expires_at)
+            else:
+                self._token_retry_at = datetime.now() + timedelta(seconds=KIS_TOKEN_RETRY_INTERVAL)
+            return token
+
+    def token_request(self):
+        """토큰 발급 요청 (url, body, headers) - 동기/비동기 클라이언트 공용"""
+        url = f"{KIS_BASE_URL}/oauth2/tokenP"
         data = {
             "grant_type": "client_credentials",
             "appkey": self.app_key,
@@ -260,34 +1013,38 @@ class KISAPIClient:
             "Content-Type": "application/json; charset=UTF-8",
             "Accept": "application/json"
         }
+        return url, data, headers
+
+    def accept_token(self, token_data):
+        """토큰 응답을 반영하고 access_token 반환 (없으면 None)"""
+        access_token = token_data.get('access_token')
+        if not access_token:
+            print(f"KIS API 토큰 응답에 access_token이 없습니다: {token_data}")
+            return None
+        
+        self.access_token = access_token
+        self.token_expires_at = self._token_expiry(token_data)
+        
+        print(f"KIS API 토큰 발급 성공: {self.access_token[:20]}... (만료: {self.token_expires_at.isoformat()})")
+        return self.access_token
+
+    def _issue_token(self):
+        """새 토큰 발급"""
+        url, data, headers = self.token_request()
         
         try:
-            response = requests.post(url, json=data, headers=headers, timeout=10)
+            with KIS_REQUESTS_IN_FLIGHT.track_inprogress():
+                response = self.session.post(url, json=data, headers=headers, timeout=self.timeout)
             response.raise_for_status()
+            return self.accept_token(response.json())
             
-            token_data = response.json()
-            self.access_token = token_data.get('access_token')
-            if not self.access_token:
-                print(f"KIS API 토큰 응답에 access_token이 없습니다: {token_data}")
-                return None
-            
-            # 24시간 후 만료
-            self.token_expires_at = datetime.now() + timedelta(hours=24)
-            
-            print(f"KIS API 토큰 발급 성공: {self.access_token[:20]}...")
-            return self.access_token
-            
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"KIS API 토큰 발급 실패: {e}")
             return None
-    
-    def get_stock_price(self, symbol):
-        """주식 가격 조회"""
-        token = self.get_access_token()
-        if not token:
-            return None
-        
-        url = "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/inquire-price"
+
+    def price_request(self, symbol, token):
+        """현재가 조회 요청 (url, headers, params) - 동기/비동기 클라이언트 공용"""
+        url = f"{KIS_BASE_URL}/uapi/domestic-stock/v1/quotations/inquire-price"
         headers = {
             "Authorization": f"Bearer {token}",
             "appkey": self.app_key,
@@ -302,32 +1059,87 @@ class KISAPIClient:
             "fid_cond_mrkt_div_code": "J",
             "fid_input_iscd": symbol
         }
+        return url, headers, params
+
+    @staticmethod
+    def is_success(data):
+        """KIS 응답 본문의 처리 결과 코드가 정상인지 (HTTP 200이어도 rt_cd로 오류를 알리는 경우가 있음)"""
+        return data.get('rt_cd') in ('0', '00')
+
+    @staticmethod
+    def parse_price(symbol, data):
+        """현재가 응답에서 가격 추출 (오류 응답이면 None)"""
+        if KIS_LOG_RESPONSES:
+            print(f"KIS API 응답 ({symbol}): {data}")
+
+        if not KISAPIClient.is_success(data):
+            print(f"KIS API 오류 응답 ({symbol}): {data}")
+            return None
+        
+        if 'output' in data:
+            stock_info = data['output']
+            # 현재가는 stck_prpr 필드에 있음
+            price = stock_info.get('stck_prpr', None)
+            if price:
+                return float(price)
+        return None
+    
+    def get_stock_price(self, symbol, priority=PRIORITY_BULK):
+        """주식 가격 조회 (서킷 open 또는 호출 속도 제한 초과 시 None)"""
+        breaker = self.circuit_breaker
+        if breaker and not breaker.allow():
+            return None
+
+        token = self.get_access_token()
+        if not token:
+            if breaker:
+                breaker.record_failure()
+            return None
+
+        if self.rate_limiter and not self.rate_limiter.acquire(priority):
+            print(f"KIS API 호출 한도 초과, 조회 생략 ({symbol})")
+            if breaker:
+                breaker.cancel()
+            return None
+        
+        url, headers, params = self.price_request(symbol, token)
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            with KIS_REQUESTS_IN_FLIGHT.track_inprogress():
+                response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
             response.raise_for_status()
             
             data = response.json()
-            print(f"KIS API 응답 ({symbol}): {data}")  # 디버깅용
+            if breaker:
+                # 오류 응답(rt_cd)은 서킷을 닫지 않고 실패로 집계
+                if self.is_success(data):
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+            return self.parse_price(symbol, data)
             
-            if data.get('rt_cd') not in ('0', '00'):
-                print(f"KIS API 오류 응답 ({symbol}): {data}")
-                return None
-            
-            if 'output' in data:
-                stock_info = data['output']
-                # 현재가는 stck_prpr 필드에 있음
-                price = stock_info.get('stck_prpr', None)
-                if price:
-                    return float(price)
-            return None
-            
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"KIS API 주식 가격 조회 실패 ({symbol}): {e}")
+            if breaker:
+                breaker.record_failure()
             return None
 
 # KIS API 클라이언트 인스턴스
-kis_client = KISAPIClient()
+kis_client = KISAPIClient(
+    token_store=_build_token_store(),
+    rate_limiter=kis_rate_limiter,
+    circuit_breaker=kis_circuit_breaker
+)
+
+
+def _on_quote_cache_lookup(result):
+    QUOTE_CACHE_REQUESTS.labels(result=result).inc()
+
+
+# 시세 캐시 설정 (초 단위)
+QUOTE_CACHE_TTL = float(os.getenv('QUOTE_CACHE_TTL', '5'))
+QUOTE_CACHE_STALE_TTL = float(os.getenv('QUOTE_CACHE_STALE_TTL', '30'))
+quote_cache = QuoteCache(QUOTE_CACHE_TTL, QUOTE_CACHE_STALE_TTL, on_lookup=_on_quote_cache_lookup)
 
 # 트래픽 프로파일 구성 - 각각 CPU 사용량을 유도하는 반복 횟수/휴식 간격
 TRAFFIC_PROFILES = {
@@ -337,10 +1149,150 @@ TRAFFIC_PROFILES = {
 }
 BASELINE_PROFILE = {'iterations': 40, 'range_limit': 350, 'sleep': 0.5}  # OFF 상태 약 15%
 
+# 부하 엔진 모드 - 반복 횟수 대신 파드 CPU 요청량 대비 목표 비율(%)을 별도 프로세스가 피드백 제어로 유지
+# 목표는 기본 부하를 포함한 합계 (예: medium = 기본 15% + 시뮬레이션 60%)
+LOAD_ENGINE_ENABLED = os.getenv('LOAD_ENGINE_ENABLED', 'false').lower() == 'true'
+LOAD_ENGINE_FEEDBACK = os.getenv('LOAD_ENGINE_FEEDBACK', 'cgroup')   # cgroup: 컨테이너 전체, process: 엔진 프로세스만
+POD_CPU_REQUEST_MILLICORES = float(os.getenv('POD_CPU_REQUEST_MILLICORES', '100'))
+POD_CPU_LIMIT_MILLICORES = float(os.getenv('POD_CPU_LIMIT_MILLICORES', '1000'))
+# 엔진은 버너 스레드 하나로 최대 1코어까지만 부하를 만듦 (limit이 더 커도 목표는 여기까지)
+LOAD_ENGINE_MAX_MILLICORES = min(POD_CPU_LIMIT_MILLICORES, MAX_ENGINE_MILLICORES)
+
+
+def _parse_load_targets(raw):
+    targets = {'off': 15.0, 'low': 22.0, 'medium': 75.0, 'high': 105.0}
+    for item in raw.split(','):
+        if '=' not in item:
+            continue
+        level, percent = item.split('=', 1)
+        try:
+            targets[level.strip()] = float(percent)
+        except ValueError:
+            print(f"LOAD_ENGINE_TARGETS 항목 무시: {item}")
+    return targets
+
+
+LOAD_ENGINE_TARGETS = _parse_load_targets(os.getenv('LOAD_ENGINE_TARGETS', ''))
+
+
+def _on_load_engine_report(report):
+    LOAD_ENGINE_TARGET_GAUGE.set(report.get('target_millicores', 0))
+    LOAD_ENGINE_ACHIEVED_GAUGE.set(report.get('achieved_millicores', 0))
+    LOAD_ENGINE_DUTY_GAUGE.set(report.get('duty', 0))
+
+
+load_engine = LoadEngine(
+    feedback=LOAD_ENGINE_FEEDBACK,
+    max_millicores=LOAD_ENGINE_MAX_MILLICORES,
+    on_report=_on_load_engine_report
+) if LOAD_ENGINE_ENABLED else None
+
+# 메모리 부하 프로파일 - 컨테이너 메모리 limit 대비 점유 비율(%) (HPA 메모리 지표 검증용)
+POD_MEMORY_LIMIT_MB = float(os.getenv('POD_MEMORY_LIMIT_MB', '512'))
+MEMORY_RAMP_MB_PER_SEC = float(os.getenv('MEMORY_RAMP_MB_PER_SEC', '64'))
+
+
+def _parse_memory_targets(raw):
+    targets = {'off': 0.0, 'low': 15.0, 'medium': 35.0, 'high': 55.0}
+    for item in raw.split(','):
+        if '=' not in item:
+            continue
+        level, percent = item.split('=', 1)
+        try:
+            targets[level.strip()] = float(percent)
+        except ValueError:
+            print(f"MEMORY_LOAD_TARGETS 항목 무시: {item}")
+    return targets
+
+
+MEMORY_PROFILES = _parse_memory_targets(os.getenv('MEMORY_LOAD_TARGETS', ''))
+
+memory_ballast = MemoryBallast(
+    ramp_bytes_per_sec=int(MEMORY_RAMP_MB_PER_SEC * 1024 * 1024),
+    on_change=MEMORY_BALLAST_BYTES_GAUGE.set
+)
+
+
+def reconcile_memory_ballast():
+    """부하 담당 프로세스에서 메모리 점유 목표를 현재 상태에 맞춤"""
+    if not holds_load_generator_lock():
+        return
+    with simulation_state_lock:
+        level = current_memory_level if traffic_simulation_active else 'off'
+    target = int(POD_MEMORY_LIMIT_MB * 1024 * 1024 * MEMORY_PROFILES.get(level, 0.0) / 100.0)
+    if target == memory_ballast.target_bytes:
+        return
+    MEMORY_BALLAST_TARGET_GAUGE.set(target)
+    memory_ballast.set_target(target)
+
+# 멀티 워커 모드에서 CPU 부하는 파드당 한 프로세스만 생성 (파일 잠금 보유 프로세스)
+LOAD_GENERATOR_LOCK_PATH = os.getenv('LOAD_GENERATOR_LOCK_PATH', '/tmp/backend-load-generator.lock')
+LOAD_GENERATOR_LOCK_RETRY = float(os.getenv('LOAD_GENERATOR_LOCK_RETRY', '1.0'))
+_load_lock_fd = None
+_load_lock_pid = None
+_load_lock_guard = threading.Lock()
+
+
+def holds_load_generator_lock():
+    """현재 프로세스가 부하 생성 담당인지 확인 (담당 워커가 종료되면 다른 워커가 인수)"""
+    global _load_lock_fd, _load_lock_pid
+    with _load_lock_guard:
+        if _load_lock_fd is not None and _load_lock_pid == os.getpid():
+            return True
+        fd = None
+        try:
+            fd = os.open(LOAD_GENERATOR_LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            if fd is not None:
+                os.close(fd)
+            return False
+        _load_lock_fd = fd
+        _load_lock_pid = os.getpid()
+        return True
+
+
+def desired_load_millicores():
+    """현재 시뮬레이션 상태에 해당하는 부하 엔진 목표(millicore) - 시나리오 목표 → 클러스터 부하 몫 → 레벨 순"""
+    if not SIMULATION_ENABLED:
+        return 0.0
+    with simulation_state_lock:
+        level = current_traffic_level if traffic_simulation_active else 'off'
+        percent = scenario_target_percent
+        share = cluster_load_share_millicores
+    if percent is None and share is not None:
+        return share
+    if percent is None:
+        percent = LOAD_ENGINE_TARGETS.get(level, LOAD_ENGINE_TARGETS['off'])
+    return POD_CPU_REQUEST_MILLICORES * percent / 100.0
+
+
+def reconcile_load_engine():
+    """부하 담당 프로세스에서 엔진 목표를 현재 상태에 맞춤"""
+    if load_engine is None or not holds_load_generator_lock():
+        return
+    target = desired_load_millicores()
+    LOAD_ENGINE_TARGET_GAUGE.set(target)
+    load_engine.set_target(target)
+
+
 def _run_baseline_traffic(stop_event: threading.Event):
     """OFF 상태에서도 약간의 트래픽을 유지하여 기본 부하를 줌"""
+    if load_engine is not None:
+        # 엔진 모드: 주기적으로 목표만 맞춤 (담당 워커 교체 시 CPU/메모리 부하 인수 포함)
+        reconcile_load_engine()
+        reconcile_memory_ballast()
+        while not stop_event.wait(LOAD_GENERATOR_LOCK_RETRY):
+            reconcile_load_engine()
+            reconcile_memory_ballast()
+        return
+
     profile = BASELINE_PROFILE
     while not stop_event.is_set():
+        if not holds_load_generator_lock():
+            stop_event.wait(LOAD_GENERATOR_LOCK_RETRY)
+            continue
+        reconcile_memory_ballast()   # 담당 워커가 교체되면 새 담당이 메모리 점유를 이어받음
         for _ in range(profile['iterations']):
             sum(range(profile['range_limit']))
         time.sleep(profile['sleep'])
@@ -365,125 +1317,569 @@ def _run_traffic_simulation(level: str, stop_event: threading.Event):
     profile = TRAFFIC_PROFILES.get(level)
     if not profile:
         return
+    if load_engine is not None:
+        # 엔진 모드: 부하는 엔진 프로세스가 생성하고 이 스레드는 종료 신호만 기다림
+        reconcile_load_engine()
+        stop_event.wait()
+        return
     while not stop_event.is_set():
+        if not holds_load_generator_lock():
+            stop_event.wait(LOAD_GENERATOR_LOCK_RETRY)
+            continue
         for _ in range(profile['iterations']):
             sum(range(profile['range_limit']))
         time.sleep(profile['sleep'])
 
-def stop_active_simulation(persist: bool = True):
-    """현재 진행 중인 시뮬레이션을 종료하고 OFF 상태로 복귀"""
-    global simulation_thread, simulation_stop_event, traffic_simulation_active, current_traffic_level, emergency_mode
+def _publish_simulation_gauges():
+    """시뮬레이션 상태 게이지 갱신 (상태를 바꾼 프로세스가 바로 기록)"""
+    with simulation_state_lock:
+        active = traffic_simulation_active
+        emergency = emergency_mode
+        level = current_traffic_level
+    SIMULATION_ACTIVE_GAUGE.set(1 if active else 0)
+    EMERGENCY_MODE_GAUGE.set(1 if emergency else 0)
+    CURRENT_TRAFFIC_LEVEL_GAUGE.set(TRAFFIC_LEVEL_MAPPING.get(level, 0))
+
+
+def stop_active_simulation(persist: bool = True, record: bool = True):
+    """현재 진행 중인 시뮬레이션을 종료하고 OFF 상태로 복귀 (저장 요청 시 generation 반환)
+
+    persist=True(사용자 요청)이면 실행 중인 시나리오도 함께 취소한다.
+    record=False는 start_simulation이 레벨 전환 도중 호출할 때 사용 (전환을 한 번만 기록).
+    """
+    global simulation_thread, simulation_stop_event, traffic_simulation_active, current_traffic_level, emergency_mode
+    global current_memory_level
+
+    had_scenario = persist and cancel_load_programs()
+
+    with simulation_control_lock if persist else contextlib.nullcontext():
+        generation = None
+        with simulation_state_lock:
+            active_thread = simulation_thread
+            stop_event = simulation_stop_event
+            was_active = traffic_simulation_active
+            previous_level = current_traffic_level
+            previous_emergency = emergency_mode
+            previous_memory = current_memory_level
+
+            traffic_simulation_active = False
+            emergency_mode = False
+            current_traffic_level = 'off'
+            current_memory_level = 'off'
+            simulation_thread = None
+            simulation_stop_event = None
+            if persist and (was_active or previous_level != 'off' or previous_emergency or had_scenario):
+                generation = _next_generation_locked()
+
+        if stop_event:
+            stop_event.set()
+
+        if active_thread and active_thread.is_alive():
+            active_thread.join(timeout=1.0)
+
+        reconcile_load_engine()
+        reconcile_memory_ballast()
+        _publish_simulation_gauges()
+
+        if record and was_active:
+            scale_timeline.record_transition((previous_level, previous_memory), ('off', 'off'))
+
+    if generation is not None:
+        request_simulation_state_write()
+    return generation
+
+
+def start_simulation(level: str, emergency: bool = False, persist: bool = True, memory_level: str = 'off'):
+    """지정된 트래픽/메모리 레벨로 새로운 시뮬레이션 시작 (저장 요청 시 generation 반환)"""
+    global simulation_thread, simulation_stop_event, traffic_simulation_active, current_traffic_level, emergency_mode
+    global current_memory_level
+
+    if level not in TRAFFIC_PROFILES:
+        raise ValueError(f"Unsupported traffic level: {level}")
+    if memory_level not in MEMORY_PROFILES:
+        raise ValueError(f"Unsupported memory level: {memory_level}")
+
+    if persist:
+        cancel_load_programs()
+    with simulation_control_lock if persist else contextlib.nullcontext():
+        with simulation_state_lock:
+            previous = (current_traffic_level, current_memory_level) if traffic_simulation_active else ('off', 'off')
+        stop_active_simulation(persist=False, record=False)
+
+        stop_event = threading.Event()
+
+        if SIMULATION_ENABLED:
+            ensure_baseline_running()
+
+        new_thread = threading.Thread(
+            target=_run_traffic_simulation,
+            args=(level, stop_event),
+            daemon=True
+        )
+
+        generation = None
+        with simulation_state_lock:
+            simulation_stop_event = stop_event
+            simulation_thread = new_thread
+            current_traffic_level = level
+            current_memory_level = memory_level
+            emergency_mode = emergency
+            traffic_simulation_active = True
+            if persist:
+                generation = _next_generation_locked()
+
+        new_thread.start()
+        reconcile_memory_ballast()
+        _publish_simulation_gauges()
+        scale_timeline.record_transition(previous, (level, memory_level))
+
+    if generation is not None:
+        request_simulation_state_write()
+    return generation
+
+
+# 부하 시나리오 - 단계별 목표(레벨 또는 CPU %)와 전환(ramp) 시간을 가진 타임라인
+# 모든 레플리카가 ConfigMap의 공통 시작 시각(epoch)을 기준으로 같은 위치를 계산하여 동시에 실행한다.
+SCENARIO_TICK_INTERVAL = float(os.getenv('SCENARIO_TICK_INTERVAL', '1'))      # 목표 갱신 주기(초)
+SCENARIO_START_DELAY = float(os.getenv('SCENARIO_START_DELAY', '3'))          # 전 레플리카 전파 대기(초)
+SCENARIO_MAX_STEPS = int(os.getenv('SCENARIO_MAX_STEPS', '100'))
+SCENARIO_MAX_SECONDS = float(os.getenv('SCENARIO_MAX_SECONDS', '21600'))     # 전체 길이 상한 (6시간)
+
+SCENARIO_LIMITS = ScenarioLimits(
+    LOAD_ENGINE_TARGETS, MEMORY_PROFILES, LOAD_ENGINE_MAX_MILLICORES, POD_CPU_REQUEST_MILLICORES,
+    max_steps=SCENARIO_MAX_STEPS, max_seconds=SCENARIO_MAX_SECONDS
+)
 
-    with simulation_state_lock:
-        active_thread = simulation_thread
-        stop_event = simulation_stop_event
-        was_active = traffic_simulation_active
-        previous_level = current_traffic_level
-        previous_emergency = emergency_mode
 
-        traffic_simulation_active = False
-        emergency_mode = False
-        current_traffic_level = 'off'
-        simulation_thread = None
-        simulation_stop_event = None
+def level_for_percent(percent):
+    """CPU 목표에 가장 가까운 트래픽 레벨 (부하 엔진이 없을 때의 스레드 부하 프로파일 선택)"""
+    return min(TRAFFIC_LEVEL_MAPPING, key=lambda level: abs(LOAD_ENGINE_TARGETS.get(level, 0.0) - percent))
 
-    if stop_event:
-        stop_event.set()
 
-    if active_thread and active_thread.is_alive():
-        active_thread.join(timeout=1.0)
+def _apply_scenario_position(runner, position):
+    """시나리오 위치를 로컬 시뮬레이션 상태/부하 엔진 목표에 반영 (ConfigMap에는 기록하지 않음)
 
-    if persist and (was_active or previous_level != 'off' or previous_emergency):
-        persist_simulation_state()
+    runner가 이미 취소되었으면 아무것도 바꾸지 않고 False 반환.
+    """
+    global scenario_target_percent
 
+    finished = position['finished']
+    # 취소(cancel_scenario)와 직렬화 - 사용자가 중지한 뒤에 목표를 되살리거나 부하를 다시 켜지 않도록
+    with load_program_lock:
+        with simulation_state_lock:
+            if scenario_runner is not runner:
+                return False
+            scenario_target_percent = None if finished else position['cpu_percent']
 
-def start_simulation(level: str, emergency: bool = False, persist: bool = True):
-    """지정된 트래픽 레벨로 새로운 시뮬레이션 시작"""
-    global simulation_thread, simulation_stop_event, traffic_simulation_active, current_traffic_level, emergency_mode
+        SCENARIO_ACTIVE_GAUGE.set(0 if finished else 1)
+        SCENARIO_STEP_GAUGE.set(position['index'])
+        SCENARIO_PROGRESS_GAUGE.labels(scope='total').set(position['progress'])
+        SCENARIO_PROGRESS_GAUGE.labels(scope='step').set(position['step_progress'])
+        SCENARIO_TARGET_GAUGE.set(0 if finished else position['cpu_percent'])
+        _apply_load_target(None if finished else position['cpu_percent'], position['memory_level'])
+    return True
 
-    if level not in TRAFFIC_PROFILES:
-        raise ValueError(f"Unsupported traffic level: {level}")
 
-    stop_active_simulation(persist=False)
+def _apply_load_target(percent, memory_level='off'):
+    """CPU 목표(요청량 대비 %, None이면 OFF)를 로컬 시뮬레이션 상태와 부하 엔진에 반영
 
-    stop_event = threading.Event()
+    스레드 부하는 가장 가까운 레벨 단위로만 바뀌고, 부하 엔진은 매번 연속 목표를 따른다.
+    메모리 부하는 시뮬레이션이 활성(레벨이 off가 아님)인 동안에만 유지한다.
+    """
+    with simulation_state_lock:
+        active, level, memory = traffic_simulation_active, current_traffic_level, current_memory_level
 
-    if SIMULATION_ENABLED:
-        ensure_baseline_running()
+    desired_level = 'off' if percent is None else level_for_percent(percent)
+    if desired_level == 'off':
+        if active:
+            stop_active_simulation(persist=False)
+            if SIMULATION_ENABLED:
+                ensure_baseline_running()
+    elif not active or desired_level != level or memory_level != memory:
+        start_simulation(desired_level, persist=False, memory_level=memory_level)
+    reconcile_load_engine()
+
+
+def _scenario_start_time(started_at):
+    return scenario_start_time(started_at, SCENARIO_MAX_SECONDS)
+
+
+def start_scenario(scenario, started_at=None, persist=True):
+    """시나리오 실행 시작 (started_at: 공통 시작 시각 epoch, 저장 요청 시 generation 반환)"""
+    global scenario_runner
 
-    new_thread = threading.Thread(
-        target=_run_traffic_simulation,
-        args=(level, stop_event),
-        daemon=True
+    cancel_load_programs()
+    runner = ScenarioRunner(
+        scenario, time.time() + SCENARIO_START_DELAY if started_at is None else started_at,
+        apply=_apply_scenario_position, tick_interval=SCENARIO_TICK_INTERVAL
     )
+    with simulation_control_lock if persist else contextlib.nullcontext():
+        generation = None
+        with simulation_state_lock:
+            scenario_runner = runner
+            if persist:
+                generation = _next_generation_locked()
+        if SIMULATION_ENABLED:
+            ensure_baseline_running()
+        runner.start()
+
+    if generation is not None:
+        request_simulation_state_write()
+    return generation
+
+
+def cancel_scenario():
+    """실행 중인 시나리오 취소 (현재 부하 상태는 그대로 두고, 취소했으면 True)"""
+    global scenario_runner, scenario_target_percent
+
+    with load_program_lock, simulation_state_lock:
+        runner = scenario_runner
+        scenario_runner = None
+        scenario_target_percent = None
+    if runner is None:
+        return False
+    runner.stop()
+    SCENARIO_ACTIVE_GAUGE.set(0)
+    SCENARIO_TARGET_GAUGE.set(0)
+    return True
+
+
+# 클러스터 전체 부하 모드 - 목표를 파드별 고정값이 아닌 클러스터 총수요로 지정하고 살아있는 레플리카가 나눠 맡음
+# (레플리카가 늘면 파드당 부하가 줄어 HPA가 실제 트래픽처럼 수렴)
+# 멤버십: 각 파드가 준비 완료 후 자신의 Lease를 주기적으로 갱신하고, 갱신 시각이 만료되지 않은 Lease 수를 레플리카 수로 봄
+MEMBERSHIP_LEASE_PREFIX = os.getenv('MEMBERSHIP_LEASE_PREFIX', 'backend-member-')
+MEMBERSHIP_HEARTBEAT_INTERVAL = float(os.getenv('MEMBERSHIP_HEARTBEAT_INTERVAL', '5'))
+MEMBERSHIP_LEASE_TTL = int(os.getenv('MEMBERSHIP_LEASE_TTL', '15'))          # 갱신 없이 멤버로 인정하는 시간(초)
+MEMBERSHIP_LEASE_GC_AFTER = float(os.getenv('MEMBERSHIP_LEASE_GC_AFTER', '600'))  # 만료 후 Lease 삭제까지(초)
+CLUSTER_LOAD_MILLICORES_PER_RPS = float(os.getenv('CLUSTER_LOAD_MILLICORES_PER_RPS', '2'))  # 가상 요청 1 RPS당 CPU
+
+
+replica_membership = ReplicaMembership(
+    socket.gethostname(), MEMBERSHIP_LEASE_TTL, namespace=K8S_NAMESPACE, lease_prefix=MEMBERSHIP_LEASE_PREFIX,
+    gc_after=MEMBERSHIP_LEASE_GC_AFTER, on_members=CLUSTER_MEMBERS_GAUGE.set
+)
+membership_thread = None
+
+
+def _membership_loop():
+    """하트비트/멤버 목록 갱신 후 클러스터 부하 몫 재계산"""
+    while True:
+        try:
+            replica_membership.heartbeat()
+            replica_membership.refresh()
+        except ApiException as exc:
+            print(f"멤버십 Lease 갱신 실패: {exc}")
+        except Exception as exc:
+            print(f"멤버십 갱신 오류: {exc}")
+        try:
+            apply_cluster_load_share()
+        except Exception as exc:
+            print(f"클러스터 부하 몫 반영 실패: {exc}")
+        time.sleep(MEMBERSHIP_HEARTBEAT_INTERVAL)
+
+
+def cluster_load_target_from(total_millicores=None, virtual_rps=None):
+    """총 CPU(millicore) 또는 가상 RPS로 클러스터 부하 목표 생성 (잘못된 값은 ValueError)"""
+    if virtual_rps is not None:
+        virtual_rps = float(virtual_rps)
+        if virtual_rps < 0:
+            raise ValueError('virtual_rps must not be negative')
+        total = virtual_rps * CLUSTER_LOAD_MILLICORES_PER_RPS
+    elif total_millicores is not None:
+        total = float(total_millicores)
+    else:
+        raise ValueError('total_millicores or virtual_rps is required')
+    if not 0 < total <= LOAD_ENGINE_MAX_MILLICORES * 1000:
+        raise ValueError('total demand must be positive and at most 1000 pods worth of load engine capacity')
+    return {'total_millicores': total, 'virtual_rps': virtual_rps}
+
 
+def apply_cluster_load_share():
+    """클러스터 총수요 / 살아있는 레플리카 수 만큼을 이 파드의 부하 목표로 반영"""
+    global cluster_load_share_millicores
+
+    # 취소(cancel_cluster_load)와 직렬화 - 사용자가 중지한 뒤에 몫을 되살리거나 부하를 다시 켜지 않도록
+    with load_program_lock:
+        with simulation_state_lock:
+            target = cluster_load_target
+            if target is None:
+                return None
+            members = max(replica_membership.member_count(), 1)
+            share = min(target['total_millicores'] / members, LOAD_ENGINE_MAX_MILLICORES)
+            cluster_load_share_millicores = share
+        CLUSTER_LOAD_TOTAL_GAUGE.set(target['total_millicores'])
+        CLUSTER_LOAD_SHARE_GAUGE.set(share)
+        _apply_load_target(share / POD_CPU_REQUEST_MILLICORES * 100.0)
+    return share
+
+
+def start_cluster_load(target, persist=True):
+    """클러스터 전체 부하 모드 시작 (저장 요청 시 generation 반환)"""
+    global cluster_load_target
+
+    cancel_load_programs()
+    with simulation_control_lock if persist else contextlib.nullcontext():
+        generation = None
+        with simulation_state_lock:
+            cluster_load_target = dict(target)
+            if persist:
+                generation = _next_generation_locked()
+        if SIMULATION_ENABLED:
+            ensure_baseline_running()
+        apply_cluster_load_share()
+
+    if generation is not None:
+        request_simulation_state_write()
+    return generation
+
+
+def cancel_cluster_load():
+    """클러스터 전체 부하 모드 해제 (현재 부하 상태는 그대로 두고, 해제했으면 True)"""
+    global cluster_load_target, cluster_load_share_millicores
+
+    with load_program_lock, simulation_state_lock:
+        target = cluster_load_target
+        cluster_load_target = None
+        cluster_load_share_millicores = None
+    if target is None:
+        return False
+    CLUSTER_LOAD_TOTAL_GAUGE.set(0)
+    CLUSTER_LOAD_SHARE_GAUGE.set(0)
+    return True
+
+
+def cancel_load_programs():
+    """시나리오/클러스터 부하 모드처럼 정적 레벨 위에서 동작하는 부하 제어를 모두 해제"""
+    cancelled_scenario = cancel_scenario()
+    cancelled_cluster = cancel_cluster_load()
+    return cancelled_scenario or cancelled_cluster
+
+
+def cluster_load_status():
     with simulation_state_lock:
-        simulation_stop_event = stop_event
-        simulation_thread = new_thread
-        current_traffic_level = level
-        emergency_mode = emergency
-        traffic_simulation_active = True
+        target = cluster_load_target
+        share = cluster_load_share_millicores
+    if target is None:
+        return None
+    return {
+        'total_millicores': target['total_millicores'],
+        'virtual_rps': target['virtual_rps'],
+        'share_millicores': round(share, 1) if share is not None else None,
+        'share_percent_of_request': round(share / POD_CPU_REQUEST_MILLICORES * 100.0, 1) if share is not None else None,
+        'members': replica_membership.member_count()
+    }
 
-    new_thread.start()
 
-    if persist:
-        persist_simulation_state()
+# 스케일 반응 타임라인 - 시뮬레이션 전환 시각과 Deployment 레플리카 수 변화를 기록하여
+# 전환 → 첫 새 파드 Ready / 축소 시작 / 안정 상태까지 걸린 시간을 측정 (HPA behavior 튜닝 효과 비교용)
+SCALE_TIMELINE_DEPLOYMENT = os.getenv('SCALE_TIMELINE_DEPLOYMENT', 'backend-deployment')
+SCALE_TIMELINE_POLL_INTERVAL = float(os.getenv('SCALE_TIMELINE_POLL_INTERVAL', '3'))     # 전환 추적 중 조회 주기(초)
+SCALE_TIMELINE_IDLE_INTERVAL = float(os.getenv('SCALE_TIMELINE_IDLE_INTERVAL', '30'))    # 추적할 전환이 없을 때(초)
+SCALE_TIMELINE_STEADY_WINDOW = float(os.getenv('SCALE_TIMELINE_STEADY_WINDOW', '60'))    # 변화 없이 유지되어야 안정으로 판단(초)
+SCALE_TIMELINE_MAX_SECONDS = float(os.getenv('SCALE_TIMELINE_MAX_SECONDS', '900'))       # 전환별 추적 상한(초)
+SCALE_TIMELINE_HISTORY = int(os.getenv('SCALE_TIMELINE_HISTORY', '20'))
+
+
+def transition_demand(state):
+    """(트래픽 레벨, 메모리 레벨) 전환의 부하 크기 - (CPU 목표 %, 메모리 목표 %)"""
+    level, memory = state
+    return (LOAD_ENGINE_TARGETS.get(level, LOAD_ENGINE_TARGETS['off']), MEMORY_PROFILES.get(memory, 0.0))
+
+
+def _observe_scale_result(direction, phase, seconds):
+    SCALE_REACTION_SECONDS.labels(direction=direction, phase=phase).observe(seconds)
+
+
+def _reports_scale_results():
+    # 모든 워커/파드가 같은 Deployment를 관측하므로 히스토그램은 전환 시점의 대표 파드 한 프로세스만 기록
+    return holds_load_generator_lock() and replica_membership.is_leader()
+
+
+scale_timeline = ScaleTimelineRecorder(
+    transition_demand, namespace=K8S_NAMESPACE, deployment=SCALE_TIMELINE_DEPLOYMENT,
+    on_result=_observe_scale_result, should_report=_reports_scale_results, history=SCALE_TIMELINE_HISTORY,
+    steady_window=SCALE_TIMELINE_STEADY_WINDOW, max_seconds=SCALE_TIMELINE_MAX_SECONDS
+)
+scale_timeline_thread = None
+
+
+def _scale_timeline_loop():
+    """전환 추적 중에는 짧은 주기로, 그 외에는 기준값 유지용으로 드물게 Deployment 조회"""
+    while True:
+        try:
+            scale_timeline.poll_once()
+        except Exception as exc:
+            print(f"스케일 타임라인 갱신 오류: {exc}")
+        interval = SCALE_TIMELINE_POLL_INTERVAL if scale_timeline.tracking() else SCALE_TIMELINE_IDLE_INTERVAL
+        scale_timeline.wake.wait(interval)
+        scale_timeline.wake.clear()
 
 
 def _apply_desired_state(desired_state):
-    """ConfigMap에서 읽은 상태를 로컬에 반영"""
+    """ConfigMap에서 읽은 상태를 로컬에 반영
+
+    로컬보다 오래된 generation이나, 아직 기록되지 않은 로컬 변경이 있을 때의 원격 상태는 무시한다
+    (기록되면 그 값이 다시 watch로 돌아옴). 사용자 변경과 겹치지 않도록 simulation_control_lock 안에서 반영.
+    """
     if desired_state is None:
         return
+    with simulation_control_lock:
+        _apply_desired_state_locked(desired_state)
+
+
+def _adopt_remote_order(desired_state):
+    """원격 상태를 반영한 뒤 그 generation과 요청 순서를 로컬 기준으로 삼음"""
+    global simulation_generation, simulation_requested_at, simulation_requested_by
+    with simulation_state_lock:
+        simulation_generation = max(simulation_generation, desired_state.get('generation', 0))
+        simulation_requested_at, simulation_requested_by = sim_state.request_order(desired_state)
+
+
+def _apply_desired_state_locked(desired_state):
 
     desired_active = desired_state.get('simulation_active', False)
     desired_level = desired_state.get('traffic_level', 'off')
     desired_emergency = desired_state.get('emergency_mode', False)
+    desired_memory = desired_state.get('memory_level', 'off')
+    desired_generation = desired_state.get('generation', 0)
+    if desired_memory not in MEMORY_PROFILES:
+        desired_memory = 'off'
 
     with simulation_state_lock:
         current_active = traffic_simulation_active
         current_level = current_traffic_level
         current_emergency = emergency_mode
+        current_memory = current_memory_level
+        current_generation = simulation_generation
+        pending_generation = simulation_pending_generation
+
+    if pending_generation or desired_generation < current_generation:
+        return
+
+    # 시나리오가 있으면 정적 레벨 대신 시나리오가 로컬 상태를 결정
+    desired_scenario = desired_state.get('scenario')
+    runner = scenario_runner
+    if desired_scenario is not None:
+        started_at = desired_state.get('scenario_started_at')
+        if runner is None or runner.started_at != started_at or runner.scenario.to_json() != desired_scenario.to_json():
+            start_scenario(desired_scenario, started_at, persist=False)
+        _adopt_remote_order(desired_state)
+        return
+    if runner is not None:
+        cancel_scenario()
+
+    desired_cluster = desired_state.get('cluster_load')
+    if desired_cluster is not None:
+        if cluster_load_target != desired_cluster:
+            start_cluster_load(desired_cluster, persist=False)
+        _adopt_remote_order(desired_state)
+        return
+    if cluster_load_target is not None:
+        cancel_cluster_load()
 
     if not desired_active:
         if current_active or current_level != 'off' or current_emergency:
             stop_active_simulation(persist=False)
             if SIMULATION_ENABLED:
                 ensure_baseline_running()
-        return
+    elif (not current_active) or current_level != desired_level or current_emergency != desired_emergency \
+            or current_memory != desired_memory:
+        start_simulation(desired_level, emergency=desired_emergency, persist=False, memory_level=desired_memory)
+
+    _adopt_remote_order(desired_state)
 
-    if (not current_active) or current_level != desired_level or current_emergency != desired_emergency:
-        start_simulation(desired_level, emergency=desired_emergency, persist=False)
+
+def _apply_config_map(config_map):
+    """watch/list로 받은 ConfigMap을 로컬 상태에 반영하고 resourceVersion 기록"""
+    global simulation_state_resource_version, simulation_state_synced_at
+    _apply_desired_state(_strings_to_state(config_map.data or {}))
+    simulation_state_resource_version = config_map.metadata.resource_version
+    simulation_state_synced_at = datetime.now().isoformat()
 
 
 def _simulation_state_sync_loop():
-    """ConfigMap 상태를 주기적으로 동기화"""
+    """ConfigMap watch로 상태 변경을 즉시 반영 (끊기면 backoff 후 재연결)"""
+    backoff = sim_state.WatchBackoff(maximum=SIM_STATE_WATCH_BACKOFF_MAX)
+    resource_version = None
+    field_selector = f"metadata.name={SIM_STATE_CONFIGMAP_NAME}"
+
     while True:
         if not k8s_enabled:
             time.sleep(SIM_STATE_SYNC_INTERVAL)
             continue
 
-        state = fetch_simulation_state()
-        if state:
-            _apply_desired_state(state)
-
-        time.sleep(SIM_STATE_SYNC_INTERVAL)
+        try:
+            if resource_version is None:
+                # 최초 또는 resourceVersion 만료(410) 시 전체 상태를 다시 읽음
+                config_map = k8s_core_v1.read_namespaced_config_map(SIM_STATE_CONFIGMAP_NAME, K8S_NAMESPACE)
+                _apply_config_map(config_map)
+                resource_version = config_map.metadata.resource_version
+
+            stream = k8s_watch.Watch().stream(
+                k8s_core_v1.list_namespaced_config_map,
+                K8S_NAMESPACE,
+                field_selector=field_selector,
+                resource_version=resource_version,
+                timeout_seconds=SIM_STATE_WATCH_TIMEOUT
+            )
+            error_event = False
+            for event in stream:
+                event_type = event['type']
+                config_map = event['object']
+                if event_type == 'ERROR':
+                    code = config_map.get('code') if isinstance(config_map, dict) else None
+                    if code == 410:
+                        resource_version = None
+                    else:
+                        error_event = True
+                    print(f"시뮬레이션 상태 watch 오류 이벤트: {config_map}")
+                    break
+                resource_version = config_map.metadata.resource_version
+                if event_type == 'DELETED':
+                    _apply_desired_state(sim_state.default_state())
+                elif event_type in ('ADDED', 'MODIFIED'):
+                    _apply_config_map(config_map)
+            if error_event:
+                # 403/500 등이 계속되면 예외와 같이 backoff (즉시 재연결하면 API 서버에 요청이 몰림)
+                delay = backoff.failed()
+                print(f"시뮬레이션 상태 watch {delay:.0f}s 후 재연결")
+                time.sleep(delay)
+                continue
+            backoff.reset()
+        except ApiException as exc:
+            if exc.status == 410:
+                resource_version = None
+                continue
+            if exc.status == 404:
+                ensure_simulation_configmap()
+                resource_version = None
+            delay = backoff.failed()
+            print(f"시뮬레이션 상태 watch 실패: {exc} ({delay:.0f}s 후 재시도)")
+            time.sleep(delay)
+        except Exception as exc:
+            delay = backoff.failed()
+            print(f"시뮬레이션 상태 watch 연결 끊김: {exc} ({delay:.0f}s 후 재시도)")
+            time.sleep(delay)
 
 
 def bootstrap_simulation_state_sync():
-    """Kubernetes 클라이언트 초기화 및 동기화 스레드 시작"""
-    global k8s_enabled, k8s_core_v1, simulation_state_sync_thread
+    """Kubernetes 클라이언트 초기화 및 동기화/저장 스레드 시작 (시작하면 True, 클러스터 밖이면 False)"""
+    global k8s_enabled, k8s_core_v1, k8s_coordination_v1, k8s_apps_v1, simulation_state_sync_thread, simulation_state_writer_thread
 
-    if k8s_client is None or k8s_config is None:
-        return
+    if not _load_kubernetes():
+        print("kubernetes 패키지를 불러올 수 없음 - ConfigMap/Lease/Secret 연동 비활성화")
+        return False
 
     try:
         k8s_config.load_incluster_config()
         k8s_core_v1 = k8s_client.CoreV1Api()
+        k8s_coordination_v1 = k8s_client.CoordinationV1Api()
+        k8s_apps_v1 = k8s_client.AppsV1Api()
         k8s_enabled = True
     except (ConfigException, ApiException) as exc:
         print(f"Kubernetes 클라이언트 초기화 실패: {exc}")
         k8s_enabled = False
-        return
+        return False
 
     ensure_simulation_configmap()
     state = fetch_simulation_state()
@@ -497,20 +1893,14 @@ def bootstrap_simulation_state_sync():
         )
         simulation_state_sync_thread.start()
 
+    if simulation_state_writer_thread is None:
+        simulation_state_writer_thread = threading.Thread(
+            target=_simulation_state_writer_loop,
+            daemon=True
+        )
+        simulation_state_writer_thread.start()
+    return True
 
-def refresh_simulation_state_from_store():
-    """필요 시 ConfigMap 상태를 즉시 동기화"""
-    if not k8s_enabled:
-        return
-    state = fetch_simulation_state()
-    if state:
-        _apply_desired_state(state)
-
-
-if SIMULATION_ENABLED:
-    ensure_baseline_running()
-
-bootstrap_simulation_state_sync()
 
 # 긴급 상황별 트래픽 레벨 (3단계 + OFF 상태)
 emergency_traffic_levels = {
@@ -527,7 +1917,18 @@ def home():
     return f'<h1>주식 모니터링 백엔드</h1><p>서버: {socket.gethostname()}</p><p>상태: 정상</p>'
 
 
-# 헬스체크 엔드포인트 - Kubernetes liveness/readiness probe용
+# 준비 상태 엔드포인트 - Kubernetes readiness probe용
+@app.route('/api/ready')
+def ready():
+    """readiness probe - 워밍업 완료(또는 마감 시간 경과) 후에만 200"""
+    pipeline = startup_pipeline
+    if pipeline is None:
+        return jsonify({'ready': False, 'phase': 'not_started'}), 503
+    status = pipeline.status()
+    return jsonify(status), 200 if status['ready'] else 503
+
+
+# 헬스체크 엔드포인트 - Kubernetes liveness probe용
 @app.route('/api/health')
 def health():
     
@@ -553,15 +1954,17 @@ def simulate_traffic_endpoint():
     data = request.get_json(silent=True) or {}
     scenario = data.get('scenario', 'manual_trigger')
     traffic_level = (data.get('traffic_level') or '').lower()
+    memory_level = (data.get('memory_level') or 'off').lower()
 
     if traffic_level in ('off', 'normal', ''):
-        stop_active_simulation()
+        generation = stop_active_simulation()
         ensure_baseline_running()
         return jsonify({
             'success': True,
             'message': '트래픽 시뮬레이션이 OFF 상태로 전환되었습니다.',
             'scenario': scenario,
             'traffic_level': current_traffic_level,
+            'generation': generation or simulation_generation,
             'timestamp': datetime.now().isoformat()
         })
 
@@ -572,14 +1975,23 @@ def simulate_traffic_endpoint():
             'timestamp': datetime.now().isoformat()
         }), 400
 
+    if memory_level not in MEMORY_PROFILES:
+        return jsonify({
+            'success': False,
+            'message': f'지원하지 않는 메모리 레벨입니다: {memory_level}',
+            'timestamp': datetime.now().isoformat()
+        }), 400
+
     ensure_baseline_running()
-    start_simulation(traffic_level, emergency=False)
+    generation = start_simulation(traffic_level, emergency=False, memory_level=memory_level)
 
     return jsonify({
         'success': True,
         'message': f'트래픽 시뮬레이션 시작: {scenario}',
         'scenario': scenario,
         'traffic_level': traffic_level,
+        'memory_level': memory_level,
+        'generation': generation,
         'timestamp': datetime.now().isoformat()
     })
 
@@ -593,12 +2005,13 @@ def stop_simulation():
             'timestamp': datetime.now().isoformat()
         })
 
-    stop_active_simulation()
+    generation = stop_active_simulation()
     ensure_baseline_running()
 
     return jsonify({
         'success': True,
         'message': '트래픽 시뮬레이션 중지됨',
+        'generation': generation or simulation_generation,
         'timestamp': datetime.now().isoformat()
     })
 
@@ -614,6 +2027,7 @@ def emergency_simulation():
 
     data = request.get_json(silent=True) or {}
     emergency_type = data.get('emergency_type', 'emergency_news')
+    memory_level = (data.get('memory_level') or 'off').lower()
 
     if emergency_type not in emergency_traffic_levels:
         return jsonify({
@@ -622,9 +2036,16 @@ def emergency_simulation():
             'timestamp': datetime.now().isoformat()
         }), 400
 
+    if memory_level not in MEMORY_PROFILES:
+        return jsonify({
+            'success': False,
+            'message': f'지원하지 않는 메모리 레벨입니다: {memory_level}',
+            'timestamp': datetime.now().isoformat()
+        }), 400
+
     traffic_level = emergency_traffic_levels[emergency_type]
     ensure_baseline_running()
-    start_simulation(traffic_level, emergency=True)
+    generation = start_simulation(traffic_level, emergency=True, memory_level=memory_level)
 
     emergency_messages = {
         'emergency_news': '긴급 뉴스 발생 - 높은 트래픽 시뮬레이션',
@@ -637,6 +2058,75 @@ def emergency_simulation():
         'message': emergency_messages.get(emergency_type, '긴급 상황 시뮬레이션 시작'),
         'emergency_type': emergency_type,
         'traffic_level': traffic_level,
+        'memory_level': memory_level,
+        'generation': generation,
+        'timestamp': datetime.now().isoformat()
+    })
+
+# 부하 시나리오 실행 API - 전 레플리카가 같은 시작 시각 기준으로 단계별 부하를 재현
+# 예: {"preset": "spike"} 또는 {"name": "step-up", "repeat": 2, "steps": [{"traffic_level": "medium", "ramp": 60, "duration": 120}]}
+@app.route('/api/simulation-scenario', methods=['POST'])
+def simulation_scenario():
+    if not SIMULATION_ENABLED:
+        return jsonify({
+            'success': False,
+            'message': '트래픽 시뮬레이션이 비활성화된 상태입니다 (SIMULATION_ENABLED=false).',
+            'timestamp': datetime.now().isoformat()
+        }), 503
+
+    data = request.get_json(silent=True) or {}
+    try:
+        scenario = TrafficScenario.from_spec(data, SCENARIO_LIMITS)
+        start_delay = float(data.get('start_delay', SCENARIO_START_DELAY))
+        if not 0 <= start_delay <= SCENARIO_MAX_SECONDS:   # NaN도 여기서 걸러짐
+            raise ValueError(f'start_delay must be between 0 and {SCENARIO_MAX_SECONDS:.0f} seconds')
+    except (TypeError, ValueError) as exc:
+        return jsonify({
+            'success': False,
+            'message': f'잘못된 시나리오 정의입니다: {exc}',
+            'available_presets': sorted(SCENARIO_PRESETS),
+            'timestamp': datetime.now().isoformat()
+        }), 400
+
+    generation = start_scenario(scenario, time.time() + start_delay)
+    runner = scenario_runner
+
+    return jsonify({
+        'success': True,
+        'message': f'부하 시나리오 시작: {scenario.name}',
+        'scenario': runner.status() if runner else None,
+        'generation': generation,
+        'timestamp': datetime.now().isoformat()
+    })
+
+# 클러스터 전체 부하 API - 총수요를 살아있는 레플리카 수로 나눠 각 파드가 맡음
+# 예: {"total_millicores": 3000} 또는 {"virtual_rps": 1500}
+@app.route('/api/simulate-cluster-load', methods=['POST'])
+def simulate_cluster_load():
+    if not SIMULATION_ENABLED:
+        return jsonify({
+            'success': False,
+            'message': '트래픽 시뮬레이션이 비활성화된 상태입니다 (SIMULATION_ENABLED=false).',
+            'timestamp': datetime.now().isoformat()
+        }), 503
+
+    data = request.get_json(silent=True) or {}
+    try:
+        target = cluster_load_target_from(data.get('total_millicores'), data.get('virtual_rps'))
+    except (TypeError, ValueError) as exc:
+        return jsonify({
+            'success': False,
+            'message': f'잘못된 클러스터 부하 목표입니다: {exc}',
+            'timestamp': datetime.now().isoformat()
+        }), 400
+
+    generation = start_cluster_load(target)
+
+    return jsonify({
+        'success': True,
+        'message': f"클러스터 전체 부하 시작: {target['total_millicores']:.0f}m",
+        'cluster_load': cluster_load_status(),
+        'generation': generation,
         'timestamp': datetime.now().isoformat()
     })
 
@@ -665,69 +2155,268 @@ def toggle_auto_mode():
 @app.route('/api/simulation-status', methods=['GET'])
 def get_simulation_status():
     baseline_running = baseline_thread is not None and baseline_thread.is_alive() and not baseline_stop_event.is_set()
+    runner = scenario_runner
 
     return jsonify({
         'active': traffic_simulation_active,
         'traffic_level': current_traffic_level,
         'emergency_mode': emergency_mode,
+        'memory_level': current_memory_level,
+        'memory_ballast_bytes': memory_ballast.allocated_bytes,
         'auto_mode_enabled': False,
         'baseline_active': baseline_running,
+        'demand_forecast': demand_forecaster.status(),
+        'scenario': runner.status() if runner else None,
+        'cluster_load': cluster_load_status(),
+        'membership': replica_membership.status(),
+        'generation': simulation_generation,
+        'state_resource_version': simulation_state_resource_version,
+        'state_synced_at': simulation_state_synced_at,
         'current_time': datetime.now().strftime('%H:%M:%S'),
         'timestamp': datetime.now().isoformat()
     })
 
+# 스케일 반응 타임라인 API - 최근 시뮬레이션 전환별 레플리카 변화와 측정값(초)
+@app.route('/api/scale-timeline', methods=['GET'])
+def get_scale_timeline():
+    return jsonify(dict(scale_timeline.timeline(), timestamp=datetime.now().isoformat()))
+
 
 
 # 주식 가격 조회 함수 (KIS API + 폴백)
-def get_real_stock_price(symbol):
-    """KIS API를 사용하여 실제 주식 가격 조회"""
+def _mock_stock_price(symbol):
+    """기준 가격 ±2% 범위의 모의 가격 생성"""
+    base_price = fallback_prices.get(symbol, 50000.0)
+    return base_price + random.uniform(-base_price * 0.02, base_price * 0.02)
+
+
+def _load_live_price(symbol, priority=PRIORITY_BULK):
+    """KIS API 조회 후 성공한 가격을 마지막 정상 가격으로 기록"""
+    price = kis_client.get_stock_price(symbol, priority=priority)
+    if price:
+        last_known_good[symbol] = (price, time.time())
+    return price
+
+
+def _fallback_quote(symbol):
+    """마지막 정상 가격 → 없으면 모의 가격 순으로 대체값 반환 (항상 stale=True)"""
+    known = last_known_good.get(symbol)
+    if known:
+        return known[0], True, time.time() - known[1]
+    print(f"KIS API 실패, 모의 데이터 사용: {symbol}")
+    # 모의 가격은 실제 시세가 아니므로 stale로 표시 (호출 측이 변동률/이력 계산을 건너뜀)
+    return _mock_stock_price(symbol), True, None
+
+
+def get_stock_quote(symbol, refresh=False, priority=PRIORITY_BULK):
+    """가격 조회 결과를 (price, stale, age_seconds)로 반환 (refresh=True면 캐시를 건너뛰고 갱신)"""
     try:
-        # KIS API로 주식 가격 조회 시도
-        price = kis_client.get_stock_price(symbol)
+        # KIS API로 주식 가격 조회 시도 (캐시 및 동시 조회 병합)
+        loader = lambda sym: _load_live_price(sym, priority=priority)
+        if refresh:
+            price = quote_cache.refresh(symbol, loader)
+        else:
+            price = quote_cache.get(symbol, loader)
         if price:
-            return price
+            return price, False, None
         
-        # KIS API 실패 시 폴백: 모의 데이터 사용
-        print(f"KIS API 실패, 모의 데이터 사용: {symbol}")
-        fallback_prices = {
-            '005380': 252000,   # 현대차
-            '000270': 98000,    # 기아
-            '005930': 57900,    # 삼성전자
-            '000660': 135000,   # SK하이닉스
-            '373220': 420000,   # LG에너지솔루션
-            '035420': 210000,   # NAVER
-            '012450': 180000,   # 한화에어로스페이스
-            '034020': 18500,    # 두산에너빌리티
-            '105560': 68000,    # KB금융
-            '042660': 35000,    # 한화오션
-            '032830': 98000,    # 삼성생명
-            '035720': 45000     # 카카오
-        }
-        base_price = fallback_prices.get(symbol, 50000.0)
-        return base_price + random.uniform(-base_price * 0.02, base_price * 0.02)
+        # KIS API 실패/서킷 open 시 폴백
+        return _fallback_quote(symbol)
             
     except Exception as e:
         print(f"주식 가격 조회 오류 ({symbol}): {e}")
-        # 오류 시 기본 모의 데이터 반환
-        base_prices = {
-            '005380': 252000,
-            '000270': 98000,
-            '005930': 57900,
-            '000660': 135000,
-            '373220': 420000,
-            '035420': 210000,
-            '012450': 180000,
-            '034020': 18500,
-            '105560': 68000,
-            '042660': 35000,
-            '032830': 98000,
-            '035720': 45000
-        }
-        base_price = base_prices.get(symbol, 50000.0)
-        return base_price + random.uniform(-base_price * 0.02, base_price * 0.02)
+        return _fallback_quote(symbol)
+
+
+def get_real_stock_price(symbol, refresh=False, priority=PRIORITY_BULK):
+    """KIS API를 사용하여 실제 주식 가격 조회"""
+    return get_stock_quote(symbol, refresh=refresh, priority=priority)[0]
+
+
+def _timed_stock_quote(symbol, refresh=False, priority=PRIORITY_BULK):
+    """가격 조회 결과와 소요 시간(초)을 함께 반환 (스레드 풀 작업 단위)"""
+    started = time.perf_counter()
+    with QUOTE_FETCH_THREADS_BUSY.track_inprogress():
+        price, stale, age = get_stock_quote(symbol, refresh=refresh, priority=priority)
+    return price, stale, age, time.perf_counter() - started
+
+
+def fetch_stock_prices(symbols, deadline=STOCK_DATA_DEADLINE, refresh=False, priority=PRIORITY_BULK):
+    """여러 종목을 동시에 조회하고 전체 마감 시간 내 결과만 수집
+
+    반환값: {symbol: (price, latency_seconds, stale, age_seconds)}
+    마감 시간을 넘긴 종목은 마지막 정상 가격(없으면 직전/모의 가격)으로 채우고 stale=True로 표시한다.
+    """
+    started = time.perf_counter()
+    futures = {
+        quote_fetch_executor.submit(_timed_stock_quote, symbol, refresh, priority): symbol
+        for symbol in symbols
+    }
+    done, not_done = wait_futures(futures, timeout=deadline)
+
+    results = {}
+    for future in done:
+        symbol = futures[future]
+        try:
+            price, stale, age, latency = future.result()
+            results[symbol] = (price, latency, stale, age)
+        except Exception as e:
+            print(f"주식 가격 조회 오류 ({symbol}): {e}")
+            price, _, age = _fallback_quote(symbol)
+            results[symbol] = (price, time.perf_counter() - started, True, age)
+
+    for future in not_done:
+        symbol = futures[future]
+        # 아직 시작하지 않은 조회는 취소 (느린 업스트림에서 요청마다 대기열이 쌓이지 않도록)
+        # 이미 실행 중인 조회는 끝까지 진행되어 캐시를 채움
+        future.cancel()
+        print(f"주식 가격 조회 마감 초과 ({symbol}): {deadline}s")
+        price, age = _deadline_fallback(symbol)
+        results[symbol] = (price, time.perf_counter() - started, True, age)
+
+    return results
+
+
+def _deadline_fallback(symbol):
+    """마감 초과 종목의 대체값 (price, age_seconds): 마지막 정상 가격 → 직전 가격 → 모의 가격"""
+    known = last_known_good.get(symbol)
+    if known:
+        return known[0], time.time() - known[1]
+    return previous_prices.get(symbol) or _mock_stock_price(symbol), None
+
+# 종목별 시세 이력 - 고정 크기 링 버퍼 (파드 실행 시간과 무관하게 종목당 메모리 일정)
+STOCK_HISTORY_CAPACITY = int(os.getenv('STOCK_HISTORY_CAPACITY', '2048'))
+STOCK_HISTORY_DEFAULT_WINDOW = int(os.getenv('STOCK_HISTORY_DEFAULT_WINDOW', '120'))
+STOCK_HISTORY_VOLATILITY_WINDOW = int(os.getenv('STOCK_HISTORY_VOLATILITY_WINDOW', '20'))
+
+
+class PriceHistory:
+    """(timestamp, price)를 array('d') 두 개에 순환 저장하는 링 버퍼"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._prices = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def nbytes(self):
+        return (len(self._timestamps) + len(self._prices)) * self._prices.itemsize
+
+    def append(self, timestamp, price):
+        with self._lock:
+            self._timestamps[self._next] = timestamp
+            self._prices[self._next] = price
+            self._next = (self._next + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def tail(self, count):
+        """최근 count개를 오래된 순서로 복사해 (timestamps, prices) 반환"""
+        with self._lock:
+            count = min(count, self._size)
+            start = (self._next - count) % self.capacity
+            if start + count <= self.capacity:
+                return self._timestamps[start:start + count], self._prices[start:start + count]
+            return (self._timestamps[start:] + self._timestamps[:self._next],
+                    self._prices[start:] + self._prices[:self._next])
+
+
+price_histories = {symbol: PriceHistory(STOCK_HISTORY_CAPACITY) for symbol in stock_symbols}
+
+# 변동성 기반 수요 예측 - 시장 충격이 시작될 때 CPU보다 먼저 스케일 신호를 내보냄
+# FORECAST_THRESHOLDS: "변동성%:부하배수" 목록 (변동성이 임계값 이상이면 해당 배수)
+FORECAST_THRESHOLDS = os.getenv('FORECAST_THRESHOLDS', '0.5:1.5,1.0:2.0,2.0:3.0')
+FORECAST_VOLATILITY_WINDOW = int(os.getenv('FORECAST_VOLATILITY_WINDOW', '10'))   # 종목별 수익률 개수
+FORECAST_SMOOTHING_WINDOW = int(os.getenv('FORECAST_SMOOTHING_WINDOW', '6'))      # 하락 시 평활화 평가 횟수
+
+
+def _parse_forecast_thresholds(spec):
+    thresholds = []
+    for item in spec.split(','):
+        if ':' not in item:
+            continue
+        volatility, factor = item.split(':', 1)
+        thresholds.append((float(volatility), float(factor)))
+    return sorted(thresholds)
+
+
+class DemandForecaster:
+    """전 종목 시세 이력을 한 번에 평가하여 예상 부하 배수를 산출
+
+    시장 신호 = max(종목별 최근 변동성 평균, 종목별 직전 수익률 절댓값 평균).
+    배수가 오를 때는 즉시 반영하고(선제 스케일 아웃), 내려갈 때만 EWMA로 천천히 낮춘다.
+    """
+    def __init__(self, thresholds, volatility_window, smoothing_window):
+        self.thresholds = thresholds
+        self.volatility_window = volatility_window
+        self.alpha = 2.0 / (max(smoothing_window, 1) + 1)
+        self.load_factor = 1.0
+        self.raw_load_factor = 1.0
+        self.market_volatility = 0.0
+        self.symbols_evaluated = 0
+        self.updated_at = None
+        self._lock = threading.Lock()
+
+    def factor_for(self, volatility):
+        factor = 1.0
+        for threshold, threshold_factor in self.thresholds:
+            if volatility >= threshold:
+                factor = threshold_factor
+        return factor
+
+    def evaluate(self, histories):
+        volatilities = []
+        last_moves = []
+        for history in histories.values():
+            _, prices = history.tail(self.volatility_window + 1)
+            returns = [(cur - prev) / prev * 100 for prev, cur in zip(prices, prices[1:]) if prev]
+            if len(returns) < 2:
+                continue
+            volatilities.append(statistics.stdev(returns))
+            last_moves.append(abs(returns[-1]))
+
+        signal = max(statistics.fmean(volatilities), statistics.fmean(last_moves)) if volatilities else 0.0
+        raw = self.factor_for(signal)
+        with self._lock:
+            if raw >= self.load_factor:
+                self.load_factor = raw
+            else:
+                self.load_factor += self.alpha * (raw - self.load_factor)
+            self.raw_load_factor = raw
+            self.market_volatility = signal
+            self.symbols_evaluated = len(volatilities)
+            self.updated_at = datetime.now().isoformat()
+            load_factor = self.load_factor
+
+        PREDICTED_LOAD_FACTOR_GAUGE.set(load_factor)
+        MARKET_VOLATILITY_GAUGE.set(signal)
+        return load_factor
+
+    def status(self):
+        with self._lock:
+            return {
+                'load_factor': round(self.load_factor, 3),
+                'raw_load_factor': self.raw_load_factor,
+                'market_volatility_percent': round(self.market_volatility, 4),
+                'symbols_evaluated': self.symbols_evaluated,
+                'updated_at': self.updated_at
+            }
+
+
+demand_forecaster = DemandForecaster(
+    _parse_forecast_thresholds(FORECAST_THRESHOLDS),
+    FORECAST_VOLATILITY_WINDOW,
+    FORECAST_SMOOTHING_WINDOW
+)
+PREDICTED_LOAD_FACTOR_GAUGE.set(1.0)
+
 
 def calculate_price_change(symbol, current_price):
-    """가격 변동률 계산"""
+    """가격 변동률 계산 (실시간 가격만 전달할 것)"""
     global previous_prices
     
     if symbol in previous_prices:
@@ -739,6 +2428,20 @@ def calculate_price_change(symbol, current_price):
     previous_prices[symbol] = current_price
     return change_percent
 
+
+def record_price_history(symbol, price, stale):
+    """업스트림에서 새로 받은 시세만 이력 버퍼에 기록
+
+    모의 가격의 무작위 변동이나, 장애 중 반복되는 마지막 정상 가격(수익률 0의 가짜 틱)이
+    변동성/수요 예측에 섞이지 않도록 stale 값은 모두 제외한다.
+    """
+    if stale:
+        return False
+    history = price_histories.get(symbol)
+    if history is not None:
+        history.append(time.time(), price)
+    return True
+
 def adjust_traffic_by_price_change(symbol, price_change):
     """가격 변동률에 따른 트래픽 조절 (자동 모드일 때만 작동)"""
     global auto_mode_enabled
@@ -762,26 +2465,33 @@ def adjust_traffic_by_price_change(symbol, price_change):
         start_simulation(new_traffic_level, emergency=False)
         print(f"[가격 변동 감지 - 자동 모드] {symbol}: {price_change:+.2f}% → 트래픽 레벨: {new_traffic_level}")
 
-# 실제 주식 데이터 API
-@app.route('/api/stock-data')
-def get_stock_data():
-    """실제 주식 가격 데이터 조회"""
+def build_stock_entries(quotes):
+    """fetch_stock_prices 결과를 응답용 종목 목록으로 변환 (이전 가격 기록 갱신 포함)"""
     stocks = []
-    
     for symbol, name in stock_symbols.items():
+        if symbol not in quotes:
+            continue
+        current_price, latency, stale, age = quotes[symbol]
         try:
-            current_price = get_real_stock_price(symbol)
-            price_change = calculate_price_change(symbol, current_price)
-            
-            # 가격 변동률에 따른 트래픽 조절 (자동 모드일 때만)
-            adjust_traffic_by_price_change(symbol, price_change)
+            record_price_history(symbol, current_price, stale)
+            if stale:
+                # 마감 초과 종목은 이전 가격 기록을 덮어쓰지 않음
+                price_change = 0.0
+            else:
+                price_change = calculate_price_change(symbol, current_price)
+
+                # 가격 변동률에 따른 트래픽 조절 (자동 모드일 때만)
+                adjust_traffic_by_price_change(symbol, price_change)
             
             stocks.append({
                 'symbol': symbol,
                 'name': name,
                 'price': round(current_price, 2),
                 'change': round(price_change, 2),
-                'change_percent': round(price_change, 2)
+                'change_percent': round(price_change, 2),
+                'stale': stale,
+                'age_seconds': round(age, 1) if age is not None else None,
+                'latency_ms': round(latency * 1000, 1)
             })
             
         except Exception as e:
@@ -792,16 +2502,205 @@ def get_stock_data():
                 'price': 0.0,
                 'change': 0.0,
                 'change_percent': 0.0,
+                'stale': True,
+                'age_seconds': round(age, 1) if age is not None else None,
+                'latency_ms': round(latency * 1000, 1),
                 'error': str(e)
             })
+    return stocks
+
+
+# 백그라운드 시세 수집 - 요청 처리 경로에서는 스냅샷만 읽음
+QUOTE_POLL_ENABLED = os.getenv('QUOTE_POLL_ENABLED', 'true').lower() == 'true'
+QUOTE_POLL_INTERVAL = float(os.getenv('QUOTE_POLL_INTERVAL', '5'))
+
+# 불변 시세 스냅샷: stocks는 읽기 전용 dict의 tuple, by_symbol은 종목 코드별 읽기 전용 매핑
+QuoteSnapshot = namedtuple('QuoteSnapshot', ['version', 'timestamp', 'created_at', 'stocks', 'by_symbol'])
+quote_snapshot = None
+quote_snapshot_lock = threading.Lock()
+quote_snapshot_changed = threading.Condition(quote_snapshot_lock)
+quote_snapshot_history = deque(maxlen=int(os.getenv('QUOTE_SNAPSHOT_HISTORY', '32')))  # SSE 재연결용
+quote_poller_thread = None
+quote_poller_lock = threading.Lock()
+quote_poller_stop_event = threading.Event()
+
+
+def publish_quote_snapshot(stocks):
+    """새 시세 스냅샷을 만들어 원자적으로 교체"""
+    global quote_snapshot
+    frozen = tuple(MappingProxyType(dict(stock)) for stock in stocks)
+    with quote_snapshot_lock:
+        version = quote_snapshot.version + 1 if quote_snapshot else 1
+        quote_snapshot = QuoteSnapshot(
+            version=version,
+            timestamp=datetime.now().isoformat(),
+            created_at=time.time(),
+            stocks=frozen,
+            by_symbol=MappingProxyType({stock['symbol']: stock for stock in frozen})
+        )
+        quote_snapshot_history.append(quote_snapshot)
+        quote_snapshot_changed.notify_all()
+    return quote_snapshot
+
+
+def refresh_quote_snapshot():
+    """전체 종목을 업스트림에서 다시 조회하여 스냅샷 발행"""
+    quotes = fetch_stock_prices(stock_symbols.keys(), refresh=True)
+    snapshot = publish_quote_snapshot(build_stock_entries(quotes))
+    # 새 시세가 하나도 없으면(KIS 장애/자격 증명 없음) 이력이 그대로이므로 예측도 갱신하지 않음
+    if any(not stale for _, _, stale, _ in quotes.values()):
+        demand_forecaster.evaluate(price_histories)
+    return snapshot
+
+
+def _quote_poll_loop(stop_event: threading.Event):
+    """QUOTE_POLL_INTERVAL마다 전체 종목 시세를 갱신"""
+    # 기동 단계에서 막 만든 스냅샷이 있으면 다음 주기까지 대기
+    snapshot = quote_snapshot
+    if snapshot is not None:
+        stop_event.wait(max(QUOTE_POLL_INTERVAL - (time.time() - snapshot.created_at), 0))
+    while not stop_event.is_set():
+        started = time.monotonic()
+        try:
+            refresh_quote_snapshot()
+        except Exception as e:
+            print(f"시세 스냅샷 갱신 실패: {e}")
+        stop_event.wait(max(QUOTE_POLL_INTERVAL - (time.monotonic() - started), 0))
+
+
+def ensure_quote_poller_running():
+    """시세 수집 스레드를 한 번만 기동"""
+    global quote_poller_thread
+    with quote_poller_lock:
+        if quote_poller_thread and quote_poller_thread.is_alive():
+            return
+        quote_poller_stop_event.clear()
+        quote_poller_thread = threading.Thread(
+            target=_quote_poll_loop,
+            args=(quote_poller_stop_event,),
+            daemon=True
+        )
+        quote_poller_thread.start()
+
+
+# 직렬화된 응답 캐시 - 같은 스냅샷 버전에 대해서는 JSON/gzip 바이트와 ETag를 재사용
+RESPONSE_CACHE_ENTRIES = int(os.getenv('RESPONSE_CACHE_ENTRIES', '8'))
+RESPONSE_GZIP_MIN_BYTES = int(os.getenv('RESPONSE_GZIP_MIN_BYTES', '512'))
+RESPONSE_GZIP_LEVEL = int(os.getenv('RESPONSE_GZIP_LEVEL', '6'))
+
+CachedBody = namedtuple('CachedBody', ['etag', 'body', 'gzip_body'])
+
+
+class ResponseCache:
+    """키(스냅샷 버전 + 응답에 영향을 주는 상태)별 직렬화 결과를 최근 N개까지 보관"""
+    def __init__(self, endpoint, max_entries):
+        self.endpoint = endpoint
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build_payload):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                RESPONSE_CACHE_REQUESTS.labels(endpoint=self.endpoint, result='hit').inc()
+                return entry
+
+        body = app.json.dumps(build_payload()).encode('utf-8')
+        gzip_body = None
+        if len(body) >= RESPONSE_GZIP_MIN_BYTES:
+            gzip_body = gzip.compress(body, compresslevel=RESPONSE_GZIP_LEVEL, mtime=0)
+        entry = CachedBody(hashlib.sha256(body).hexdigest()[:32], body, gzip_body)
+        RESPONSE_CACHE_REQUESTS.labels(endpoint=self.endpoint, result='miss').inc()
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def respond(self, entry):
+        """If-None-Match가 일치하면 304, 아니면 (가능하면 gzip) 본문 응답"""
+        use_gzip = entry.gzip_body is not None and 'gzip' in request.headers.get('Accept-Encoding', '')
+        # 표현(인코딩)마다 다른 강한 ETag, 비교는 두 표현 모두 허용
+        etag = f"{entry.etag}-gz" if use_gzip else entry.etag
+        headers = {
+            'ETag': f'"{etag}"',
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding'
+        }
+
+        if_none_match = request.headers.get('If-None-Match', '')
+        if if_none_match:
+            candidates = {tag.strip().removeprefix('W/').strip('"') for tag in if_none_match.split(',')}
+            if '*' in candidates or entry.etag in candidates or f"{entry.etag}-gz" in candidates:
+                RESPONSE_CACHE_REQUESTS.labels(endpoint=self.endpoint, result='not_modified').inc()
+                RESPONSE_CACHE_BYTES_SAVED.labels(endpoint=self.endpoint, reason='not_modified').inc(
+                    len(entry.gzip_body if use_gzip else entry.body)
+                )
+                return Response(status=304, headers=headers)
+
+        if use_gzip:
+            RESPONSE_CACHE_BYTES_SAVED.labels(endpoint=self.endpoint, reason='gzip').inc(
+                len(entry.body) - len(entry.gzip_body)
+            )
+            headers['Content-Encoding'] = 'gzip'
+            return Response(entry.gzip_body, mimetype='application/json', headers=headers)
+        return Response(entry.body, mimetype='application/json', headers=headers)
+
+
+stock_data_response_cache = ResponseCache('get_stock_data', RESPONSE_CACHE_ENTRIES)
+
+
+def current_market_status():
+    return 'open' if 9 <= datetime.now().hour < 15 else 'closed'
+
+
+# 실제 주식 데이터 API
+@app.route('/api/stock-data')
+def get_stock_data():
+    """실제 주식 가격 데이터 조회 (백그라운드 스냅샷 우선, 없으면 직접 조회)"""
+    snapshot = quote_snapshot
+    market_status = current_market_status()
+    if snapshot is not None:
+        # 스냅샷 버전과 응답에 포함되는 상태가 같으면 직렬화 결과 재사용
+        level, active = current_traffic_level, traffic_simulation_active
+        entry = stock_data_response_cache.get_or_build(
+            (snapshot.version, market_status, level, active),
+            lambda: {
+                'stocks': [dict(stock) for stock in snapshot.stocks],
+                'timestamp': datetime.now().isoformat(),
+                'market_status': market_status,
+                'traffic_level': level,
+                'traffic_simulation': active,
+                'fetch_latency_ms': 0.0,
+                'snapshot_version': snapshot.version,
+                'quote_timestamp': snapshot.timestamp
+            }
+        )
+        return stock_data_response_cache.respond(entry)
+
+    fetch_started = time.perf_counter()
+    stocks = build_stock_entries(fetch_stock_prices(stock_symbols.keys()))
+    fetch_latency = time.perf_counter() - fetch_started
     
-    return jsonify({
+    return jsonify(stock_data_payload(stocks, fetch_latency, market_status))
+
+
+def stock_data_payload(stocks, fetch_latency, market_status):
+    """스냅샷 없이 직접 조회한 /api/stock-data 응답 본문 (WSGI/ASGI 공용)"""
+    return {
         'stocks': stocks,
         'timestamp': datetime.now().isoformat(),
-        'market_status': 'open' if 9 <= datetime.now().hour < 15 else 'closed',
+        'market_status': market_status,
         'traffic_level': current_traffic_level,
-        'traffic_simulation': traffic_simulation_active
-    })
+        'traffic_simulation': traffic_simulation_active,
+        'fetch_latency_ms': round(fetch_latency * 1000, 1),
+        'snapshot_version': None,
+        'quote_timestamp': None
+    }
 
 # 개별 주식 가격 조회 API
 @app.route('/api/stock-price/<symbol>')
@@ -810,34 +2709,521 @@ def get_stock_price(symbol):
     try:
         if symbol not in stock_symbols:
             return jsonify({'error': 'Unknown symbol'}), 400
+
+        snapshot = quote_snapshot
+        stock = snapshot.by_symbol.get(symbol) if snapshot else None
+        if stock is not None:
+            return jsonify({
+                'symbol': symbol,
+                'name': stock['name'],
+                'price': stock['price'],
+                'change': stock['change'],
+                'change_percent': stock['change_percent'],
+                'stale': stock['stale'],
+                'age_seconds': stock['age_seconds'],
+                'timestamp': datetime.now().isoformat(),
+                'quote_timestamp': snapshot.timestamp,
+                'traffic_level': current_traffic_level
+            })
         
-        current_price = get_real_stock_price(symbol)
-        price_change = calculate_price_change(symbol, current_price)
-        
-        # 가격 변동률에 따른 자동 트래픽 조절 제거됨
-        
-        return jsonify({
-            'symbol': symbol,
-            'name': stock_symbols[symbol],
-            'price': round(current_price, 2),
-            'change': round(price_change, 2),
-            'change_percent': round(price_change, 2),
-            'timestamp': datetime.now().isoformat(),
-            'traffic_level': current_traffic_level
-        })
+        current_price, stale, age = get_stock_quote(symbol, priority=PRIORITY_INTERACTIVE)
+        return jsonify(stock_price_payload(symbol, current_price, stale, age))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+
+def stock_price_payload(symbol, current_price, stale, age):
+    """업스트림에서 조회한 /api/stock-price 응답 본문 (WSGI/ASGI 공용)"""
+    record_price_history(symbol, current_price, stale)
+    price_change = 0.0 if stale else calculate_price_change(symbol, current_price)
+    
+    # 가격 변동률에 따른 자동 트래픽 조절 제거됨
+    
+    return {
+        'symbol': symbol,
+        'name': stock_symbols[symbol],
+        'price': round(current_price, 2),
+        'change': round(price_change, 2),
+        'change_percent': round(price_change, 2),
+        'stale': stale,
+        'age_seconds': round(age, 1) if age is not None else None,
+        'timestamp': datetime.now().isoformat(),
+        'traffic_level': current_traffic_level
+    }
+
+# 여러 종목 일괄 조회 API - /api/stock-prices?symbols=005930,000660&fields=price,change
+BATCH_MAX_SYMBOLS = int(os.getenv('BATCH_MAX_SYMBOLS', str(len(stock_symbols))))
+BATCH_FIELDS = ('name', 'price', 'change', 'change_percent', 'stale', 'age_seconds', 'latency_ms')
+
+
+@app.route('/api/stock-prices')
+def get_stock_prices():
+    """요청한 종목만 한 번에 조회하고 필요한 필드만 반환"""
+    requested, fields, error = parse_batch_request(request.args)
+    if error:
+        return jsonify(error), 400
+
+    # 스냅샷에 있는 종목은 그대로 사용하고 나머지만 업스트림에서 한 번에 조회
+    snapshot = quote_snapshot
+    resolved, missing = split_batch_symbols(requested, snapshot)
+    if missing:
+        quotes = fetch_stock_prices(missing, priority=PRIORITY_INTERACTIVE)
+        for stock in build_stock_entries(quotes):
+            resolved[stock['symbol']] = stock
+
+    return jsonify(stock_prices_payload(requested, fields, snapshot, resolved))
+
+
+def parse_batch_request(args):
+    """/api/stock-prices 쿼리 검증 → (requested, fields, error) - error가 있으면 400 응답 본문"""
+    requested = []
+    for symbol in args.get('symbols', '').split(','):
+        symbol = symbol.strip()
+        if symbol and symbol not in requested:
+            requested.append(symbol)
+    if not requested:
+        return None, None, {'error': 'symbols query parameter is required'}
+    if len(requested) > BATCH_MAX_SYMBOLS:
+        return None, None, {'error': f'Too many symbols (max {BATCH_MAX_SYMBOLS})'}
+
+    fields_param = args.get('fields')
+    if fields_param:
+        fields = [field.strip() for field in fields_param.split(',') if field.strip()]
+        unknown_fields = [field for field in fields if field != 'symbol' and field not in BATCH_FIELDS]
+        if unknown_fields:
+            return None, None, {
+                'error': f"Unknown fields: {', '.join(unknown_fields)}",
+                'available_fields': list(BATCH_FIELDS)
+            }
+    else:
+        fields = BATCH_FIELDS
+    return requested, fields, None
+
+
+def split_batch_symbols(requested, snapshot):
+    """스냅샷에서 찾은 종목({symbol: stock})과 업스트림 조회가 필요한 종목 목록으로 분리"""
+    resolved = {}
+    missing = []
+    for symbol in requested:
+        if symbol not in stock_symbols:
+            continue
+        stock = snapshot.by_symbol.get(symbol) if snapshot else None
+        if stock is not None:
+            resolved[symbol] = stock
+        else:
+            missing.append(symbol)
+    return resolved, missing
+
+
+def stock_prices_payload(requested, fields, snapshot, resolved):
+    """/api/stock-prices 응답 본문 (WSGI/ASGI 공용)"""
+    items = []
+    for symbol in requested:
+        stock = resolved.get(symbol)
+        if stock is None:
+            items.append({'symbol': symbol, 'error': 'Unknown symbol'})
+            continue
+        item = {'symbol': symbol}
+        for field in fields:
+            if field in stock:
+                item[field] = stock[field]
+        items.append(item)
+
+    return {
+        'stocks': items,
+        'timestamp': datetime.now().isoformat(),
+        'snapshot_version': snapshot.version if snapshot else None,
+        'traffic_level': current_traffic_level
+    }
+
+
+def summarize_price_history(timestamps, prices, volatility_window):
+    """수익률/이동 변동성/최저·최고가 계산
+
+    수익률은 %, 변동성은 직전 volatility_window개 수익률의 표본 표준편차(%).
+    이동 합계는 누적합 차분으로 구해 창 크기와 무관하게 O(n)으로 계산한다.
+    """
+    count = len(prices)
+    result = {
+        'count': count,
+        'first_timestamp': datetime.fromtimestamp(timestamps[0]).isoformat() if count else None,
+        'last_timestamp': datetime.fromtimestamp(timestamps[-1]).isoformat() if count else None,
+        'last_price': prices[-1] if count else None,
+        'min_price': None,
+        'min_at': None,
+        'max_price': None,
+        'max_at': None,
+        'mean_price': None,
+        'return_percent': None,
+        'last_return_percent': None,
+        'volatility': {'window': volatility_window, 'latest': None, 'max': None, 'series': []}
+    }
+    if not count:
+        return result
+
+    min_price, max_price = min(prices), max(prices)
+    result.update({
+        'min_price': min_price,
+        'min_at': datetime.fromtimestamp(timestamps[prices.index(min_price)]).isoformat(),
+        'max_price': max_price,
+        'max_at': datetime.fromtimestamp(timestamps[prices.index(max_price)]).isoformat(),
+        'mean_price': round(math.fsum(prices) / count, 2)
+    })
+    if count < 2:
+        return result
+
+    returns = array('d', map(lambda prev, cur: (cur - prev) / prev * 100 if prev else 0.0, prices, prices[1:]))
+    result['return_percent'] = round((prices[-1] - prices[0]) / prices[0] * 100, 4) if prices[0] else None
+    result['last_return_percent'] = round(returns[-1], 4)
+
+    window = volatility_window
+    if len(returns) >= window >= 2:
+        sums = array('d', itertools.accumulate(returns, initial=0.0))
+        squares = array('d', itertools.accumulate(map(lambda r: r * r, returns), initial=0.0))
+        series = [
+            math.sqrt(max((sq_hi - sq_lo - (s_hi - s_lo) ** 2 / window) / (window - 1), 0.0))
+            for s_lo, s_hi, sq_lo, sq_hi in zip(sums, sums[window:], squares, squares[window:])
+        ]
+        result['volatility'].update({
+            'latest': round(series[-1], 4),
+            'max': round(max(series), 4),
+            'series': [round(value, 4) for value in series]
+        })
+    return result
+
+
+# 종목 시세 이력 분석 API - /api/stock-history/005930?window=120&volatility_window=20
+@app.route('/api/stock-history/<symbol>')
+def get_stock_history(symbol):
+    """최근 window개 시세의 수익률, 이동 변동성, 최저/최고가"""
+    history = price_histories.get(symbol)
+    if history is None:
+        return jsonify({'error': 'Unknown symbol'}), 400
+
+    try:
+        window = int(request.args.get('window', min(STOCK_HISTORY_DEFAULT_WINDOW, history.capacity)))
+        volatility_window = int(request.args.get('volatility_window', STOCK_HISTORY_VOLATILITY_WINDOW))
+    except ValueError:
+        return jsonify({'error': 'window and volatility_window must be integers'}), 400
+    if not 2 <= window <= history.capacity:
+        return jsonify({'error': f'window must be between 2 and {history.capacity}'}), 400
+    if not 2 <= volatility_window < window:
+        return jsonify({'error': 'volatility_window must be at least 2 and smaller than window'}), 400
+
+    timestamps, prices = history.tail(window)
+    summary = summarize_price_history(timestamps, prices, volatility_window)
+    response = {
+        'symbol': symbol,
+        'name': stock_symbols[symbol],
+        'window': window,
+        'capacity': history.capacity,
+        'buffered': len(history),
+        'timestamp': datetime.now().isoformat()
+    }
+    response.update(summary)
+    if request.args.get('include_points', 'false').lower() == 'true':
+        response['points'] = [
+            {'timestamp': datetime.fromtimestamp(ts).isoformat(), 'price': price}
+            for ts, price in zip(timestamps, prices)
+        ]
+    return jsonify(response)
+
+
+# 실시간 시세 스트리밍 (Server-Sent Events)
+SSE_MAX_SUBSCRIBERS = int(os.getenv('SSE_MAX_SUBSCRIBERS', '100'))
+SSE_HEARTBEAT_INTERVAL = float(os.getenv('SSE_HEARTBEAT_INTERVAL', '15'))
+SSE_RETRY_MS = int(os.getenv('SSE_RETRY_MS', '3000'))
+# 연결 하나의 최대 유지 시간 - 만료되면 스트림을 닫고 클라이언트가 Last-Event-ID로 재연결
+# (ASGI 모드에서는 끊긴 클라이언트를 감지하지 못하므로 스트림 스레드가 이 시간 안에 반환됨)
+SSE_MAX_STREAM_SECONDS = float(os.getenv('SSE_MAX_STREAM_SECONDS', '300'))
+SSE_COMPARE_FIELDS = ('price', 'change', 'change_percent', 'stale')
+sse_subscriber_count = 0
+sse_subscriber_lock = threading.Lock()
+
+
+def _acquire_sse_slot():
+    global sse_subscriber_count
+    with sse_subscriber_lock:
+        if sse_subscriber_count >= SSE_MAX_SUBSCRIBERS:
+            return False
+        sse_subscriber_count += 1
+        SSE_SUBSCRIBERS_GAUGE.set(sse_subscriber_count)
+        return True
+
+
+def _release_sse_slot():
+    global sse_subscriber_count
+    with sse_subscriber_lock:
+        sse_subscriber_count -= 1
+        SSE_SUBSCRIBERS_GAUGE.set(sse_subscriber_count)
+
+
+def _find_snapshot(version):
+    """재연결 시 클라이언트가 마지막으로 받은 스냅샷을 이력에서 검색"""
+    with quote_snapshot_lock:
+        for snapshot in quote_snapshot_history:
+            if snapshot.version == version:
+                return snapshot
+    return None
+
+
+def _changed_quotes(previous, current):
+    """이전 스냅샷 대비 값이 바뀐 종목만 반환 (previous가 없으면 전체)"""
+    if previous is None:
+        return [dict(stock) for stock in current.stocks]
+    changed = []
+    for stock in current.stocks:
+        before = previous.by_symbol.get(stock['symbol'])
+        if before is None or any(before.get(field) != stock.get(field) for field in SSE_COMPARE_FIELDS):
+            changed.append(dict(stock))
+    return changed
+
+
+def _sse_event(snapshot, quotes):
+    payload = json.dumps({
+        'version': snapshot.version,
+        'timestamp': snapshot.timestamp,
+        'stocks': quotes
+    }, ensure_ascii=False)
+    return f"id: {snapshot.version}\nevent: quotes\ndata: {payload}\n\n"
+
+
+# 실시간 시세 스트림 API - 변경된 종목만 push
+@app.route('/api/stock-stream')
+def stock_stream():
+    """SSE로 시세 변경분 전송 (Last-Event-ID로 재연결 지원)"""
+    if not QUOTE_POLL_ENABLED:
+        return jsonify({'error': 'Quote poller is disabled (QUOTE_POLL_ENABLED=false)'}), 503
+
+    if not _acquire_sse_slot():
+        response = jsonify({'error': 'Too many stream subscribers'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(max(SSE_RETRY_MS // 1000, 1))
+        return response
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_sent = _find_snapshot(int(last_event_id)) if last_event_id else None
+    except ValueError:
+        last_sent = None
+
+    def generate():
+        sent = last_sent
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        last_write = time.monotonic()
+        expires_at = last_write + SSE_MAX_STREAM_SECONDS
+        while time.monotonic() < expires_at:
+            # 새 버전이 와도 변경 종목이 없으면 아무것도 쓰지 않으므로, 마지막 전송 시각 기준으로 대기
+            wait_for = max(min(SSE_HEARTBEAT_INTERVAL - (time.monotonic() - last_write),
+                               expires_at - time.monotonic()), 0)
+            with quote_snapshot_changed:
+                current = quote_snapshot
+                if current is None or (sent is not None and current.version <= sent.version):
+                    quote_snapshot_changed.wait(timeout=wait_for)
+                    current = quote_snapshot
+
+            if current is not None and (sent is None or current.version > sent.version):
+                changed = _changed_quotes(sent, current)
+                sent = current
+                if changed:
+                    yield _sse_event(current, changed)
+                    last_write = time.monotonic()
+                    continue
+
+            # 조용한 장에서도 주기적으로 바이트를 보내 ingress 유휴 타임아웃을 막고 끊긴 클라이언트를 감지
+            if time.monotonic() - last_write >= SSE_HEARTBEAT_INTERVAL:
+                yield ": heartbeat\n\n"
+                last_write = time.monotonic()
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # ingress-nginx 버퍼링 비활성화
+        }
+    )
+    # 연결 종료 시(스트림 시작 전 끊긴 경우 포함) 구독 슬롯 반환
+    response.call_on_close(_release_sse_slot)
+    return response
+
+
+# 백그라운드 작업 기동 - 프로세스(워커)마다 한 번씩 실행
+# gunicorn preload 모드에서는 마스터가 아닌 각 워커의 post_fork 훅에서 호출해야 스레드가 살아 있음
+WORKER_THREADS = int(os.getenv('GUNICORN_THREADS', '1'))   # 워커 프로세스당 요청 처리 스레드 수
+DEFER_BACKGROUND_START = os.getenv('BACKEND_DEFER_BACKGROUND_START', 'false').lower() == 'true'
+_background_pid = None
+
+
+STARTUP_READY_DEADLINE = float(os.getenv('STARTUP_READY_DEADLINE', '20'))   # 워밍업이 끝나지 않아도 준비 완료로 보는 시간(초)
+STARTUP_WARM_QUOTES = os.getenv('STARTUP_WARM_QUOTES', 'true').lower() == 'true'
+
+
+class StartupPipeline:
+    """프로세스 기동 후 워밍업 단계(kubernetes → token → quotes)를 순서대로 실행하고 소요 시간 기록"""
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.phases = OrderedDict()
+        self.current_phase = None
+        self.completed = False
+        self._lock = threading.Lock()
+        STARTUP_READY_GAUGE.set(0)
+
+    def run_phase(self, name, func):
+        with self._lock:
+            self.current_phase = name
+        phase_started = time.monotonic()
+        try:
+            result = func()
+            status = 'skipped' if result is False else 'ok'
+        except Exception as exc:
+            print(f"기동 단계 실패 ({name}): {exc}")
+            status = 'failed'
+        duration = time.monotonic() - phase_started
+        STARTUP_PHASE_SECONDS.labels(phase=name).set(duration)
+        with self._lock:
+            self.phases[name] = {'status': status, 'duration_ms': round(duration * 1000, 1)}
+
+    def finish(self):
+        total = time.monotonic() - self.started
+        STARTUP_PHASE_SECONDS.labels(phase='total').set(total)
+        with self._lock:
+            self.current_phase = None
+            self.completed = True
+        STARTUP_READY_GAUGE.set(1)
+        print(f"기동 워밍업 완료: {total:.2f}s {dict(self.phases)}")
+
+    @property
+    def ready(self):
+        return self.completed or time.monotonic() - self.started >= self.deadline
+
+    def status(self):
+        ready = self.ready
+        if ready:
+            STARTUP_READY_GAUGE.set(1)
+        with self._lock:
+            return {
+                'ready': ready,
+                'warmed_up': self.completed,
+                'phase': self.current_phase or ('done' if self.completed else 'pending'),
+                'phases': dict(self.phases),
+                'elapsed_seconds': round(time.monotonic() - self.started, 2),
+                'deadline_seconds': self.deadline
+            }
+
+
+startup_pipeline = None
+
+
+def _warm_kis_token():
+    if not (kis_client.app_key and kis_client.app_secret):
+        return False
+    return kis_client.get_access_token() is not None
+
+
+def _warm_quotes():
+    """첫 시세 스냅샷 생성 (수집 스레드를 쓰지 않으면 캐시와 KIS 연결만 예열)"""
+    if not STARTUP_WARM_QUOTES:
+        return False
+    if QUOTE_POLL_ENABLED:
+        refresh_quote_snapshot()
+    else:
+        fetch_stock_prices(stock_symbols.keys())
+
+
+def _run_startup_pipeline(pipeline):
+    """kubernetes 초기화, KIS 토큰/연결, 시세 스냅샷을 미리 준비한 뒤 시세 수집 스레드 기동"""
+    global replica_budget_thread, membership_thread, scale_timeline_thread
+
+    pipeline.run_phase('kubernetes', bootstrap_simulation_state_sync)
+    if KIS_TOKEN_STORE == 'secret' and not k8s_enabled:
+        # 조용히 레플리카별 발급으로 바뀌면 KIS 토큰 발급 한도를 넘기기 쉬우므로 기동 시 알림
+        print("경고: KIS_TOKEN_STORE=secret 이지만 Kubernetes 클라이언트를 사용할 수 없어 "
+              "레플리카마다 KIS 토큰을 따로 발급합니다")
+    if k8s_enabled and replica_budget_thread is None:
+        replica_budget_thread = threading.Thread(target=_replica_budget_loop, daemon=True)
+        replica_budget_thread.start()
+
+    pipeline.run_phase('token', _warm_kis_token)
+    pipeline.run_phase('quotes', _warm_quotes)
+    pipeline.finish()
+
+    # 준비 완료 후에만 멤버로 참여 (트래픽을 받지 못하는 파드가 부하 몫을 가져가지 않도록)
+    if k8s_enabled and membership_thread is None:
+        replica_membership.api = k8s_coordination_v1
+        membership_thread = threading.Thread(target=_membership_loop, daemon=True)
+        membership_thread.start()
+    if k8s_enabled and scale_timeline_thread is None:
+        scale_timeline.api = k8s_apps_v1
+        scale_timeline_thread = threading.Thread(target=_scale_timeline_loop, daemon=True)
+        scale_timeline_thread.start()
+
+    if QUOTE_POLL_ENABLED:
+        ensure_quote_poller_running()
+
+
+def start_background_workers():
+    """시뮬레이션/ConfigMap 동기화/시세 수집 스레드를 현재 프로세스에서 기동"""
+    global _background_pid, quote_fetch_executor, simulation_state_sync_thread, simulation_state_writer_thread
+    global replica_budget_thread, membership_thread, scale_timeline_thread, startup_pipeline
+
+    if _background_pid == os.getpid():
+        return
+    if _background_pid is not None:
+        # fork 이후: 부모 프로세스의 스레드/스레드 풀은 복제되지 않으므로 새로 생성
+        quote_fetch_executor = ThreadPoolExecutor(
+            max_workers=STOCK_FETCH_MAX_WORKERS,
+            thread_name_prefix='quote-fetch'
+        )
+        simulation_state_sync_thread = None
+        simulation_state_writer_thread = None
+        replica_budget_thread = None
+        membership_thread = None
+        scale_timeline_thread = None
+    _background_pid = os.getpid()
+
+    # 포화도 계산용 용량 (워커 프로세스마다 기록하여 파드 단위로 합산)
+    WORKER_THREADS_CAPACITY.set(WORKER_THREADS)
+    QUOTE_FETCH_THREADS_CAPACITY.set(STOCK_FETCH_MAX_WORKERS)
+
+    if SIMULATION_ENABLED:
+        ensure_baseline_running()
+
+    # 외부 호출이 필요한 초기화는 백그라운드에서 진행 (import/fork가 API 호출에 막히지 않도록)
+    startup_pipeline = StartupPipeline(STARTUP_READY_DEADLINE)
+    threading.Thread(target=_run_startup_pipeline, args=(startup_pipeline,), daemon=True).start()
+
+
+def create_app():
+    """WSGI 서버용 앱 팩토리 (gunicorn: app:create_app())
+
+    preload 시 마스터 프로세스에서 호출되므로 스레드를 기동하지 않는다.
+    """
+    return app
+
+
+if not DEFER_BACKGROUND_START:
+    start_background_workers()
+
+
 if __name__ == '__main__':
     print("주식 모니터링 백엔드 서버 시작 (KIS API 사용)")
     print("API 엔드포인트:")
-    print("- GET  /api/health                # 헬스체크")
+    print("- GET  /api/health                # 헬스체크 (liveness)")
+    print("- GET  /api/ready                 # 워밍업 완료 여부 (readiness)")
     print("- POST /api/simulate-traffic      # 트래픽 시뮬레이션")
     print("- GET  /api/stock-data            # 주식 데이터 (KIS API)")
+    print("- GET  /api/stock-prices          # 여러 종목 일괄 조회 (?symbols=&fields=)")
+    print("- GET  /api/stock-stream          # 실시간 시세 스트림 (SSE)")
+    print("- GET  /api/stock-history/<symbol> # 시세 이력 분석 (?window=&volatility_window=)")
     print("- POST /api/emergency-simulation  # 긴급 상황 시뮬레이션")
+    print("- POST /api/simulation-scenario   # 부하 시나리오 실행 (ramp/spike/sawtooth 또는 단계 목록)")
+    print("- POST /api/simulate-cluster-load # 클러스터 총수요를 레플리카 수로 나눠 부하 (total_millicores/virtual_rps)")
     print("- POST /api/stop-simulation       # 시뮬레이션 중지")
     print("- GET  /api/simulation-status     # 시뮬레이션 상태")
+    print("- GET  /api/scale-timeline        # 전환별 스케일 반응 시간 (첫 새 파드/축소 지연/안정 상태)")
     print("한국투자증권 KIS API를 사용한 가벼운 백엔드")
     
     # KIS API 키 확인
@@ -0,0 +1,452 @@
+# 주식 모니터링 백엔드 - asyncio(ASGI) 서빙 모드
+# app.py의 라우트/상태/메트릭을 그대로 공유하고, KIS 업스트림을 기다려야 하는 시세 조회만
+# 이벤트 루프에서 비동기로 처리한다 (느린 업스트림 호출이 요청 처리 스레드를 점유하지 않음).
+#
+# 실행:
+#   uvicorn asgi:app --host 0.0.0.0 --port 8081
+#   GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker gunicorn -c gunicorn.conf.py asgi:app
+#
+# - /api/stock-data(스냅샷 없음), /api/stock-price/<symbol>(스냅샷에 없는 종목), /api/stock-prices
+#   → httpx 비동기 클라이언트로 KIS 조회 (캐시/서킷 브레이커/호출 한도/폴백은 app.py와 공유)
+#   (요청 메트릭은 Flask 요청 훅과 같은 기록 함수 사용, 스냅샷으로 응답 가능한 요청은 Flask 라우트로 처리)
+# - 그 외 라우트(시뮬레이션, /metrics, SSE 등) → Flask 앱을 a2wsgi 스레드 풀에서 그대로 실행
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs
+
+import httpx
+from a2wsgi import WSGIMiddleware
+
+import app as core
+from kis_resilience import PRIORITY_BULK, PRIORITY_INTERACTIVE, PRIORITY_NAMES
+
+ASGI_WSGI_THREADS = int(os.getenv('ASGI_WSGI_THREADS', '32'))        # Flask 라우트 실행 스레드 수
+KIS_ASYNC_POOL_SIZE = int(os.getenv('KIS_ASYNC_POOL_SIZE', '256'))   # KIS 동시 연결 수 상한
+KIS_RETRY_STATUSES = (429, 500, 502, 503, 504)
+STREAM_PATHS = ('/api/stock-stream',)   # 응답이 오래 이어지는 라우트 (별도 스레드 풀에서 실행)
+STOCK_PRICE_PREFIX = '/api/stock-price/'
+
+
+class UpstreamError(Exception):
+    """KIS 업스트림 연결/응답 오류"""
+
+
+class UpstreamTimeout(UpstreamError):
+    """응답 대기 시간 초과 (재시도하면 read_timeout을 한 번 더 기다리므로 재시도하지 않음)"""
+
+
+class AsyncKISClient:
+    """KISAPIClient의 asyncio 버전
+
+    요청 구성/응답 해석, 토큰, 서킷 브레이커, 호출 한도는 동기 클라이언트와 공유하므로
+    두 서빙 모드가 같은 프로세스에서 섞여 실행되어도 계정 한도와 토큰 상태가 하나로 유지된다.
+    """
+    def __init__(self, sync_client, max_connections, connect_timeout=core.KIS_CONNECT_TIMEOUT,
+                 read_timeout=core.KIS_READ_TIMEOUT, retries=core.KIS_HTTP_RETRIES, backoff=core.KIS_HTTP_BACKOFF):
+        self.sync_client = sync_client
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        # 연결 수 상한에 걸린 요청은 빈 연결이 생길 때까지 대기 (pool=None)
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout, pool=None)
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_limiter = sync_client.rate_limiter
+        self.circuit_breaker = sync_client.circuit_breaker
+        self._token_lock = None
+        self._rate_waiters = []
+        self._rate_sequence = itertools.count()
+        self._http = None
+        self._http_loop = None
+
+    def _http_client(self):
+        # 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self):
+        if self._http is not None and self._http_loop is asyncio.get_running_loop():
+            await self._http.aclose()
+        self._http = None
+        self._http_loop = None
+
+    async def _request(self, method, url, headers, params=None, json_body=None, retry=False):
+        """JSON 요청 → 응답 dict (GET은 연결 오류/429/5xx를 지수 백오프로 재시도, 읽기 시간 초과는 제외)"""
+        client = self._http_client()
+        attempt = 0
+        core.KIS_REQUESTS_IN_FLIGHT.inc()
+        try:
+            while True:
+                try:
+                    response = await client.request(method, url, headers=headers, params=params, json=json_body)
+                except httpx.ReadTimeout as exc:
+                    raise UpstreamTimeout(f"read timeout ({self.timeout.read}s)") from exc
+                except httpx.TransportError as exc:
+                    if not retry or attempt >= self.retries:
+                        raise UpstreamError(f"request failed: {exc!r}") from exc
+                    response = None
+                if response is None or (retry and response.status_code in KIS_RETRY_STATUSES and attempt < self.retries):
+                    await asyncio.sleep(self.backoff * (2 ** attempt))
+                    attempt += 1
+                    continue
+                if response.status_code >= 400:
+                    raise UpstreamError(f"{response.status_code} Error for url: {url}")
+                return response.json()
+        finally:
+            core.KIS_REQUESTS_IN_FLIGHT.dec()
+
+    async def get_access_token(self):
+        """토큰 발급 및 자동 갱신 (동시 요청 시 한 번만 발급)"""
+        client = self.sync_client
+        if client._token_valid():
+            return client.access_token
+
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if client._token_valid():
+                return client.access_token
+
+            loop = asyncio.get_running_loop()
+            if not client._token_lock.acquire(blocking=False):
+                # 다른 스레드(시세 수집 등)가 발급 중이면 그 결과를 기다려 사용
+                return await loop.run_in_executor(None, client.get_access_token)
+            try:
+                if client._token_valid():
+                    return client.access_token
+                if client._token_retry_at and client._token_retry_at > datetime.now():
+                    return None
+
+                # 다른 레플리카가 저장해 둔 토큰 재사용
+                if client.token_store:
+                    stored = await loop.run_in_executor(None, client.token_store.load)
+                    if stored and stored[1] > datetime.now():
+                        client.access_token, client.token_expires_at = stored
+                        print("KIS API 토큰 저장소에서 토큰 재사용")
+                        return client.access_token
+
+                token = await self._issue_token()
+                if token:
+                    client._token_retry_at = None
+                    if client.token_store:
+                        await loop.run_in_executor(None, client.token_store.save, token, client.token_expires_at)
+                else:
+                    client._token_retry_at = datetime.now() + timedelta(seconds=core.KIS_TOKEN_RETRY_INTERVAL)
+                return token
+            finally:
+                client._token_lock.release()
+
+    async def _issue_token(self):
+        url, data, headers = self.sync_client.token_request()
+        try:
+            return self.sync_client.accept_token(await self._request('POST', url, headers, json_body=data))
+        except (UpstreamError, ValueError) as e:
+            print(f"KIS API 토큰 발급 실패: {e}")
+            return None
+
+    async def _acquire_rate(self, priority):
+        """호출 한도 토큰 획득 (이벤트 루프를 막지 않고 대기, 대기열 초과/시간 초과 시 False)
+
+        asyncio 대기자는 우선순위 → 도착 순서로 줄을 서고, 맨 앞 대기자만 버킷을 확인한다.
+        """
+        limiter = self.rate_limiter
+        label = PRIORITY_NAMES.get(priority, str(priority))
+        waiters = self._rate_waiters
+        started = time.monotonic()
+        if not waiters and limiter.try_acquire(priority) == 0.0:
+            core.KIS_RATE_LIMIT_WAIT.labels(priority=label).observe(0.0)
+            return True
+        if len(waiters) >= limiter.max_queue:
+            core.KIS_RATE_LIMIT_REJECTED.labels(priority=label, reason='queue_full').inc()
+            return False
+
+        deadline = started + limiter.timeout
+        entry = [priority, next(self._rate_sequence), asyncio.Event()]
+        heapq.heappush(waiters, entry)
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if waiters[0] is entry:
+                    wait = limiter.try_acquire(priority)
+                    if wait == 0.0:
+                        core.KIS_RATE_LIMIT_WAIT.labels(priority=label).observe(time.monotonic() - started)
+                        return True
+                    if remaining <= 0:
+                        break
+                    await asyncio.sleep(min(wait, remaining))
+                else:
+                    if remaining <= 0:
+                        break
+                    entry[2].clear()
+                    try:
+                        await asyncio.wait_for(entry[2].wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            core.KIS_RATE_LIMIT_REJECTED.labels(priority=label, reason='timeout').inc()
+            return False
+        finally:
+            waiters.remove(entry)
+            heapq.heapify(waiters)
+            if waiters:
+                waiters[0][2].set()
+
+    async def get_stock_price(self, symbol, priority=PRIORITY_BULK):
+        """주식 가격 조회 (서킷 open 또는 호출 속도 제한 초과 시 None)"""
+        breaker = self.circuit_breaker
+        if breaker and not breaker.allow():
+            return None
+
+        token = await self.get_access_token()
+        if not token:
+            if breaker:
+                breaker.record_failure()
+            return None
+
+        if self.rate_limiter and not await self._acquire_rate(priority):
+            print(f"KIS API 호출 한도 초과, 조회 생략 ({symbol})")
+            if breaker:
+                breaker.cancel()
+            return None
+
+        url, headers, params = self.sync_client.price_request(symbol, token)
+        try:
+            data = await self._request('GET', url, headers, params=params, retry=True)
+            if breaker:
+                if self.sync_client.is_success(data):
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+            return self.sync_client.parse_price(symbol, data)
+        except (UpstreamError, ValueError) as e:
+            print(f"KIS API 주식 가격 조회 실패 ({symbol}): {e}")
+            if breaker:
+                breaker.record_failure()
+            return None
+
+
+class AsyncQuoteService:
+    """get_stock_quote/fetch_stock_prices의 asyncio 버전
+
+    시세 캐시(quote_cache), 마지막 정상 가격, 폴백 규칙은 app.py와 같은 객체/함수를 사용하고
+    종목별 동시 조회 병합(single-flight)만 이벤트 루프 안에서 처리한다.
+    """
+    def __init__(self, client, cache):
+        self.client = client
+        self.cache = cache
+        self._flights = {}         # symbol -> asyncio.Task
+        self._background = set()   # 마감을 넘겨 계속 진행 중인 조회
+
+    async def _load(self, symbol, priority):
+        """KIS API 조회 후 성공한 가격을 캐시와 마지막 정상 가격에 기록"""
+        price = None
+        try:
+            price = await self.client.get_stock_price(symbol, priority=priority)
+            if price:
+                core.last_known_good[symbol] = (price, time.time())
+        except Exception as e:
+            print(f"시세 캐시 갱신 실패 ({symbol}): {e}")
+        finally:
+            self._flights.pop(symbol, None)
+        self.cache.store(symbol, price)
+        return price
+
+    def _flight(self, symbol, priority, count=True):
+        """진행 중인 조회가 있으면 공유하고, 없으면 새로 시작"""
+        task = self._flights.get(symbol)
+        if task is not None:
+            if count:
+                core.QUOTE_CACHE_REQUESTS.labels(result='coalesced').inc()
+            return task
+        task = self._flights[symbol] = asyncio.ensure_future(self._load(symbol, priority))
+        if count:
+            core.QUOTE_CACHE_REQUESTS.labels(result='miss').inc()
+        return task
+
+    async def get_stock_quote(self, symbol, refresh=False, priority=PRIORITY_BULK):
+        """가격 조회 결과를 (price, stale, age_seconds)로 반환 (refresh=True면 캐시를 건너뛰고 갱신)"""
+        try:
+            price = None
+            if not refresh:
+                price, state = self.cache.lookup(symbol)
+                if state == 'stale':
+                    # 이전 값을 바로 반환하고 백그라운드에서 갱신
+                    self._flight(symbol, priority, count=False)
+            if price is None:
+                # 요청이 취소되어도 공유 중인 조회는 계속 진행
+                price = await asyncio.shield(self._flight(symbol, priority))
+            if price:
+                return price, False, None
+
+            # KIS API 실패/서킷 open 시 폴백
+            return core._fallback_quote(symbol)
+
+        except Exception as e:
+            print(f"주식 가격 조회 오류 ({symbol}): {e}")
+            return core._fallback_quote(symbol)
+
+    async def _timed_stock_quote(self, symbol, refresh, priority):
+        started = time.perf_counter()
+        price, stale, age = await self.get_stock_quote(symbol, refresh=refresh, priority=priority)
+        return price, stale, age, time.perf_counter() - started
+
+    async def fetch_stock_prices(self, symbols, deadline=core.STOCK_DATA_DEADLINE, refresh=False,
+                                 priority=PRIORITY_BULK):
+        """여러 종목을 동시에 조회하고 전체 마감 시간 내 결과만 수집 (반환 형식은 app.fetch_stock_prices와 동일)"""
+        started = time.perf_counter()
+        tasks = {
+            asyncio.ensure_future(self._timed_stock_quote(symbol, refresh, priority)): symbol
+            for symbol in symbols
+        }
+        if not tasks:
+            return {}
+        done, not_done = await asyncio.wait(tasks, timeout=deadline)
+
+        results = {}
+        for task in done:
+            symbol = tasks[task]
+            try:
+                price, stale, age, latency = task.result()
+                results[symbol] = (price, latency, stale, age)
+            except Exception as e:
+                print(f"주식 가격 조회 오류 ({symbol}): {e}")
+                price, _, age = core._fallback_quote(symbol)
+                results[symbol] = (price, time.perf_counter() - started, True, age)
+
+        for task in not_done:
+            symbol = tasks[task]
+            print(f"주식 가격 조회 마감 초과 ({symbol}): {deadline}s")
+            price, age = core._deadline_fallback(symbol)
+            results[symbol] = (price, time.perf_counter() - started, True, age)
+            # 늦게 끝난 조회도 캐시를 채우도록 계속 진행 (동기 모드와 동일)
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+        return results
+
+
+async_kis_client = AsyncKISClient(core.kis_client, KIS_ASYNC_POOL_SIZE)
+quote_service = AsyncQuoteService(async_kis_client, core.quote_cache)
+
+
+def _header(scope, name):
+    for key, value in scope.get('headers', ()):
+        if key == name:
+            return value.decode('latin-1')
+    return None
+
+
+async def _send_json(send, status, payload):
+    body = (core.app.json.dumps(payload) + '\n').encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _serve_native(scope, send, endpoint, handler):
+    """비동기 라우트 실행 - Flask 요청 훅과 같은 기록 함수로 메트릭(대기/처리 중/지연) 기록"""
+    started = time.perf_counter()
+    core.begin_request_metrics(endpoint, _header(scope, b'x-request-start'))
+    try:
+        try:
+            status, payload = await handler()
+        except Exception as e:
+            status, payload = 500, {'error': str(e)}
+        await _send_json(send, status, payload)
+        core.request_metrics.observe(scope['method'], endpoint, status, time.perf_counter() - started)
+    finally:
+        core.end_request_metrics(endpoint)
+
+
+async def _stock_data():
+    """/api/stock-data - 스냅샷이 없을 때 전 종목을 비동기로 직접 조회"""
+    market_status = core.current_market_status()
+    fetch_started = time.perf_counter()
+    stocks = core.build_stock_entries(await quote_service.fetch_stock_prices(core.stock_symbols.keys()))
+    fetch_latency = time.perf_counter() - fetch_started
+    return 200, core.stock_data_payload(stocks, fetch_latency, market_status)
+
+
+async def _stock_price(symbol):
+    """/api/stock-price/<symbol> - 스냅샷에 없는 종목을 비동기로 조회"""
+    current_price, stale, age = await quote_service.get_stock_quote(symbol, priority=PRIORITY_INTERACTIVE)
+    return 200, core.stock_price_payload(symbol, current_price, stale, age)
+
+
+def _batch_query(scope):
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True)
+    return {key: values[0] for key, values in query.items()}
+
+
+def _needs_upstream(scope):
+    """/api/stock-prices 요청에 스냅샷에 없는 종목이 있는지 (모두 스냅샷에 있으면 Flask 라우트로 처리)"""
+    requested, _, error = core.parse_batch_request(_batch_query(scope))
+    if error:
+        return False
+    return bool(core.split_batch_symbols(requested, core.quote_snapshot)[1])
+
+
+async def _stock_prices(scope):
+    """/api/stock-prices - 스냅샷에 없는 종목만 비동기로 일괄 조회"""
+    requested, fields, error = core.parse_batch_request(_batch_query(scope))
+    if error:
+        return 400, error
+
+    snapshot = core.quote_snapshot
+    resolved, missing = core.split_batch_symbols(requested, snapshot)
+    if missing:
+        quotes = await quote_service.fetch_stock_prices(missing, priority=PRIORITY_INTERACTIVE)
+        for stock in core.build_stock_entries(quotes):
+            resolved[stock['symbol']] = stock
+    return 200, core.stock_prices_payload(requested, fields, snapshot, resolved)
+
+
+# Flask 라우트는 a2wsgi로 스레드 풀에서 실행 (SSE는 일반 요청과 스레드를 나눠 쓰지 않도록 별도 풀)
+wsgi_app = WSGIMiddleware(core.app, workers=ASGI_WSGI_THREADS)
+stream_app = WSGIMiddleware(core.app, workers=core.SSE_MAX_SUBSCRIBERS + 1)
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            core.start_background_workers()
+            core.WORKER_THREADS_CAPACITY.set(ASGI_WSGI_THREADS)
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await async_kis_client.aclose()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI 진입점 - 업스트림 대기가 필요한 시세 라우트만 비동기 처리하고 나머지는 Flask로 위임"""
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    path = scope['path']
+    if scope['method'] == 'GET':
+        if path == '/api/stock-data' and core.quote_snapshot is None:
+            await _serve_native(scope, send, 'get_stock_data', _stock_data)
+            return
+        if path == '/api/stock-prices' and _needs_upstream(scope):
+            await _serve_native(scope, send, 'get_stock_prices', lambda: _stock_prices(scope))
+            return
+        if path.startswith(STOCK_PRICE_PREFIX):
+            symbol = path[len(STOCK_PRICE_PREFIX):]
+            snapshot = core.quote_snapshot
+            if symbol in core.stock_symbols and not (snapshot and symbol in snapshot.by_symbol):
+                await _serve_native(scope, send, 'get_stock_price', lambda: _stock_price(symbol))
+                return
+
+    await (stream_app if path in STREAM_PATHS else wsgi_app)(scope, receive, send)
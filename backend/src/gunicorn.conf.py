@@ -0,0 +1,44 @@
+# gunicorn 운영 서버 설정
+# 실행: gunicorn -c gunicorn.conf.py "app:create_app()"
+# asyncio 모드: GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker gunicorn -c gunicorn.conf.py asgi:app
+import os
+import shutil
+
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+bind = f"0.0.0.0:{os.getenv('PORT', '8081')}"
+
+# 앱을 마스터에서 한 번만 import 한 뒤 fork (워커 기동 시간/메모리 절감)
+preload_app = True
+
+# 워커 재활용 - 일정 요청 수마다 워커를 교체 (동시에 재시작되지 않도록 jitter 적용)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '2000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '200'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '20'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+accesslog = None
+errorlog = '-'
+
+# 스레드는 각 워커의 post_fork에서 기동 (마스터에서 만든 스레드는 fork 후 사라짐)
+os.environ.setdefault('BACKEND_DEFER_BACKGROUND_START', 'true')
+# prometheus_client는 import 시점에 멀티프로세스 모드를 결정하므로 앱 import 전에 설정
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus-multiproc')
+os.environ.setdefault('KIS_RATE_LIMIT_PROCESSES', str(workers))
+os.environ.setdefault('GUNICORN_THREADS', str(threads))
+
+# 이전 실행에서 남은 메트릭 파일 정리 (preload로 앱을 import 하기 전에 수행)
+shutil.rmtree(os.environ['PROMETHEUS_MULTIPROC_DIR'], ignore_errors=True)
+os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+
+def post_fork(server, worker):
+    import app
+    app.start_background_workers()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,303 @@
+# KIS API 호출 보호 장치
+# - TokenBucketRateLimiter: 계정 전체 호출 예산을 레플리카/워커 수로 나눈 우선순위 토큰 버킷
+# - CircuitBreaker: 연속 실패 시 업스트림 호출을 잠시 끊는 서킷 브레이커
+# - QuoteCache: 종목별 TTL 캐시 + 같은 종목 동시 조회를 하나로 합치는 single-flight
+# app.py에 의존하지 않으며, 메트릭은 on_* 콜백으로 넘겨받는다.
+import heapq
+import itertools
+import threading
+import time
+
+PRIORITY_INTERACTIVE = 0   # 단일 종목 조회 (/api/stock-price)
+PRIORITY_BULK = 1          # 전체 종목 일괄 갱신
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: 'interactive', PRIORITY_BULK: 'bulk'}
+
+
+class TokenBucketRateLimiter:
+    """우선순위 대기열을 가진 토큰 버킷
+
+    토큰은 (rate / replicas / processes) 속도로 채워지고 burst를 같은 비율로 나눈 개수까지 쌓인다.
+    대기열은 우선순위(작을수록 먼저) → 도착 순서로 처리하며 최대 max_queue 건까지 대기한다.
+    on_budget(파드별 초당 예산), on_wait(우선순위 이름, 대기 초), on_reject(우선순위 이름, 사유)는 메트릭용 콜백.
+    """
+    def __init__(self, rate, burst, max_queue, timeout, processes=1,
+                 on_budget=None, on_wait=None, on_reject=None):
+        self.rate = rate
+        self.burst = burst
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.replicas = 1
+        self.processes = max(int(processes), 1)
+        self.on_budget = on_budget
+        self.on_wait = on_wait
+        self.on_reject = on_reject
+        self._tokens = self._capacity()
+        self._updated_at = time.monotonic()
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        if self.on_budget:
+            self.on_budget(self.rate / self.replicas)
+
+    def _rate(self):
+        return self.rate / (self.replicas * self.processes)
+
+    def _capacity(self):
+        return max(self.burst / (self.replicas * self.processes), 1.0)
+
+    def _refill(self, now):
+        self._tokens = min(self._capacity(), self._tokens + (now - self._updated_at) * self._rate())
+        self._updated_at = now
+
+    def _reject(self, label, reason):
+        if self.on_reject:
+            self.on_reject(label, reason)
+        return False
+
+    def set_replicas(self, replicas):
+        """살아있는 레플리카 수에 맞춰 파드별 예산을 재조정"""
+        replicas = max(int(replicas), 1)
+        with self._cond:
+            if replicas == self.replicas:
+                return
+            self._refill(time.monotonic())
+            self.replicas = replicas
+            self._tokens = min(self._tokens, self._capacity())
+            if self.on_budget:
+                self.on_budget(self.rate / self.replicas)
+            self._cond.notify_all()
+
+    def acquire(self, priority=PRIORITY_BULK, timeout=None):
+        """토큰 1개를 획득 (대기열 초과/시간 초과 시 False)"""
+        label = PRIORITY_NAMES.get(priority, str(priority))
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        with self._cond:
+            if len(self._waiters) >= self.max_queue:
+                return self._reject(label, 'queue_full')
+            entry = [priority, next(self._sequence)]
+            heapq.heappush(self._waiters, entry)
+
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._waiters[0] is entry and self._tokens >= 1:
+                    heapq.heappop(self._waiters)
+                    self._tokens -= 1
+                    self._cond.notify_all()
+                    if self.on_wait:
+                        self.on_wait(label, now - started)
+                    return True
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    self._cond.notify_all()
+                    return self._reject(label, 'timeout')
+
+                if self._waiters[0] is entry:
+                    remaining = min(remaining, (1 - self._tokens) / self._rate())
+                self._cond.wait(remaining)
+
+    def try_acquire(self, priority=PRIORITY_BULK):
+        """대기하지 않고 토큰 1개 획득 시도 (asyncio 호출자용)
+
+        획득하면 0.0, 아니면 다시 시도할 때까지 기다릴 시간(초)을 반환한다.
+        같거나 높은 우선순위의 스레드 대기자가 있으면 그쪽에 양보한다.
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= 1:
+                if not self._waiters or self._waiters[0][0] > priority:
+                    self._tokens -= 1
+                    return 0.0
+                return 1 / self._rate()   # 앞선 대기자가 이번 토큰을 가져간 뒤 재시도
+            return (1 - self._tokens) / self._rate()
+
+
+class CircuitBreaker:
+    """closed → (연속 실패) → open → (대기 후) half_open → (시험 호출 성공) closed
+
+    open 상태에서는 업스트림을 호출하지 않고 즉시 거절하며,
+    half_open 상태에서는 한 번의 시험 호출만 허용한다.
+    on_state_change(상태)는 상태가 정해질 때마다, on_trip()은 open으로 바뀔 때 호출된다.
+    """
+    def __init__(self, failure_threshold, reset_timeout, clock=time.monotonic, on_state_change=None, on_trip=None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.on_state_change = on_state_change
+        self.on_trip = on_trip
+        self.state = 'closed'
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        if self.on_state_change:
+            self.on_state_change(self.state)
+
+    def _set_state(self, state):
+        self.state = state
+        if self.on_state_change:
+            self.on_state_change(state)
+
+    def allow(self):
+        """업스트림 호출 허용 여부"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open':
+                if self.clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._set_state('half_open')
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def cancel(self):
+        """허용받았지만 호출하지 않은 경우 (시험 호출 슬롯 반환)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self.state != 'closed':
+                print("KIS API 서킷 브레이커 복구 (closed)")
+                self._set_state('closed')
+
+    def record_failure(self):
+        with self._lock:
+            self._probe_in_flight = False
+            self._failures += 1
+            if self.state == 'half_open' or (self.state == 'closed' and self._failures >= self.failure_threshold):
+                print(f"KIS API 서킷 브레이커 open (연속 실패 {self._failures}회)")
+                self._opened_at = self.clock()
+                self._set_state('open')
+                if self.on_trip:
+                    self.on_trip()
+
+
+class _QuoteFlight:
+    """종목별 진행 중인 업스트림 조회 (single-flight)"""
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+class QuoteCache:
+    """종목별 시세 TTL 캐시
+
+    - TTL 이내: 캐시 값을 그대로 반환 (hit)
+    - TTL 초과 ~ TTL + stale 구간: 이전 값을 즉시 반환하고 백그라운드에서 갱신 (stale)
+    - 그 외: 업스트림 조회 (miss). 같은 종목의 동시 조회는 하나의 호출을 공유 (coalesced)
+    on_lookup(결과)은 조회마다 hit/stale/miss/coalesced 중 하나로 호출된다.
+    """
+    def __init__(self, ttl, stale_ttl, on_lookup=None):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.on_lookup = on_lookup
+        self._entries = {}    # symbol -> (price, fetched_at)
+        self._inflight = {}   # symbol -> _QuoteFlight
+        self._lock = threading.Lock()
+
+    def _count(self, result):
+        if self.on_lookup:
+            self.on_lookup(result)
+
+    def get(self, symbol, loader):
+        """캐시 정책에 따라 가격을 반환 (loader 실패 시 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None:
+                price, fetched_at = entry
+                age = now - fetched_at
+                if age < self.ttl:
+                    self._count('hit')
+                    return price
+                if age < self.ttl + self.stale_ttl:
+                    self._count('stale')
+                    if symbol not in self._inflight:
+                        flight = self._inflight[symbol] = _QuoteFlight()
+                        threading.Thread(
+                            target=self._load,
+                            args=(symbol, loader, flight),
+                            daemon=True
+                        ).start()
+                    return price
+
+            flight = self._inflight.get(symbol)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[symbol] = _QuoteFlight()
+                self._count('miss')
+            else:
+                self._count('coalesced')
+
+        if leader:
+            self._load(symbol, loader, flight)
+        else:
+            flight.done.wait()
+        return flight.value
+
+    def lookup(self, symbol):
+        """로더 없이 캐시만 확인 → (price, 'hit' | 'stale' | 'miss')
+
+        asyncio 모드처럼 조회/병합을 호출자가 직접 처리할 때 사용하며 hit/stale만 집계한다.
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None:
+                price, fetched_at = entry
+                age = time.monotonic() - fetched_at
+                if age < self.ttl:
+                    self._count('hit')
+                    return price, 'hit'
+                if age < self.ttl + self.stale_ttl:
+                    self._count('stale')
+                    return price, 'stale'
+        return None, 'miss'
+
+    def store(self, symbol, price):
+        """외부에서 조회한 가격을 캐시에 반영"""
+        if price is None:
+            return
+        with self._lock:
+            self._entries[symbol] = (price, time.monotonic())
+
+    def refresh(self, symbol, loader):
+        """TTL과 무관하게 업스트림에서 다시 조회 (진행 중인 조회가 있으면 공유)"""
+        with self._lock:
+            flight = self._inflight.get(symbol)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[symbol] = _QuoteFlight()
+                self._count('miss')
+            else:
+                self._count('coalesced')
+
+        if leader:
+            self._load(symbol, loader, flight)
+        else:
+            flight.done.wait()
+        return flight.value
+
+    def _load(self, symbol, loader, flight):
+        """업스트림 조회 후 결과를 캐시에 반영하고 대기 중인 요청을 깨움"""
+        try:
+            flight.value = loader(symbol)
+        except Exception as e:
+            print(f"시세 캐시 갱신 실패 ({symbol}): {e}")
+        finally:
+            with self._lock:
+                if flight.value is not None:
+                    self._entries[symbol] = (flight.value, time.monotonic())
+                self._inflight.pop(symbol, None)
+            flight.done.set()
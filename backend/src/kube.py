@@ -0,0 +1,31 @@
+# kubernetes 클라이언트 지연 import
+# import 비용이 커서 백그라운드 기동 단계에서 처음 필요할 때 load()로 불러오고,
+# 다른 모듈은 kube.ApiException처럼 호출 시점에 속성을 참조한다 (불러오기 전에는 자리 표시 예외).
+
+
+class KubernetesUnavailable(Exception):
+    """kubernetes 패키지를 불러오기 전(또는 없을 때) ApiException/ConfigException 자리 표시"""
+
+
+client = None
+config = None
+watch = None
+ApiException = KubernetesUnavailable
+ConfigException = KubernetesUnavailable
+
+
+def load():
+    """kubernetes 클라이언트 import (패키지가 없으면 False)"""
+    global client, config, watch, ApiException, ConfigException
+    if client is not None:
+        return True
+    try:
+        from kubernetes import client as k8s_client, config as k8s_config, watch as k8s_watch
+        from kubernetes.client.rest import ApiException as api_exception
+        from kubernetes.config.config_exception import ConfigException as config_exception
+    except Exception:  # kubernetes 패키지가 없거나 외부 환경에서 실행되는 경우
+        return False
+    config, watch = k8s_config, k8s_watch
+    ApiException, ConfigException = api_exception, config_exception
+    client = k8s_client
+    return True
@@ -0,0 +1,251 @@
+# 부하 생성기
+# - LoadEngine: 별도 프로세스에서 목표 CPU millicore를 피드백 제어로 유지
+# - MemoryBallast: 컨테이너 메모리 사용량을 목표 크기까지 점진적으로 늘리거나 줄임
+# 부모(app.py)는 stdin으로 목표값을 보내고, 자식은 stdout으로 측정값을 보고한다.
+#   부모 → 자식: {"target_millicores": 250}
+#   자식 → 부모: {"target_millicores": 250, "achieved_millicores": 248.7, "duty": 0.23, "source": "cgroup"}
+import json
+import mmap
+import os
+import subprocess
+import sys
+import threading
+import time
+
+CGROUP_V2_CPU_STAT = '/sys/fs/cgroup/cpu.stat'
+CGROUP_V1_CPU_USAGE = '/sys/fs/cgroup/cpuacct/cpuacct.usage'
+
+PWM_PERIOD = 0.05        # 부하/휴식 1주기 (초)
+CONTROL_INTERVAL = 0.5   # 측정 및 duty 보정 주기 (초)
+CONTROL_GAIN = 0.5       # 오차(코어 단위)에 대한 duty 보정 비율
+# 버너 스레드 하나가 낼 수 있는 최대 부하 (1코어) - 스레드를 늘려도 GIL 때문에 1코어를 넘지 못하므로 목표를 여기서 제한
+MAX_ENGINE_MILLICORES = 1000.0
+
+
+def _read_cgroup_usage():
+    """컨테이너 전체 CPU 사용 시간(초) - cgroup v2 → v1 순으로 시도"""
+    try:
+        with open(CGROUP_V2_CPU_STAT, 'r', encoding='utf-8') as f:
+            for line in f:
+                key, value = line.split()
+                if key == 'usage_usec':
+                    return int(value) / 1_000_000
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(CGROUP_V1_CPU_USAGE, 'r', encoding='utf-8') as f:
+            return int(f.read().strip()) / 1_000_000_000
+    except (OSError, ValueError):
+        return None
+
+
+def _read_process_usage():
+    """현재(엔진) 프로세스의 CPU 사용 시간(초)"""
+    times = os.times()
+    return times.user + times.system
+
+
+def choose_usage_source(feedback):
+    """feedback=cgroup이면 컨테이너 전체 사용량(요청 처리 포함)을 목표에 맞춤"""
+    if feedback == 'cgroup' and _read_cgroup_usage() is not None:
+        return 'cgroup', _read_cgroup_usage
+    return 'process', _read_process_usage
+
+
+def _burn(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(200))
+
+
+def run_engine(feedback='cgroup', max_millicores=1000):
+    """자식 프로세스 본체: stdin 명령을 받으며 PWM + 적분 제어로 CPU 사용량 유지"""
+    max_millicores = min(max_millicores, MAX_ENGINE_MILLICORES)
+    state = {'target': 0.0}
+    state_lock = threading.Lock()
+    stop = threading.Event()
+
+    def read_commands():
+        for line in sys.stdin:
+            try:
+                command = json.loads(line)
+            except ValueError:
+                continue
+            with state_lock:
+                state['target'] = min(max(float(command.get('target_millicores', 0)), 0.0), max_millicores)
+        stop.set()   # 부모 종료(stdin EOF) 시 함께 종료
+
+    threading.Thread(target=read_commands, daemon=True).start()
+
+    source, read_usage = choose_usage_source(feedback)
+    duty = 0.0
+    last_target = None
+    last_usage = read_usage()
+    last_wall = time.monotonic()
+    next_control = last_wall + CONTROL_INTERVAL
+
+    while not stop.is_set():
+        with state_lock:
+            target = state['target']
+        if target != last_target:
+            # 목표가 바뀌면 개루프 추정치에서 다시 시작 (수렴 시간 단축)
+            duty = min(target / 1000.0, 1.0)
+            last_target = target
+
+        busy = PWM_PERIOD * duty
+        if busy > 0:
+            _burn(busy)
+        if PWM_PERIOD - busy > 0:
+            stop.wait(PWM_PERIOD - busy)
+
+        now = time.monotonic()
+        if now < next_control:
+            continue
+        usage = read_usage()
+        elapsed = now - last_wall
+        achieved = (usage - last_usage) / elapsed * 1000 if elapsed > 0 else 0.0
+        last_usage, last_wall = usage, now
+        next_control = now + CONTROL_INTERVAL
+
+        if target <= 0:
+            duty = 0.0
+        else:
+            duty = min(max(duty + CONTROL_GAIN * (target - achieved) / 1000.0, 0.0), 1.0)
+
+        sys.stdout.write(json.dumps({
+            'target_millicores': target,
+            'achieved_millicores': round(achieved, 1),
+            'duty': round(duty, 3),
+            'source': source
+        }) + '\n')
+        sys.stdout.flush()
+
+
+class LoadEngine:
+    """부하 엔진 자식 프로세스를 관리 (요청 처리 스레드와 GIL을 공유하지 않음)"""
+    def __init__(self, feedback='cgroup', max_millicores=1000, on_report=None):
+        self.feedback = feedback
+        self.max_millicores = min(float(max_millicores), MAX_ENGINE_MILLICORES)
+        self.on_report = on_report
+        self.target_millicores = 0.0
+        self.last_report = None
+        self._process = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self):
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._process = subprocess.Popen(
+            [sys.executable, '-u', os.path.abspath(__file__),
+             '--feedback', self.feedback, '--max-millicores', str(self.max_millicores)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        threading.Thread(target=self._read_reports, args=(self._process,), daemon=True).start()
+
+    def _read_reports(self, process):
+        for line in process.stdout:
+            try:
+                report = json.loads(line)
+            except ValueError:
+                continue
+            self.last_report = report
+            if self.on_report:
+                self.on_report(report)
+
+    def set_target(self, millicores):
+        """목표 CPU 사용량(millicore) 설정 - 0이면 부하 중단"""
+        millicores = min(max(float(millicores), 0.0), self.max_millicores)
+        with self._lock:
+            if millicores == self.target_millicores and self._process is not None and self._process.poll() is None:
+                return
+            self.target_millicores = millicores
+            if millicores <= 0 and self._process is None:
+                return
+            self._ensure_process()
+            try:
+                self._process.stdin.write(json.dumps({'target_millicores': millicores}) + '\n')
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                print(f"부하 엔진 명령 전달 실패: {e}")
+                self._process = None
+
+
+class MemoryBallast:
+    """익명 mmap 청크로 메모리 작업 집합을 만들고 목표 크기까지 천천히 늘리거나 줄임
+
+    청크를 만들 때 모든 페이지에 기록하여 실제 RSS로 잡히게 하고,
+    줄일 때는 munmap으로 즉시 OS에 반환한다.
+    """
+    PAGE_SIZE = mmap.PAGESIZE
+
+    def __init__(self, chunk_bytes=16 * 1024 * 1024, ramp_bytes_per_sec=64 * 1024 * 1024, on_change=None):
+        self.chunk_bytes = chunk_bytes
+        self.ramp_bytes_per_sec = ramp_bytes_per_sec
+        self.on_change = on_change
+        self.target_bytes = 0
+        self._chunks = []
+        self._cond = threading.Condition()
+        self._thread = None
+
+    @property
+    def allocated_bytes(self):
+        return len(self._chunks) * self.chunk_bytes
+
+    def set_target(self, target_bytes):
+        """목표 크기 설정 (0이면 전부 반환)"""
+        with self._cond:
+            self.target_bytes = max(int(target_bytes), 0)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._ramp_loop, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _allocate_chunk(self):
+        chunk = mmap.mmap(-1, self.chunk_bytes)
+        for offset in range(0, self.chunk_bytes, self.PAGE_SIZE):
+            chunk[offset] = 1
+        return chunk
+
+    def _ramp_loop(self):
+        # 초당 ramp_bytes_per_sec 만큼씩 목표에 접근
+        step_interval = self.chunk_bytes / self.ramp_bytes_per_sec if self.ramp_bytes_per_sec > 0 else 0
+        while True:
+            with self._cond:
+                grow = self.allocated_bytes + self.chunk_bytes <= self.target_bytes
+                shrink = self.allocated_bytes > self.target_bytes
+                if not grow and not shrink:
+                    self._cond.wait()
+                    continue
+
+            if grow:
+                try:
+                    chunk = self._allocate_chunk()
+                except (OSError, ValueError) as e:
+                    print(f"메모리 부하 할당 실패: {e}")
+                    with self._cond:
+                        self.target_bytes = self.allocated_bytes
+                    continue
+                with self._cond:
+                    self._chunks.append(chunk)
+            else:
+                with self._cond:
+                    chunk = self._chunks.pop() if self._chunks else None
+                if chunk is not None:
+                    chunk.close()
+
+            if self.on_change:
+                self.on_change(self.allocated_bytes)
+            time.sleep(step_interval)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='closed-loop CPU load engine')
+    parser.add_argument('--feedback', default='cgroup', choices=('cgroup', 'process'))
+    parser.add_argument('--max-millicores', type=float, default=1000)
+    args = parser.parse_args()
+    run_engine(feedback=args.feedback, max_millicores=args.max_millicores)
@@ -0,0 +1,106 @@
+# Lease 하트비트 기반 레플리카 멤버십
+# 각 파드가 준비 완료 후 자신의 Lease를 주기적으로 갱신하고, 갱신 시각이 만료되지 않은 Lease 수를 레플리카 수로 본다.
+# app.py에 의존하지 않으며, CoordinationV1Api는 api 속성으로(클라이언트 초기화 후), 메트릭은 on_members 콜백으로 넘겨받는다.
+import threading
+from datetime import datetime, timedelta, timezone
+
+import kube
+
+MEMBERSHIP_LEASE_SELECTOR = 'app=backend,backend-membership=load-share'
+
+
+class ReplicaMembership:
+    """Lease 하트비트 기반 레플리카 멤버십 (클러스터 밖에서는 자기 자신만 멤버)
+
+    on_members(멤버 수)는 refresh()로 멤버 목록이 갱신될 때마다 호출된다.
+    """
+    def __init__(self, identity, ttl, api=None, namespace='default', lease_prefix='backend-member-',
+                 selector=MEMBERSHIP_LEASE_SELECTOR, gc_after=600.0, on_members=None):
+        self.identity = identity
+        self.ttl = ttl
+        self.api = api
+        self.namespace = namespace
+        self.lease_prefix = lease_prefix
+        self.selector = selector
+        self.gc_after = gc_after
+        self.on_members = on_members
+        self.members = [identity]
+        self.leader = identity              # 가장 먼저 참여한(acquireTime이 가장 이른) 살아있는 멤버
+        self.refreshed_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def lease_name(self):
+        return f"{self.lease_prefix}{self.identity}"
+
+    def heartbeat(self, now=None):
+        """자신의 Lease 갱신 (없으면 생성)"""
+        now = now or datetime.now(timezone.utc)
+        spec = {
+            'holderIdentity': self.identity,
+            'leaseDurationSeconds': self.ttl,
+            'renewTime': now.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        }
+        try:
+            self.api.patch_namespaced_lease(self.lease_name, self.namespace, {'spec': spec})
+        except kube.ApiException as exc:
+            if exc.status != 404:
+                raise
+            body = {
+                'apiVersion': 'coordination.k8s.io/v1',
+                'kind': 'Lease',
+                'metadata': {'name': self.lease_name, 'labels': dict(
+                    item.split('=', 1) for item in self.selector.split(',')
+                )},
+                'spec': dict(spec, acquireTime=spec['renewTime'])
+            }
+            self.api.create_namespaced_lease(self.namespace, body)
+
+    def refresh(self, now=None):
+        """만료되지 않은 Lease로 멤버 목록 갱신, 오래 만료된 Lease는 정리"""
+        now = now or datetime.now(timezone.utc)
+        leases = self.api.list_namespaced_lease(self.namespace, label_selector=self.selector)
+        members = {self.identity}
+        joined = {}
+        for lease in leases.items or []:
+            spec = lease.spec
+            if spec is None or spec.renew_time is None or not spec.holder_identity:
+                continue
+            expires_at = spec.renew_time + timedelta(seconds=spec.lease_duration_seconds or self.ttl)
+            if expires_at > now:
+                members.add(spec.holder_identity)
+                joined[spec.holder_identity] = spec.acquire_time or spec.renew_time
+            elif (now - expires_at).total_seconds() > self.gc_after:
+                try:
+                    self.api.delete_namespaced_lease(lease.metadata.name, self.namespace)
+                except kube.ApiException as exc:
+                    if exc.status != 404:
+                        print(f"만료된 멤버십 Lease 삭제 실패: {exc}")
+        with self._lock:
+            self.members = sorted(members)
+            # 축소 시 ReplicaSet은 보통 새 파드부터 지우므로, 가장 오래된 멤버를 대표로 삼아 교체를 줄임
+            self.leader = min(joined, key=lambda identity: (joined[identity], identity)) if joined else self.identity
+            self.refreshed_at = now
+            count = len(self.members)
+        if self.on_members:
+            self.on_members(count)
+        return self.members
+
+    def member_count(self):
+        with self._lock:
+            return len(self.members)
+
+    def is_leader(self):
+        """가장 오래된 멤버 여부 (클러스터 단위로 한 번만 기록할 값에 사용)"""
+        with self._lock:
+            return self.leader == self.identity
+
+    def status(self):
+        with self._lock:
+            return {
+                'identity': self.identity,
+                'members': list(self.members),
+                'count': len(self.members),
+                'leader': self.leader,
+                'refreshed_at': self.refreshed_at.isoformat() if self.refreshed_at else None
+            }
@@ -0,0 +1,183 @@
+# 스케일 반응 타임라인 - 시뮬레이션 전환 시각과 Deployment 레플리카 수 변화를 기록하여
+# 전환 → 첫 새 파드 Ready / 축소 시작 / 안정 상태까지 걸린 시간을 측정 (HPA behavior 튜닝 효과 비교용)
+# app.py에 의존하지 않으며, 전환의 부하 크기는 demand 콜백으로, 측정값은 on_result 콜백으로 주고받는다.
+import threading
+import time
+from collections import deque, namedtuple
+from datetime import datetime
+
+import kube
+
+ReplicaCounts = namedtuple('ReplicaCounts', ['desired', 'current', 'ready'])
+
+
+def transition_direction(previous, target, demand):
+    """전환이 부하를 늘리는지(up) 줄이는지(down) - demand(상태)는 비교 가능한 부하 크기 튜플을 반환"""
+    before, after = demand(previous), demand(target)
+    if before == after:
+        return None
+    if all(b <= a for b, a in zip(before, after)):
+        return 'up'
+    if all(b >= a for b, a in zip(before, after)):
+        return 'down'
+    return 'mixed'
+
+
+class ScaleTransition:
+    """시뮬레이션 전환 1회와 그 이후 관측한 레플리카 수 변화"""
+    def __init__(self, transition_id, at, previous, target, direction, baseline, reporting=True,
+                 steady_window=60.0, max_seconds=900.0, max_samples=300):
+        self.id = transition_id
+        self.at = at
+        self.previous = previous
+        self.target = target
+        self.direction = direction
+        self.baseline = baseline            # 전환 시점의 ReplicaCounts (관측 전이면 첫 관측값)
+        self.reporting = reporting          # 측정값을 on_result로 내보낼지 (전환 시점에 결정)
+        self.steady_window = steady_window  # 변화 없이 유지되어야 안정으로 판단(초)
+        self.max_seconds = max_seconds      # 추적 상한(초)
+        self.max_samples = max_samples
+        self.samples = []                   # [(경과 초, ReplicaCounts)] - 값이 바뀔 때만 추가
+        self.results = {}                   # 단계 → 경과 초
+        self.outcome = 'tracking'           # tracking → steady | superseded | timeout
+        self._changed_at = 0.0              # 마지막으로 레플리카 수가 바뀐 경과 시간
+
+    def observe(self, counts, now):
+        """관측값 반영, 새로 측정된 (단계, 초) 목록 반환"""
+        elapsed = max(now - self.at, 0.0)
+        if self.baseline is None:
+            self.baseline = counts
+        if not self.samples or self.samples[-1][1] != counts:
+            if self.samples:
+                self._changed_at = elapsed
+            if len(self.samples) < self.max_samples:
+                self.samples.append((round(elapsed, 3), counts))
+
+        measured = []
+        if self.direction == 'up' and 'first_new_pod' not in self.results and counts.ready > self.baseline.ready:
+            measured.append(('first_new_pod', elapsed))
+        if self.direction == 'down' and 'scale_down_lag' not in self.results \
+                and counts.desired < self.baseline.desired:
+            measured.append(('scale_down_lag', elapsed))
+        self.results.update(measured)
+
+        # 기대한 반응(새 파드/축소)이 나온 뒤 desired == current == ready 상태가 steady_window 동안 유지되면 안정
+        reacted = self.direction == 'mixed' or any(phase in self.results for phase in ('first_new_pod', 'scale_down_lag'))
+        settled = counts.desired == counts.current == counts.ready
+        if reacted and settled and elapsed - self._changed_at >= self.steady_window:
+            self.results['steady_state'] = self._changed_at
+            self.outcome = 'steady'
+            measured.append(('steady_state', self._changed_at))
+        elif elapsed >= self.max_seconds:
+            self.outcome = 'timeout'
+        return measured
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'at': datetime.fromtimestamp(self.at).isoformat(),
+            'from': {'traffic_level': self.previous[0], 'memory_level': self.previous[1]},
+            'to': {'traffic_level': self.target[0], 'memory_level': self.target[1]},
+            'direction': self.direction,
+            'outcome': self.outcome,
+            'reporting': self.reporting,
+            'baseline': self.baseline._asdict() if self.baseline else None,
+            'results_seconds': {phase: round(value, 1) for phase, value in self.results.items()},
+            'samples': [dict(counts._asdict(), elapsed_seconds=elapsed) for elapsed, counts in self.samples]
+        }
+
+
+class ScaleTimelineRecorder:
+    """시뮬레이션 전환과 Deployment 레플리카 수를 함께 기록
+
+    api는 read_namespaced_deployment(name, namespace)만 있으면 되므로 테스트에서는 가짜 클라이언트를,
+    clock으로는 가상 시계를 넘겨 HPA 반응을 재현할 수 있다.
+    demand((트래픽 레벨, 메모리 레벨))는 전환 방향을 정할 부하 크기 튜플을 반환한다.
+    on_result(direction, phase, seconds)는 측정값이 나올 때마다 호출된다.
+    should_report()는 전환을 기록하는 순간 한 번 평가되어, 그 전환의 측정값을 on_result로 보낼지 정한다
+    (나중에 대표 파드가 바뀌어도 전환을 처음부터 지켜본 프로세스가 끝까지 기록).
+    """
+    def __init__(self, demand, api=None, namespace='default', deployment='backend-deployment',
+                 clock=time.time, on_result=None, should_report=None, history=20,
+                 steady_window=60.0, max_seconds=900.0, max_samples=300):
+        self.demand = demand
+        self.api = api
+        self.namespace = namespace
+        self.deployment = deployment
+        self.clock = clock
+        self.on_result = on_result
+        self.should_report = should_report
+        self.steady_window = steady_window
+        self.max_seconds = max_seconds
+        self.max_samples = max_samples
+        self.transitions = deque(maxlen=history)
+        self.last_counts = None
+        self.last_observed_at = None
+        self.wake = threading.Event()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def record_transition(self, previous, target, now=None):
+        """시뮬레이션 전환 기록 (부하 변화가 없는 전환은 무시), 추적 중이던 이전 전환은 superseded로 종료"""
+        direction = transition_direction(previous, target, self.demand)
+        if direction is None:
+            return None
+        now = self.clock() if now is None else now
+        reporting = self.should_report() if self.should_report else True
+        with self._lock:
+            for transition in self.transitions:
+                if transition.outcome == 'tracking':
+                    transition.outcome = 'superseded'
+            transition = ScaleTransition(self._next_id, now, previous, target, direction, self.last_counts,
+                                         reporting=reporting, steady_window=self.steady_window,
+                                         max_seconds=self.max_seconds, max_samples=self.max_samples)
+            self._next_id += 1
+            self.transitions.append(transition)
+        self.wake.set()
+        return transition
+
+    def read_counts(self):
+        deployment = self.api.read_namespaced_deployment(self.deployment, self.namespace)
+        status = deployment.status
+        return ReplicaCounts(
+            desired=deployment.spec.replicas or 0,
+            current=status.replicas or 0,
+            ready=status.ready_replicas or 0
+        )
+
+    def poll_once(self, now=None):
+        """Deployment 레플리카 수를 한 번 조회해 추적 중인 전환에 반영"""
+        if self.api is None:
+            return None
+        try:
+            counts = self.read_counts()
+        except kube.ApiException as exc:
+            print(f"Deployment 레플리카 조회 실패: {exc}")
+            return None
+        now = self.clock() if now is None else now
+        measured = []
+        with self._lock:
+            self.last_counts = counts
+            self.last_observed_at = now
+            for transition in self.transitions:
+                if transition.outcome == 'tracking':
+                    results = transition.observe(counts, now)
+                    if transition.reporting:
+                        measured.extend((transition.direction, phase, seconds) for phase, seconds in results)
+        if self.on_result:
+            for direction, phase, seconds in measured:
+                self.on_result(direction, phase, seconds)
+        return counts
+
+    def tracking(self):
+        with self._lock:
+            return any(transition.outcome == 'tracking' for transition in self.transitions)
+
+    def timeline(self):
+        with self._lock:
+            return {
+                'deployment': self.deployment,
+                'observed': self.last_counts._asdict() if self.last_counts else None,
+                'observed_at': datetime.fromtimestamp(self.last_observed_at).isoformat() if self.last_observed_at else None,
+                'transitions': [transition.to_dict() for transition in reversed(self.transitions)]
+            }
@@ -0,0 +1,245 @@
+# 부하 시나리오 - 단계별 목표(레벨 또는 CPU %)와 전환(ramp) 시간을 가진 타임라인
+# 모든 레플리카가 ConfigMap의 공통 시작 시각(epoch)을 기준으로 같은 위치를 계산하여 동시에 실행한다.
+# app.py에 의존하지 않으며, 검증 기준은 ScenarioLimits로, 부하 반영은 ScenarioRunner의 apply 콜백으로 넘겨받는다.
+import json
+import math
+import threading
+import time
+from datetime import datetime
+
+# HPA behavior(안정화 창/정책 주기) 튜닝용 기본 형태
+SCENARIO_PRESETS = {
+    # 점진 증가 후 유지, 점진 감소 - scaleUp/scaleDown 정책 주기 확인
+    'ramp': {'steps': [
+        {'traffic_level': 'off', 'duration': 60},
+        {'traffic_level': 'high', 'ramp': 300, 'duration': 300},
+        {'traffic_level': 'off', 'ramp': 300, 'duration': 300}
+    ]},
+    # 순간 급증 후 복귀 - scaleUp 반응 시간과 scaleDown 안정화 창 확인
+    'spike': {'steps': [
+        {'traffic_level': 'off', 'duration': 60},
+        {'traffic_level': 'high', 'duration': 120},
+        {'traffic_level': 'off', 'duration': 420}
+    ]},
+    # 점진 증가 후 급락 반복 - 안정화 창보다 짧은 주기의 흔들림(flapping) 확인
+    'sawtooth': {'repeat': 4, 'steps': [
+        {'traffic_level': 'off', 'duration': 0},
+        {'traffic_level': 'high', 'ramp': 150, 'duration': 0},
+        {'traffic_level': 'off', 'duration': 60}
+    ]}
+}
+
+
+class ScenarioLimits:
+    """시나리오 검증 기준
+
+    level_targets: 트래픽 레벨 → CPU 목표(요청량 대비 %), memory_levels: 허용 메모리 레벨,
+    max_millicores / request_millicores: 부하 엔진 상한과 파드 CPU 요청량 (cpu_percent 상한 계산용)
+    """
+    def __init__(self, level_targets, memory_levels, max_millicores, request_millicores,
+                 max_steps=100, max_seconds=21600.0):
+        self.level_targets = level_targets
+        self.memory_levels = memory_levels
+        self.max_millicores = max_millicores
+        self.request_millicores = request_millicores
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+
+    @property
+    def max_percent(self):
+        return self.max_millicores / self.request_millicores * 100.0
+
+
+class TrafficScenario:
+    """부하 시나리오 타임라인
+
+    각 단계는 이전 단계 목표에서 ramp초 동안 선형으로 이동한 뒤 duration초 동안 유지한다.
+    목표는 파드 CPU 요청량 대비 %이며, traffic_level을 주면 ScenarioLimits.level_targets의 값을 쓴다.
+    첫 단계는 base_percent(기본 부하, off 레벨)에서 출발한다.
+    """
+    def __init__(self, name, steps, repeat=1, base_percent=0.0):
+        self.name = name
+        self.steps = steps
+        self.repeat = repeat
+        self.base_percent = base_percent
+        self.cycle_seconds = sum(step['ramp'] + step['duration'] for step in steps)
+        self.total_seconds = self.cycle_seconds * repeat
+
+    @classmethod
+    def from_spec(cls, spec, limits):
+        """요청/ConfigMap의 시나리오 정의를 검증하여 생성 (잘못된 정의는 ValueError)"""
+        if not isinstance(spec, dict):
+            raise ValueError('scenario must be an object')
+        preset = spec.get('preset')
+        if preset:
+            if preset not in SCENARIO_PRESETS:
+                raise ValueError(f"Unknown scenario preset: {preset}")
+            spec = dict(SCENARIO_PRESETS[preset], **{key: value for key, value in spec.items() if key != 'preset'})
+            spec.setdefault('name', preset)
+
+        raw_steps = spec.get('steps')
+        if not isinstance(raw_steps, list) or not raw_steps:
+            raise ValueError('steps must be a non-empty list')
+        if len(raw_steps) > limits.max_steps:
+            raise ValueError(f"Too many steps (max {limits.max_steps})")
+
+        max_percent = limits.max_percent
+        steps = []
+        for index, raw in enumerate(raw_steps):
+            if not isinstance(raw, dict):
+                raise ValueError(f"step {index}: must be an object")
+            level = raw.get('traffic_level')
+            if level is not None and level not in limits.level_targets:
+                raise ValueError(f"step {index}: unsupported traffic level {level}")
+            try:
+                percent = float(raw['cpu_percent']) if raw.get('cpu_percent') is not None \
+                    else limits.level_targets[level or 'off']
+                ramp = float(raw.get('ramp', 0))
+                duration = float(raw.get('duration', 0))
+            except (TypeError, ValueError):
+                raise ValueError(f"step {index}: cpu_percent/ramp/duration must be numbers")
+            if not 0 <= percent <= max_percent:
+                raise ValueError(
+                    f"step {index}: cpu_percent must be between 0 and {max_percent:.0f} "
+                    f"(load engine is limited to {limits.max_millicores:.0f} millicores)"
+                )
+            if ramp < 0 or duration < 0:
+                raise ValueError(f"step {index}: ramp/duration must not be negative")
+            memory_level = raw.get('memory_level', 'off')
+            if memory_level not in limits.memory_levels:
+                raise ValueError(f"step {index}: unsupported memory level {memory_level}")
+            step = {'cpu_percent': percent, 'ramp': ramp, 'duration': duration, 'memory_level': memory_level}
+            if level is not None:
+                step['traffic_level'] = level
+            steps.append(step)
+
+        try:
+            repeat = int(spec.get('repeat', 1))
+        except (TypeError, ValueError):
+            raise ValueError('repeat must be an integer')
+        scenario = cls(str(spec.get('name') or 'custom'), steps, repeat,
+                       base_percent=limits.level_targets.get('off', 0.0))
+        if repeat < 1 or scenario.total_seconds <= 0:
+            raise ValueError('scenario must have repeat >= 1 and a positive total duration')
+        if scenario.total_seconds > limits.max_seconds:
+            raise ValueError(f"Scenario too long ({scenario.total_seconds:.0f}s > {limits.max_seconds:.0f}s)")
+        return scenario
+
+    def to_json(self):
+        return json.dumps({'name': self.name, 'repeat': self.repeat, 'steps': self.steps},
+                          sort_keys=True, separators=(',', ':'))
+
+    def position(self, elapsed):
+        """시작 후 elapsed초 시점의 단계/진행률/목표"""
+        if elapsed >= self.total_seconds:
+            last = self.steps[-1]
+            return {
+                'finished': True, 'iteration': self.repeat - 1, 'step': len(self.steps) - 1,
+                'index': self.repeat * len(self.steps) - 1, 'step_progress': 1.0, 'progress': 1.0,
+                'cpu_percent': last['cpu_percent'], 'memory_level': last['memory_level']
+            }
+
+        elapsed = max(elapsed, 0.0)
+        iteration = int(elapsed // self.cycle_seconds)
+        offset = elapsed - iteration * self.cycle_seconds
+        # 첫 반복의 첫 단계는 기본 부하(off)에서, 이후는 직전 단계 목표에서 출발
+        previous = self.steps[-1]['cpu_percent'] if iteration > 0 else self.base_percent
+        for index, step in enumerate(self.steps):
+            length = step['ramp'] + step['duration']
+            if offset < length:
+                break
+            offset -= length
+            previous = step['cpu_percent']
+
+        if step['ramp'] > 0 and offset < step['ramp']:
+            percent = previous + (step['cpu_percent'] - previous) * offset / step['ramp']
+        else:
+            percent = step['cpu_percent']
+        return {
+            'finished': False, 'iteration': iteration, 'step': index,
+            'index': iteration * len(self.steps) + index,
+            'step_progress': offset / length if length > 0 else 1.0,
+            'progress': elapsed / self.total_seconds,
+            'cpu_percent': percent, 'memory_level': step['memory_level']
+        }
+
+
+def scenario_start_time(started_at, max_ahead, now=None):
+    """공통 시작 시각 검증 (NaN/무한대 또는 max_ahead초보다 먼 미래면 ValueError)"""
+    if not math.isfinite(started_at) or started_at < 0:
+        raise ValueError(f'invalid scenario start time: {started_at}')
+    now = time.time() if now is None else now
+    if started_at > now + max_ahead:
+        raise ValueError(f'scenario start time is more than {max_ahead:.0f}s away')
+    return started_at
+
+
+class ScenarioRunner:
+    """공통 시작 시각 기준으로 tick_interval마다 시나리오 위치를 계산해 apply(runner, position)로 반영
+
+    apply가 False를 반환하면(반영 직전에 취소됨) 실행을 멈춘다.
+    """
+    def __init__(self, scenario, started_at, apply, tick_interval=1.0):
+        self.scenario = scenario
+        self.started_at = started_at
+        self.apply = apply
+        self.tick_interval = tick_interval
+        self.position = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            elapsed = time.time() - self.started_at
+            if elapsed < 0:
+                self._stop_event.wait(min(-elapsed, self.tick_interval))
+                continue
+            position = self.scenario.position(elapsed)
+            self.position = position
+            try:
+                if not self.apply(self, position):
+                    return   # 반영 직전에 취소됨
+            except Exception as e:
+                print(f"시나리오 반영 실패 ({self.scenario.name}): {e}")
+            if position['finished']:
+                print(f"부하 시나리오 완료: {self.scenario.name}")
+                return
+            # 레플리카끼리 같은 경계에서 갱신하도록 시작 시각 기준 주기에 맞춰 대기
+            self._stop_event.wait(self.tick_interval - elapsed % self.tick_interval)
+
+    def status(self):
+        position = self.position
+        elapsed = time.time() - self.started_at
+        if position is None:
+            state = 'scheduled'
+        else:
+            state = 'completed' if position['finished'] else 'running'
+        status = {
+            'name': self.scenario.name,
+            'state': state,
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(),
+            'elapsed_seconds': round(max(elapsed, 0.0), 1),
+            'total_seconds': self.scenario.total_seconds,
+            'repeat': self.scenario.repeat,
+            'step_count': len(self.scenario.steps),
+            'steps': self.scenario.steps
+        }
+        if position is not None:
+            step = self.scenario.steps[position['step']]
+            status.update({
+                'iteration': position['iteration'],
+                'step': position['step'],
+                'step_progress': round(position['step_progress'], 3),
+                'progress': round(position['progress'], 3),
+                'target_cpu_percent': round(position['cpu_percent'], 1),
+                'step_traffic_level': step.get('traffic_level')
+            })
+        return status
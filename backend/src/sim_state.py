@@ -0,0 +1,54 @@
+# 시뮬레이션 상태 공유(ConfigMap) 규칙
+# - 상태 기본값과 레플리카 간 변경 요청 순서 비교 (generation 충돌 해결)
+# - watch 재연결 backoff
+# app.py에 의존하지 않으며, ConfigMap 읽기/쓰기와 로컬 상태 반영은 app.py가 맡는다.
+
+
+def default_state():
+    return {
+        'traffic_level': 'off',
+        'simulation_active': False,
+        'emergency_mode': False,
+        'memory_level': 'off',
+        'scenario': None,
+        'scenario_started_at': None,
+        'cluster_load': None,
+        'generation': 0,
+        'requested_at': 0.0,
+        'requested_by': ''
+    }
+
+
+def request_order(state):
+    """변경 요청 순서 키 (요청 시각, 요청받은 파드) - 레플리카 간 충돌 시 나중 요청이 이김"""
+    return state.get('requested_at', 0.0), state.get('requested_by', '')
+
+
+def resolve_write_conflict(local_generation, local_order, remote):
+    """기록 직전 ConfigMap 상태(remote)와 로컬 변경 비교 → (remote_wins, 로컬이 쓸 generation)
+
+    원격 변경이 더 나중에 요청되었으면 로컬 변경을 버리고 원격 generation을 따른다
+    (로컬 generation이 원격보다 큰 부분은 기록되지 않은 변경뿐). 로컬이 나중이면 원격 generation 뒤 순번으로 기록한다.
+    """
+    if request_order(remote) > local_order:
+        return True, remote['generation']
+    if remote['generation'] >= local_generation:
+        return False, remote['generation'] + 1
+    return False, local_generation
+
+
+class WatchBackoff:
+    """watch 재연결 대기 시간 - 실패할 때마다 두 배(최대 maximum), 정상 종료 시 initial로 복귀"""
+    def __init__(self, initial=1.0, maximum=30.0):
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = initial
+
+    def failed(self):
+        """이번에 기다릴 시간(초)을 반환하고 다음 대기 시간을 늘림"""
+        delay = self.delay
+        self.delay = min(self.delay * 2, self.maximum)
+        return delay
+
+    def reset(self):
+        self.delay = self.initial
@@ -0,0 +1,51 @@
+# 백엔드 테스트 공통 설정
+# app import 전에 백그라운드 스레드/외부 호출을 끄고, src와 bench(대역 객체)를 import 경로에 추가한다.
+import contextlib
+import io
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'src'))
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'bench'))
+
+os.environ.update({
+    'KIS_TOKEN_STORE': 'off',
+    'QUOTE_POLL_ENABLED': 'false',
+    'BACKEND_DEFER_BACKGROUND_START': 'true',
+    'SIMULATION_ENABLED': 'true',
+    'SIM_STATE_WRITE_RETRIES': '5'
+})
+os.environ.pop('PROMETHEUS_MULTIPROC_DIR', None)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    return app_module
+
+
+@pytest.fixture(autouse=True)
+def no_load_generation(monkeypatch):
+    """테스트 중에는 CPU 부하 스레드가 실제 부하를 만들지 않도록 잠금을 얻지 못한 프로세스처럼 동작"""
+    monkeypatch.setattr(app_module, 'holds_load_generator_lock', lambda: False)
+
+
+@pytest.fixture
+def reset_simulation(app):
+    """시뮬레이션 상태/generation을 초기값으로 되돌리고, 끝나면 실행 중인 시뮬레이션을 정리"""
+    def reset():
+        app.cancel_load_programs()
+        app.stop_active_simulation(persist=False, record=False)
+        with app.simulation_state_lock:
+            app.simulation_generation = 0
+            app.simulation_pending_generation = 0
+            app.simulation_requested_at = 0.0
+            app.simulation_requested_by = ''
+    reset()
+    yield
+    reset()
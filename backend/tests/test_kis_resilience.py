@@ -0,0 +1,162 @@
+# KIS 호출 보호 장치 - 토큰 버킷, 서킷 브레이커, 시세 캐시 single-flight와 대역 서버 연동
+import threading
+import time
+
+import pytest
+import requests
+
+from fake_k8s import FakeClock
+from fake_kis import BASE_PRICES, FakeKISConfig, start_fake_kis
+from kis_resilience import PRIORITY_BULK, PRIORITY_INTERACTIVE, CircuitBreaker, QuoteCache, TokenBucketRateLimiter
+
+
+def test_token_bucket_rejects_when_queue_is_full_or_wait_times_out():
+    rejected = []
+    limiter = TokenBucketRateLimiter(rate=1, burst=1, max_queue=1, timeout=0.05,
+                                     on_reject=lambda priority, reason: rejected.append((priority, reason)))
+    assert limiter.acquire()
+    assert not limiter.acquire()
+    assert rejected == [('bulk', 'timeout')]
+
+    limiter.max_queue = 0
+    assert not limiter.acquire(PRIORITY_INTERACTIVE)
+    assert rejected[-1] == ('interactive', 'queue_full')
+
+
+def test_token_bucket_serves_interactive_waiters_first():
+    limiter = TokenBucketRateLimiter(rate=10, burst=1, max_queue=8, timeout=2.0)
+    assert limiter.acquire()
+    order = []
+
+    def take(priority, name):
+        limiter.acquire(priority)
+        order.append(name)
+
+    bulk = threading.Thread(target=take, args=(PRIORITY_BULK, 'bulk'))
+    bulk.start()
+    time.sleep(0.02)
+    interactive = threading.Thread(target=take, args=(PRIORITY_INTERACTIVE, 'interactive'))
+    interactive.start()
+    bulk.join()
+    interactive.join()
+    assert order == ['interactive', 'bulk']
+
+
+def test_token_bucket_splits_budget_across_replicas_and_processes():
+    budgets = []
+    limiter = TokenBucketRateLimiter(rate=18, burst=18, max_queue=8, timeout=1.0, processes=2,
+                                     on_budget=budgets.append)
+    limiter.set_replicas(3)
+    limiter.set_replicas(3)
+    assert budgets == [18.0, 6.0]
+    assert limiter._rate() == pytest.approx(3.0)
+    assert limiter._capacity() == pytest.approx(3.0)
+
+
+def test_try_acquire_returns_wait_time_when_empty():
+    limiter = TokenBucketRateLimiter(rate=10, burst=1, max_queue=8, timeout=1.0)
+    assert limiter.try_acquire() == 0.0
+    wait = limiter.try_acquire()
+    assert 0 < wait <= 0.1
+
+
+def test_circuit_breaker_opens_probes_once_and_recovers():
+    clock = FakeClock(start=0.0)
+    states, trips = [], []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock,
+                             on_state_change=states.append, on_trip=lambda: trips.append(1))
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open' and not breaker.allow()
+
+    clock.advance(30)
+    assert breaker.allow()            # 시험 호출 1건
+    assert not breaker.allow()
+    breaker.record_failure()          # 시험 호출 실패 → 다시 open
+    assert breaker.state == 'open' and len(trips) == 2
+
+    clock.advance(30)
+    assert breaker.allow()
+    breaker.cancel()                  # 호출하지 않았으면 슬롯 반환
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.allow()
+    assert states == ['closed', 'open', 'half_open', 'open', 'half_open', 'closed']
+
+
+def test_quote_cache_coalesces_concurrent_misses():
+    results = []
+    release = threading.Event()
+    calls = []
+
+    def loader(symbol):
+        calls.append(symbol)
+        release.wait(2)
+        return 1000.0
+
+    cache = QuoteCache(ttl=60, stale_ttl=60, on_lookup=results.append)
+    values = []
+    threads = [threading.Thread(target=lambda: values.append(cache.get('005930', loader))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['005930']
+    assert values == [1000.0] * 5
+    assert sorted(results) == ['coalesced'] * 4 + ['miss']
+    assert cache.get('005930', loader) == 1000.0 and results[-1] == 'hit'
+
+
+def test_quote_cache_serves_stale_value_while_refreshing():
+    cache = QuoteCache(ttl=0, stale_ttl=60)
+    cache.store('005930', 1000.0)
+    refreshed = threading.Event()
+
+    def loader(symbol):
+        refreshed.set()
+        return 1100.0
+
+    assert cache.get('005930', loader) == 1000.0
+    assert refreshed.wait(1)
+    deadline = time.monotonic() + 1
+    while cache.lookup('005930')[0] != 1100.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.lookup('005930') == (1100.0, 'stale')
+
+
+def test_quote_cache_returns_none_when_loader_fails():
+    cache = QuoteCache(ttl=60, stale_ttl=60)
+    assert cache.get('005930', lambda symbol: 1 / 0) is None
+    assert cache.lookup('005930') == (None, 'miss')
+
+
+@pytest.fixture
+def fake_kis(app, monkeypatch):
+    server = start_fake_kis(FakeKISConfig(seed=1))
+    monkeypatch.setattr(app, 'KIS_BASE_URL', server.base_url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_kis_client_reads_price_from_fake_server(app, fake_kis):
+    client = app.KISAPIClient(session=requests.Session())
+    price = client.get_stock_price('005930')
+    assert price == pytest.approx(BASE_PRICES['005930'], rel=0.03)
+    client.get_stock_price('000660')
+    assert fake_kis.stats['token'] == 1
+    assert fake_kis.stats['price'] == 2
+
+
+def test_kis_client_stops_calling_upstream_once_breaker_opens(app, fake_kis):
+    fake_kis.config.error_rate = 1.0
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    client = app.KISAPIClient(session=requests.Session(), circuit_breaker=breaker)
+
+    assert [client.get_stock_price('005930') for _ in range(4)] == [None] * 4
+    assert fake_kis.stats['errors'] == 2
+    assert breaker.state == 'open'
@@ -0,0 +1,92 @@
+# Lease 멤버십과 스케일 타임라인 기록기
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import kube
+from fake_k8s import FakeApiException, FakeClock, FakeDeploymentClient, FakeLeaseClient
+from membership import MEMBERSHIP_LEASE_SELECTOR, ReplicaMembership
+from scale_timeline import ScaleTimelineRecorder, transition_direction
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def fake_api_exception(monkeypatch):
+    monkeypatch.setattr(kube, 'ApiException', FakeApiException)
+
+
+def test_heartbeat_creates_lease_when_missing():
+    api = FakeLeaseClient()
+    membership = ReplicaMembership('pod-a', ttl=15, api=api)
+    membership.heartbeat(now=NOW)
+
+    lease = api.leases['backend-member-pod-a']
+    assert lease.spec.holder_identity == 'pod-a'
+    assert lease.spec.acquire_time == NOW
+    assert lease.metadata.labels == dict(item.split('=') for item in MEMBERSHIP_LEASE_SELECTOR.split(','))
+
+    membership.heartbeat(now=NOW + timedelta(seconds=5))
+    assert lease.spec.renew_time == NOW + timedelta(seconds=5)
+    assert lease.spec.acquire_time == NOW
+
+
+def test_refresh_counts_live_leases_and_elects_oldest_member():
+    api = FakeLeaseClient()
+    counts = []
+    membership = ReplicaMembership('pod-a', ttl=15, api=api, gc_after=600, on_members=counts.append)
+    membership.heartbeat(now=NOW)
+    api.add('backend-member-pod-b', 'pod-b', renew_time=NOW, acquire_time=NOW - timedelta(hours=1))
+    api.add('backend-member-pod-c', 'pod-c', renew_time=NOW - timedelta(seconds=30))      # 만료, 정리 전
+    api.add('backend-member-pod-d', 'pod-d', renew_time=NOW - timedelta(seconds=900))     # 오래 만료 → 삭제
+
+    assert membership.refresh(now=NOW) == ['pod-a', 'pod-b']
+    assert counts == [2]
+    assert membership.status()['leader'] == 'pod-b'
+    assert not membership.is_leader()
+    assert api.deleted == ['backend-member-pod-d']
+    assert 'backend-member-pod-c' in api.leases
+
+
+def test_single_member_outside_cluster_is_leader():
+    membership = ReplicaMembership('pod-a', ttl=15)
+    assert membership.member_count() == 1
+    assert membership.is_leader()
+
+
+def demand(state):
+    levels = {'off': 15.0, 'low': 22.0, 'high': 105.0}
+    memory = {'off': 0.0, 'low': 15.0}
+    return levels[state[0]], memory[state[1]]
+
+
+def test_transition_direction():
+    assert transition_direction(('off', 'off'), ('off', 'off'), demand) is None
+    assert transition_direction(('off', 'off'), ('high', 'low'), demand) == 'up'
+    assert transition_direction(('high', 'off'), ('low', 'off'), demand) == 'down'
+    assert transition_direction(('high', 'off'), ('low', 'low'), demand) == 'mixed'
+
+
+def test_recorder_measures_scale_up_milestones():
+    clock = FakeClock()
+    api = FakeDeploymentClient(replicas=2)
+    results = []
+    recorder = ScaleTimelineRecorder(demand, api=api, clock=clock, steady_window=30,
+                                     on_result=lambda *result: results.append(result))
+    recorder.poll_once()
+    recorder.record_transition(('off', 'off'), ('high', 'off'))
+
+    clock.advance(20)
+    api.set(desired=4, current=4, ready=2)
+    recorder.poll_once()
+    clock.advance(25)
+    api.set(ready=3)
+    recorder.poll_once()
+    clock.advance(5)
+    api.set(ready=4)
+    recorder.poll_once()
+    clock.advance(30)
+    recorder.poll_once()
+
+    assert results == [('up', 'first_new_pod', 45.0), ('up', 'steady_state', 50.0)]
+    assert not recorder.tracking()
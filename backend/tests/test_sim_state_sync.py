@@ -0,0 +1,176 @@
+# ConfigMap 상태 동기화 - 기록 충돌 해결(요청 순서/generation)과 watch 재연결
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import kube
+import sim_state
+from fake_k8s import FakeApiException, FakeConfigMapClient, FakeWatch, WatchExhausted, fake_client_module
+from prometheus_client import REGISTRY
+
+NAME = 'backend-simulation-state'
+
+
+@pytest.fixture
+def configmaps(app, monkeypatch, reset_simulation):
+    api = FakeConfigMapClient()
+    monkeypatch.setattr(app, 'k8s_enabled', True)
+    monkeypatch.setattr(app, 'k8s_core_v1', api)
+    monkeypatch.setattr(app, 'k8s_client', fake_client_module)
+    monkeypatch.setattr(app, 'ApiException', FakeApiException)
+    monkeypatch.setattr(kube, 'ApiException', FakeApiException)
+    monkeypatch.setattr(app, 'SIM_STATE_CONFIGMAP_NAME', NAME)
+    return api
+
+
+def remote_change(generation, requested_at, requested_by='pod-b', **fields):
+    """다른 레플리카가 기록한 ConfigMap 데이터"""
+    data = {key: 'false' if value is False else 'true' if value is True else str(value)
+            for key, value in dict(sim_state.default_state(), **fields).items() if value is not None}
+    data.update(generation=str(generation), requested_at=repr(requested_at), requested_by=requested_by)
+    return data
+
+
+def conflicts():
+    return REGISTRY.get_sample_value('backend_simulation_state_write_conflicts_total') or 0.0
+
+
+def test_request_order_and_conflict_resolution():
+    remote = {'generation': 4, 'requested_at': 20.0, 'requested_by': 'pod-b'}
+    assert sim_state.resolve_write_conflict(2, (10.0, 'pod-a'), remote) == (True, 4)
+    assert sim_state.resolve_write_conflict(2, (30.0, 'pod-a'), remote) == (False, 5)
+    assert sim_state.resolve_write_conflict(9, (30.0, 'pod-a'), remote) == (False, 9)
+    # 같은 시각이면 파드 이름으로 순서를 정함
+    assert sim_state.resolve_write_conflict(9, (20.0, 'pod-c'), remote) == (False, 9)
+    assert sim_state.resolve_write_conflict(9, (20.0, 'pod-a'), remote) == (True, 4)
+
+
+def test_watch_backoff_doubles_up_to_maximum_and_resets():
+    backoff = sim_state.WatchBackoff(initial=1.0, maximum=5.0)
+    assert [backoff.failed() for _ in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    backoff.reset()
+    assert backoff.failed() == 1.0
+
+
+def test_write_creates_missing_configmap(app, configmaps):
+    generation = app.persist_simulation_state()
+    app._write_simulation_state()
+
+    stored = configmaps.maps[NAME].data
+    assert stored['generation'] == str(generation)
+    assert stored['requested_by'] == app.SIM_STATE_REQUESTER
+    assert app.simulation_pending_generation == 0
+
+
+def test_later_local_change_is_written_after_remote_generation(app, configmaps):
+    configmaps.put(NAME, remote_change(5, time.time() - 10))
+    app.persist_simulation_state()
+    app._write_simulation_state()
+
+    stored = configmaps.maps[NAME].data
+    assert stored['generation'] == '6'
+    assert stored['requested_by'] == app.SIM_STATE_REQUESTER
+    assert app.simulation_generation == 6
+    assert app.simulation_pending_generation == 0
+
+
+def test_later_remote_change_is_applied_instead_of_overwritten(app, configmaps):
+    app.persist_simulation_state()
+    configmaps.put(NAME, remote_change(3, time.time() + 5, simulation_active=True, traffic_level='low'))
+    app._write_simulation_state()
+
+    assert configmaps.writes == 0
+    assert configmaps.maps[NAME].data['requested_by'] == 'pod-b'
+    assert app.traffic_simulation_active and app.current_traffic_level == 'low'
+    assert app.simulation_generation == 3
+    assert app.simulation_pending_generation == 0
+    assert app.simulation_requested_by == 'pod-b'
+
+
+def test_later_remote_change_with_lower_generation_still_wins(app, configmaps):
+    for _ in range(3):
+        app.persist_simulation_state()
+    configmaps.put(NAME, remote_change(1, time.time() + 5, simulation_active=True, traffic_level='medium'))
+    app._write_simulation_state()
+
+    assert app.current_traffic_level == 'medium'
+    assert app.simulation_generation == 1
+
+    # 이후 원격 변경도 generation 비교에 막히지 않고 반영
+    app._apply_desired_state(app._strings_to_state(remote_change(2, time.time() + 6, simulation_active=False)))
+    assert not app.traffic_simulation_active
+    assert app.simulation_generation == 2
+
+
+def test_conflicting_write_rereads_and_applies_later_remote_change(app, configmaps):
+    configmaps.put(NAME, remote_change(1, time.time() - 10))
+    app.persist_simulation_state()
+    configmaps.interleave.append(
+        lambda: configmaps.put(NAME, remote_change(2, time.time() + 5, simulation_active=True, traffic_level='low'))
+    )
+    before = conflicts()
+    app._write_simulation_state()
+
+    assert conflicts() == before + 1
+    assert configmaps.writes == 0
+    assert app.current_traffic_level == 'low'
+    assert app.simulation_generation == 2
+
+
+def test_conflicting_write_retries_when_local_change_is_later(app, configmaps):
+    configmaps.put(NAME, remote_change(1, time.time() - 10))
+    app.persist_simulation_state()
+    configmaps.interleave.append(lambda: configmaps.put(NAME, remote_change(4, time.time() - 5)))
+    app._write_simulation_state()
+
+    assert configmaps.writes == 1
+    assert configmaps.maps[NAME].data['generation'] == '5'
+    assert configmaps.maps[NAME].data['requested_by'] == app.SIM_STATE_REQUESTER
+
+
+def test_write_gives_up_after_retries_and_clears_pending(app, configmaps, monkeypatch):
+    monkeypatch.setattr(app, 'SIM_STATE_WRITE_RETRIES', 2)
+    configmaps.put(NAME, remote_change(1, time.time() - 10))
+    app.persist_simulation_state()
+    configmaps.interleave.extend([lambda: configmaps.put(NAME, remote_change(1, time.time() - 10))] * 2)
+    app._write_simulation_state()
+
+    assert configmaps.writes == 0
+    assert app.simulation_pending_generation == 0
+
+
+def test_remote_state_is_ignored_while_local_change_is_pending(app, configmaps):
+    app.persist_simulation_state()
+    app._apply_desired_state(app._strings_to_state(remote_change(9, time.time() + 5, simulation_active=True,
+                                                                 traffic_level='high')))
+    assert not app.traffic_simulation_active
+    assert app.simulation_generation == 1
+
+
+def _config_map(data, resource_version):
+    return SimpleNamespace(metadata=SimpleNamespace(name=NAME, resource_version=resource_version), data=data)
+
+
+def test_watch_backs_off_on_error_events_and_resyncs_after_expiry(app, configmaps, monkeypatch):
+    configmaps.put(NAME, remote_change(0, 0.0, requested_by=''))
+    watch = FakeWatch([
+        [{'type': 'ERROR', 'object': {'code': 500, 'message': 'internal error'}}],
+        [{'type': 'ERROR', 'object': {'code': 403, 'message': 'forbidden'}}],
+        [{'type': 'ERROR', 'object': {'code': 410, 'message': 'too old resource version'}}],
+        [{'type': 'MODIFIED', 'object': _config_map(remote_change(7, time.time()), '42')}],
+        [{'type': 'ERROR', 'object': {'code': 500, 'message': 'internal error'}}],
+    ])
+    sleeps = []
+    monkeypatch.setattr(app, 'k8s_watch', watch)
+    monkeypatch.setattr(app.time, 'sleep', sleeps.append)
+
+    with pytest.raises(WatchExhausted):
+        app._simulation_state_sync_loop()
+
+    # 오류 이벤트는 1s → 2s로 늘려 재연결, 410은 대기 없이 전체를 다시 읽고, 정상 스트림 뒤에는 backoff 초기화
+    assert sleeps == [1.0, 2.0, 1.0]
+    assert configmaps.reads == 2
+    assert [call['resource_version'] for call in watch.calls] == ['1', '1', '1', '1', '42', '42']
+    assert app.simulation_generation == 7
+    assert app.simulation_state_resource_version == '42'
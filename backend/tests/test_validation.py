@@ -0,0 +1,149 @@
+# 사용자 입력/ConfigMap 값 검증 경로
+import json
+import math
+import time
+
+import pytest
+
+from scenarios import SCENARIO_PRESETS, ScenarioLimits, TrafficScenario, scenario_start_time
+
+LIMITS = ScenarioLimits(
+    {'off': 15.0, 'low': 22.0, 'medium': 75.0, 'high': 105.0}, {'off': 0.0, 'low': 15.0},
+    max_millicores=1000.0, request_millicores=100.0, max_steps=3, max_seconds=3600.0
+)
+
+
+@pytest.mark.parametrize('spec, message', [
+    ([], 'scenario must be an object'),
+    ({'preset': 'bogus'}, 'Unknown scenario preset'),
+    ({}, 'steps must be a non-empty list'),
+    ({'steps': []}, 'steps must be a non-empty list'),
+    ({'steps': [{'duration': 1}] * 4}, 'Too many steps'),
+    ({'steps': ['high']}, 'step 0: must be an object'),
+    ({'steps': [{'traffic_level': 'extreme', 'duration': 1}]}, 'unsupported traffic level'),
+    ({'steps': [{'cpu_percent': 'lots', 'duration': 1}]}, 'must be numbers'),
+    ({'steps': [{'cpu_percent': 1001, 'duration': 1}]}, 'cpu_percent must be between 0 and 1000'),
+    ({'steps': [{'cpu_percent': float('nan'), 'duration': 1}]}, 'cpu_percent must be between'),
+    ({'steps': [{'traffic_level': 'low', 'ramp': -1, 'duration': 1}]}, 'must not be negative'),
+    ({'steps': [{'traffic_level': 'low', 'duration': 1, 'memory_level': 'high'}]}, 'unsupported memory level'),
+    ({'repeat': 'twice', 'steps': [{'duration': 1}]}, 'repeat must be an integer'),
+    ({'repeat': 0, 'steps': [{'duration': 1}]}, 'repeat >= 1'),
+    ({'steps': [{'traffic_level': 'high', 'duration': 0}]}, 'positive total duration'),
+    ({'steps': [{'traffic_level': 'high', 'duration': 3601}]}, 'Scenario too long'),
+])
+def test_scenario_spec_rejects_invalid_definitions(spec, message):
+    with pytest.raises(ValueError, match=message):
+        TrafficScenario.from_spec(spec, LIMITS)
+
+
+def test_scenario_presets_are_valid_with_app_limits(app):
+    for preset in SCENARIO_PRESETS:
+        scenario = TrafficScenario.from_spec({'preset': preset}, app.SCENARIO_LIMITS)
+        assert scenario.name == preset
+        assert scenario.total_seconds > 0
+
+
+def test_scenario_position_ramps_from_base_load():
+    scenario = TrafficScenario.from_spec({'steps': [
+        {'traffic_level': 'high', 'ramp': 100, 'duration': 50},
+        {'cpu_percent': 40, 'duration': 50}
+    ]}, LIMITS)
+
+    assert scenario.position(0)['cpu_percent'] == 15.0
+    assert scenario.position(50)['cpu_percent'] == pytest.approx(60.0)
+    assert scenario.position(120)['cpu_percent'] == 105.0
+    assert scenario.position(160)['step'] == 1
+    finished = scenario.position(200)
+    assert finished['finished'] and finished['cpu_percent'] == 40.0
+
+
+def test_scenario_round_trips_through_json():
+    scenario = TrafficScenario.from_spec({'preset': 'spike'}, LIMITS)
+    restored = TrafficScenario.from_spec(json.loads(scenario.to_json()), LIMITS)
+    assert restored.to_json() == scenario.to_json()
+
+
+@pytest.mark.parametrize('started_at', [math.nan, math.inf, -1.0, 1_000_000 + 3601])
+def test_scenario_start_time_rejects_invalid_values(started_at):
+    with pytest.raises(ValueError):
+        scenario_start_time(started_at, 3600, now=1_000_000)
+
+
+def test_scenario_endpoint_returns_400_for_invalid_input(app):
+    client = app.app.test_client()
+
+    response = client.post('/api/simulation-scenario', json={'preset': 'bogus'})
+    assert response.status_code == 400
+    assert response.get_json()['available_presets'] == sorted(SCENARIO_PRESETS)
+
+    response = client.post('/api/simulation-scenario', data='{"preset": "spike", "start_delay": NaN}',
+                           content_type='application/json')
+    assert response.status_code == 400
+    assert app.scenario_runner is None
+
+
+@pytest.mark.parametrize('total, rps', [(None, None), (0, None), (-5, None), ('nan', None), (None, -1)])
+def test_cluster_load_target_rejects_invalid_demand(app, total, rps):
+    with pytest.raises(ValueError):
+        app.cluster_load_target_from(total, rps)
+
+
+def test_cluster_load_target_converts_virtual_rps(app):
+    target = app.cluster_load_target_from(virtual_rps=100)
+    assert target == {'total_millicores': 100 * app.CLUSTER_LOAD_MILLICORES_PER_RPS, 'virtual_rps': 100.0}
+
+
+def test_cluster_load_endpoint_returns_400_for_invalid_input(app):
+    response = app.app.test_client().post('/api/simulate-cluster-load', json={'total_millicores': 'many'})
+    assert response.status_code == 400
+    assert app.cluster_load_target is None
+
+
+def test_batch_request_validation(app):
+    requested, fields, error = app.parse_batch_request({'symbols': '005930, 000660,005930'})
+    assert error is None
+    assert requested == ['005930', '000660']
+    assert fields == app.BATCH_FIELDS
+
+    assert app.parse_batch_request({})[2] == {'error': 'symbols query parameter is required'}
+    too_many = ','.join(str(index) for index in range(app.BATCH_MAX_SYMBOLS + 1))
+    assert 'Too many symbols' in app.parse_batch_request({'symbols': too_many})[2]['error']
+    error = app.parse_batch_request({'symbols': '005930', 'fields': 'price,bogus'})[2]
+    assert error['error'] == 'Unknown fields: bogus'
+
+
+def test_batch_endpoint_returns_400_for_unknown_fields(app):
+    response = app.app.test_client().get('/api/stock-prices?symbols=005930&fields=bogus')
+    assert response.status_code == 400
+
+
+def test_level_targets_ignore_malformed_items(app):
+    targets = app._parse_load_targets('low=30, high=abc, broken, extreme=150')
+    assert targets['low'] == 30.0
+    assert targets['high'] == 105.0
+    assert targets['extreme'] == 150.0
+    assert app._parse_memory_targets('medium=x')['medium'] == 35.0
+
+
+def test_configmap_values_are_validated(app):
+    scenario = TrafficScenario.from_spec({'preset': 'spike'}, app.SCENARIO_LIMITS)
+    state = app._strings_to_state({
+        'generation': 'seven',
+        'requested_at': 'nan',
+        'scenario': scenario.to_json(),
+        'scenario_started_at': 'nan',
+        'cluster_total_millicores': 'inf'
+    })
+    assert state['generation'] == 0
+    assert state['requested_at'] == 0.0
+    assert state['scenario'] is None and state['scenario_started_at'] is None
+    assert state['cluster_load'] is None
+
+    state = app._strings_to_state({
+        'scenario': scenario.to_json(),
+        'scenario_started_at': repr(time.time()),
+        'cluster_total_millicores': '300.0',
+        'cluster_virtual_rps': ''
+    })
+    assert state['scenario'].to_json() == scenario.to_json()
+    assert state['cluster_load'] == {'total_millicores': 300.0, 'virtual_rps': None}
@@ -77,13 +77,26 @@ app.post('/api/simulate-traffic', async (req, res) => {
 app.get('/api/stock-data', async (req, res) => {
     try {
         const backendUrl = process.env.BACKEND_URL || 'http://backend-service:8081';
+        const headers = {
+            'Content-Type': 'application/json'
+        };
+        // 백엔드 ETag 재검증 - 스냅샷이 그대로면 304로 본문 전송 생략
+        if (req.headers['if-none-match']) {
+            headers['If-None-Match'] = req.headers['if-none-match'];
+        }
         const response = await axios.get(`${backendUrl}/api/stock-data`, {
             timeout: 10000,
-            headers: {
-                'Content-Type': 'application/json'
-            }
+            headers,
+            validateStatus: status => (status >= 200 && status < 300) || status === 304
         });
-        
+
+        if (response.headers.etag) {
+            res.set('ETag', response.headers.etag.replace(/-gz"$/, '"'));
+            res.set('Cache-Control', 'no-cache');
+        }
+        if (response.status === 304) {
+            return res.status(304).end();
+        }
         res.json(response.data);
     } catch (error) {
         console.error('주식 데이터 조회 오류:', error.message);
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# 오픈 루프 HTTP 부하 드라이버
+# - 시나리오 파일의 단계(stage)별 고정 도착률로 백엔드 API에 실제 HTTP 요청을 보냄
+# - 응답 지연을 "예정된 전송 시각" 기준으로 기록하여 coordinated omission을 보정
+# - 결과(p50/p99/p999, 달성 처리량)를 JSON으로 출력
+#
+# 사용 예:
+#   python scripts/load_driver.py scripts/scenarios/stock-mix.json --target http://localhost:8081
+#   python scripts/load_driver.py scripts/scenarios/stock-mix.json --output result.json
+#
+# 발사 시각은 asyncio로 예약하고 요청은 requests 세션(스레드 풀)으로 전송
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+DEFAULT_SYMBOLS = ['005930', '000660', '005380', '035420', '035720', '105560']
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    """HDR 방식의 로그-선형 버킷 히스토그램 (마이크로초 단위, 유효숫자 약 3자리)
+
+    값의 크기 구간(2의 거듭제곱)마다 같은 개수의 하위 버킷을 두어
+    1us ~ 수십 초 범위를 일정한 상대 오차로 기록한다.
+    """
+    SUB_BUCKET_BITS = 11   # 2048개 하위 버킷 → 상대 오차 0.1% 미만
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.min_value = None
+        self.max_value = 0
+        self._sum = 0
+
+    def _index(self, value):
+        shift = max(value.bit_length() - self.SUB_BUCKET_BITS, 0)
+        return (shift << (self.SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    def _highest_equivalent(self, index):
+        half = 1 << (self.SUB_BUCKET_BITS - 1)
+        if index < (half << 1):
+            return index
+        shift = index // half - 1
+        sub = index - shift * half
+        return ((sub + 1) << shift) - 1
+
+    def record(self, value_us, count=1):
+        value_us = max(int(value_us), 0)
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+        self._sum += value_us * count
+        self.max_value = max(self.max_value, value_us)
+        self.min_value = value_us if self.min_value is None else min(self.min_value, value_us)
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self._sum += other._sum
+        self.max_value = max(self.max_value, other.max_value)
+        if other.min_value is not None:
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+
+    def percentile(self, percent):
+        if self.total == 0:
+            return 0
+        rank = max(math.ceil(self.total * percent / 100.0), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max_value)
+        return self.max_value
+
+    def mean(self):
+        return self._sum / self.total if self.total else 0.0
+
+    def summary(self):
+        """밀리초 단위 요약"""
+        result = {
+            'count': self.total,
+            'min_ms': round((self.min_value or 0) / 1000, 3),
+            'mean_ms': round(self.mean() / 1000, 3),
+            'max_ms': round(self.max_value / 1000, 3)
+        }
+        for percent in REPORT_PERCENTILES:
+            key = 'p' + str(percent).replace('.', '')
+            result[f'{key}_ms'] = round(self.percentile(percent) / 1000, 3)
+        return result
+
+
+class EndpointStats:
+    """요청 종류별 집계 - corrected: 예정 시각 기준, service: 실제 전송 시각 기준"""
+    def __init__(self):
+        self.corrected = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.status_counts = {}
+        self.errors = 0
+
+    def record(self, intended, sent, finished, status):
+        self.corrected.record((finished - intended) * 1_000_000)
+        self.service.record((finished - sent) * 1_000_000)
+        key = str(status) if status else 'error'
+        self.status_counts[key] = self.status_counts.get(key, 0) + 1
+        if not status or status >= 500:
+            self.errors += 1
+
+    def merge(self, other):
+        self.corrected.merge(other.corrected)
+        self.service.merge(other.service)
+        for key, count in other.status_counts.items():
+            self.status_counts[key] = self.status_counts.get(key, 0) + count
+        self.errors += other.errors
+
+    def summary(self, elapsed):
+        return {
+            'requests': self.corrected.total,
+            'errors': self.errors,
+            'status_counts': self.status_counts,
+            'throughput_rps': round(self.corrected.total / elapsed, 2) if elapsed > 0 else 0.0,
+            'latency': self.corrected.summary(),
+            'service_time': self.service.summary()
+        }
+
+
+class HttpClient:
+    """requests 기반 HTTP 클라이언트 - 스레드마다 keep-alive 세션 하나 (동시 연결 수 = 스레드 수)"""
+    def __init__(self, target, max_connections, timeout):
+        self.base_url = target.rstrip('/')
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix='load-driver')
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers['Accept'] = 'application/json'
+        return session
+
+    def _get(self, path):
+        sent = time.perf_counter()
+        try:
+            response = self._session().get(self.base_url + path, timeout=self.timeout)
+            return response.status_code, sent
+        except requests.RequestException:
+            return None, sent
+
+    async def get(self, path):
+        """(status, 전송 시각) 반환 - 빈 연결(스레드)을 기다린 시간은 전송 시각 이전에 포함됨"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self._get, path)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def load_scenario(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        scenario = json.load(f)
+    if not scenario.get('stages'):
+        raise ValueError('시나리오에 stages가 없습니다')
+    if not scenario.get('mix'):
+        raise ValueError('시나리오에 mix가 없습니다')
+    return scenario
+
+
+def build_request_picker(scenario, rng):
+    """mix의 가중치에 따라 (이름, 경로)를 고르는 함수 생성"""
+    symbols = scenario.get('symbols') or DEFAULT_SYMBOLS
+    names = [entry['path'] for entry in scenario['mix']]
+    weights = [float(entry.get('weight', 1)) for entry in scenario['mix']]
+
+    def pick():
+        name = rng.choices(names, weights)[0]
+        return name, name.replace('{symbol}', rng.choice(symbols))
+
+    return pick
+
+
+async def run_scenario(scenario, target, seed=None):
+    rng = random.Random(seed)
+    pick = build_request_picker(scenario, rng)
+    client = HttpClient(
+        target,
+        max_connections=int(scenario.get('connections', 64)),
+        timeout=float(scenario.get('timeout', 10))
+    )
+    stats = {}
+    stage_reports = []
+    pending = set()
+
+    async def fire(name, path, intended):
+        status, sent = await client.get(path)
+        stats.setdefault(name, EndpointStats()).record(intended, sent, time.perf_counter(), status)
+
+    run_start = time.perf_counter()
+    for stage in scenario['stages']:
+        rate = float(stage['rate'])
+        duration = float(stage['duration'])
+        interval = 1.0 / rate if rate > 0 else duration
+        stage_start = time.perf_counter()
+        scheduled = 0
+        late_sends = 0
+
+        # 오픈 루프: 응답을 기다리지 않고 예정 시각마다 요청을 발사
+        # (이벤트 루프가 밀려도 예정 시각은 유지되므로 지연은 latency에 반영됨)
+        while rate > 0:
+            intended = stage_start + scheduled * interval
+            if intended - stage_start >= duration:
+                break
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -interval:
+                late_sends += 1
+            name, path = pick()
+            task = asyncio.ensure_future(fire(name, path, intended))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            scheduled += 1
+
+        remaining = stage_start + duration - time.perf_counter()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        stage_reports.append({
+            'name': stage.get('name', f"stage-{len(stage_reports) + 1}"),
+            'target_rate_rps': rate,
+            'duration_seconds': duration,
+            'scheduled_requests': scheduled,
+            'late_sends': late_sends
+        })
+
+    if pending:
+        await asyncio.wait(pending)
+    elapsed = time.perf_counter() - run_start
+    client.close()
+
+    overall = EndpointStats()
+    for endpoint_stats in stats.values():
+        overall.merge(endpoint_stats)
+
+    return {
+        'scenario': scenario.get('name', 'unnamed'),
+        'target': target,
+        'started_at': datetime.now().isoformat(),
+        'elapsed_seconds': round(elapsed, 3),
+        'latency_basis': 'intended_send_time',
+        'stages': stage_reports,
+        'overall': overall.summary(elapsed),
+        'endpoints': {name: endpoint_stats.summary(elapsed) for name, endpoint_stats in sorted(stats.items())}
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='open-loop HTTP load driver for the stock backend')
+    parser.add_argument('scenario', help='시나리오 JSON 파일 경로')
+    parser.add_argument('--target', help='대상 URL (시나리오의 target보다 우선)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (기본: 표준 출력)')
+    parser.add_argument('--seed', type=int, help='요청 mix 난수 시드')
+    args = parser.parse_args(argv)
+
+    scenario = load_scenario(args.scenario)
+    target = args.target or scenario.get('target', 'http://localhost:8081')
+    result = asyncio.run(run_scenario(scenario, target, seed=args.seed))
+
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+        overall = result['overall']
+        print(f"완료: {overall['requests']}건, {overall['throughput_rps']} rps, "
+              f"p99 {overall['latency']['p99_ms']}ms → {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()